@@ -23,6 +23,7 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "pandas>=2.0.0",
+        "numpy>=1.24.0",
         "openpyxl>=3.1.0",
         "pyyaml>=6.0",
         "ortools>=9.7.0",
@@ -31,6 +32,9 @@ setup(
         "jsonschema>=4.19.0",
     ],
     extras_require={
+        "relaxation": [
+            "scipy>=1.10.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
@@ -1,7 +1,10 @@
 """Package d'analyse des solutions PyCalendar"""
 
 from .penalty_breakdown import calculate_penalty_breakdown
+from .feasibility import analyser_faisabilite, RapportFaisabilite
 
 __all__ = [
-    'calculate_penalty_breakdown'
+    'calculate_penalty_breakdown',
+    'analyser_faisabilite',
+    'RapportFaisabilite',
 ]
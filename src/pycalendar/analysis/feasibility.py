@@ -0,0 +1,310 @@
+"""
+Analyse de faisabilité avant résolution.
+Détecte les matchs sans créneau, les équipes, semaines et gymnases goulots,
+et borne le nombre de matchs planifiables (flot maximal matchs → créneaux).
+"""
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
+from ..core.models import Match, Creneau, Gymnase
+
+
+@dataclass
+class RapportFaisabilite:
+    """
+    Résultat de l'analyse de faisabilité.
+    
+    borne_superieure est un majorant du nombre de matchs planifiables : aucune
+    solution respectant les contraintes dures ne peut en planifier davantage.
+    """
+    nb_matchs: int
+    nb_creneaux: int
+    capacite_totale: int
+    creneaux_par_match: List[int]  # Nombre de créneaux faisables de chaque match
+    matchs_sans_creneau: List[Match]
+    borne_flot: int  # Flot maximal matchs → créneaux (capacités des créneaux)
+    borne_superieure: int  # Borne du flot resserrée par la capacité hebdomadaire des équipes
+    goulots_equipes: List[Dict[str, Any]] = field(default_factory=list)
+    goulots_semaines: List[Dict[str, Any]] = field(default_factory=list)
+    goulots_gymnases: List[Dict[str, Any]] = field(default_factory=list)
+    temps_secondes: float = 0.0
+    
+    @property
+    def nb_non_planifiables_min(self) -> int:
+        """Nombre minimal de matchs qui resteront non planifiés."""
+        return self.nb_matchs - self.borne_superieure
+    
+    @property
+    def est_complet(self) -> bool:
+        """True si la borne n'exclut pas un calendrier complet."""
+        return self.borne_superieure >= self.nb_matchs
+    
+    def to_dict(self) -> dict:
+        """Format JSON (metadata de la solution)."""
+        return {
+            'nb_matchs': self.nb_matchs,
+            'nb_creneaux': self.nb_creneaux,
+            'capacite_totale': self.capacite_totale,
+            'matchs_sans_creneau': [
+                f"{m.equipe1.nom_complet} vs {m.equipe2.nom_complet} ({m.poule})" for m in self.matchs_sans_creneau
+            ],
+            'borne_flot': self.borne_flot,
+            'borne_superieure': self.borne_superieure,
+            'goulots_equipes': self.goulots_equipes,
+            'goulots_semaines': self.goulots_semaines,
+            'goulots_gymnases': self.goulots_gymnases,
+            'temps_secondes': self.temps_secondes,
+        }
+    
+    def afficher(self, nb_max: int = 5):
+        """
+        Affiche le rapport : borne, matchs sans créneau et goulots classés.
+        
+        Args:
+            nb_max: Nombre maximum de lignes par classement
+        """
+        print(f"🔎 Analyse de faisabilité ({self.temps_secondes:.2f}s): "
+              f"{self.nb_matchs} matchs, {self.nb_creneaux} créneaux, capacité {self.capacite_totale}")
+        if self.creneaux_par_match:
+            print(f"   Créneaux faisables par match: min {min(self.creneaux_par_match)}, "
+                  f"médiane {sorted(self.creneaux_par_match)[len(self.creneaux_par_match) // 2]}")
+        statut = "✓" if self.est_complet else "⚠️ "
+        print(f"   {statut} Borne supérieure: {self.borne_superieure}/{self.nb_matchs} matchs planifiables "
+              f"(flot maximal: {self.borne_flot})")
+        
+        if self.matchs_sans_creneau:
+            print(f"   ❌ {len(self.matchs_sans_creneau)} match(s) sans aucun créneau faisable:")
+            for match in self.matchs_sans_creneau[:nb_max]:
+                print(f"      - {match.equipe1.nom_complet} vs {match.equipe2.nom_complet} ({match.poule})")
+            if len(self.matchs_sans_creneau) > nb_max:
+                print(f"      ... ({len(self.matchs_sans_creneau) - nb_max} autres)")
+        
+        if self.goulots_equipes:
+            print(f"   Équipes goulots (matchs / capacité sur leurs semaines disponibles):")
+            for g in self.goulots_equipes[:nb_max]:
+                print(f"      - {g['equipe']}: {g['matchs']} matchs, {g['semaines_requises']} semaine(s) requise(s), "
+                      f"{g['semaines_disponibles']} disponible(s), capacité {g['capacite']}"
+                      + (f" → {g['deficit']} match(s) impossible(s)" if g['deficit'] else ""))
+        
+        for titre, goulots, cle in (("Semaines les plus demandées", self.goulots_semaines, 'semaine'),
+                                    ("Gymnases les plus demandés", self.goulots_gymnases, 'gymnase')):
+            if goulots:
+                print(f"   {titre} (demande attendue / capacité):")
+                for g in goulots[:nb_max]:
+                    print(f"      - {g[cle]}: {g['demande']:.1f} / {g['capacite']} ({g['taux']:.0%})")
+        print()
+
+
+def _flot_maximal(creneaux_par_match: List[List[int]], capacites: Dict[int, int]) -> int:
+    """
+    Flot maximal matchs → créneaux (chaque match 1, chaque créneau sa capacité).
+    
+    Affectation gloutonne des matchs les plus contraints d'abord, puis chemins
+    augmentants (parcours en largeur sur le graphe résiduel) pour les matchs restants.
+    
+    Args:
+        creneaux_par_match: Créneaux faisables de chaque match
+        capacites: Capacité de chaque créneau
+    
+    Returns:
+        Nombre maximal de matchs affectables
+    """
+    residuel = dict(capacites)
+    creneau_du_match = [None] * len(creneaux_par_match)
+    matchs_du_creneau = {j: [] for j in capacites}
+    
+    ordre = sorted(range(len(creneaux_par_match)), key=lambda i: len(creneaux_par_match[i]))
+    for i in ordre:
+        for j in creneaux_par_match[i]:
+            if residuel[j] > 0:
+                residuel[j] -= 1
+                creneau_du_match[i] = j
+                matchs_du_creneau[j].append(i)
+                break
+    
+    for depart in ordre:
+        if creneau_du_match[depart] is not None or not creneaux_par_match[depart]:
+            continue
+        
+        # Parcours alterné : match → créneau faisable → match déjà placé sur ce créneau → ...
+        precedent = {}  # créneau → match qui l'atteint
+        file = deque([depart])
+        visites = {depart}
+        arrivee = None
+        while file and arrivee is None:
+            i = file.popleft()
+            for j in creneaux_par_match[i]:
+                if j in precedent:
+                    continue
+                precedent[j] = i
+                if residuel[j] > 0:
+                    arrivee = j
+                    break
+                for k in matchs_du_creneau[j]:
+                    if k not in visites:
+                        visites.add(k)
+                        file.append(k)
+        
+        if arrivee is None:
+            continue
+        
+        # Augmentation le long du chemin (chaque match passe sur le créneau atteint)
+        residuel[arrivee] -= 1
+        j = arrivee
+        while True:
+            i = precedent[j]
+            ancien = creneau_du_match[i]
+            creneau_du_match[i] = j
+            matchs_du_creneau[j].append(i)
+            if ancien is None:
+                break
+            matchs_du_creneau[ancien].remove(i)
+            j = ancien
+    
+    return sum(1 for j in creneau_du_match if j is not None)
+
+
+def analyser_faisabilite(matchs: List[Match], creneaux: List[Creneau], gymnases: Dict[str, Gymnase],
+                         obligations_presence: Optional[Dict[str, str]] = None,
+                         matchs_fixes: Optional[List[Match]] = None,
+                         max_matchs_par_semaine: int = 1, semaine_min: int = 1) -> RapportFaisabilite:
+    """
+    Analyse rapide de faisabilité, avant toute résolution.
+    
+    Les créneaux faisables d'un match sont ceux de calculer_creneaux_possibles (gymnase
+    ouvert, équipes disponibles, obligations de présence) ayant une capacité restante
+    après les matchs fixés. La borne supérieure est le flot maximal matchs → créneaux,
+    resserrée par la capacité hebdomadaire de chaque équipe : une équipe ne joue pas
+    plus de max_matchs_par_semaine matchs par semaine ni deux fois au même horaire.
+    
+    Args:
+        matchs: Matchs à planifier
+        creneaux: Créneaux disponibles
+        gymnases: Dictionnaire des gymnases
+        obligations_presence: Institution requise par gymnase
+        matchs_fixes: Matchs déjà planifiés/fixés
+        max_matchs_par_semaine: Max matchs par équipe par semaine
+        semaine_min: Première semaine planifiable
+    
+    Returns:
+        RapportFaisabilite (goulots classés du plus au moins critique)
+    """
+    # Import local : l'orchestrateur importe ce module
+    from ..orchestrator.decomposition import calculer_creneaux_possibles
+    
+    debut = time.perf_counter()
+    
+    # Un créneau par (semaine, horaire, gymnase), capacité réduite des matchs fixés
+    fixes_par_creneau = {}
+    fixes_par_equipe_semaine = {}
+    for match_fixe in matchs_fixes or []:
+        meta = match_fixe.metadata or {}
+        if 'semaine' not in meta:
+            continue
+        cle = (meta['semaine'], str(meta['horaire']).strip(), str(meta['gymnase']).strip())
+        fixes_par_creneau[cle] = fixes_par_creneau.get(cle, 0) + 1
+        for equipe in (match_fixe.equipe1, match_fixe.equipe2):
+            cle_equipe = (equipe.id_unique, meta['semaine'])
+            fixes_par_equipe_semaine[cle_equipe] = fixes_par_equipe_semaine.get(cle_equipe, 0) + 1
+    
+    table = {}
+    for creneau in creneaux:
+        table.setdefault((creneau.semaine, creneau.horaire, creneau.gymnase), creneau)
+    creneaux_physiques = list(table.values())
+    
+    capacites = {}
+    for j, creneau in enumerate(creneaux_physiques):
+        gymnase = gymnases.get(creneau.gymnase)
+        if not gymnase:
+            # Gymnase inconnu : aucune contrainte de capacité, comme dans le modèle CP-SAT
+            capacites[j] = len(matchs)
+            continue
+        capacite = gymnase.get_capacite_disponible(creneau.semaine, creneau.horaire)
+        cle = (creneau.semaine, creneau.horaire.strip(), creneau.gymnase.strip())
+        capacites[j] = max(0, capacite - fixes_par_creneau.get(cle, 0))
+    
+    creneaux_par_match = [
+        [j for j in indices if capacites[j] > 0]
+        for indices in calculer_creneaux_possibles(matchs, creneaux_physiques, gymnases,
+                                                   obligations_presence or {}, semaine_min)
+    ]
+    capacites = {j: c for j, c in capacites.items() if c > 0 and creneaux_physiques[j].semaine >= semaine_min}
+    
+    borne_flot = _flot_maximal(creneaux_par_match, capacites)
+    
+    # Équipes : capacité = somme, sur les semaines où l'un de ses matchs est faisable, de
+    # min(matchs encore autorisés dans la semaine, horaires distincts faisables)
+    matchs_par_equipe = {}
+    for i, match in enumerate(matchs):
+        for equipe in (match.equipe1, match.equipe2):
+            matchs_par_equipe.setdefault(equipe.id_unique, (equipe, []))[1].append(i)
+    
+    goulots_equipes = []
+    for equipe_id, (equipe, indices) in matchs_par_equipe.items():
+        horaires_par_semaine = {}
+        for i in indices:
+            for j in creneaux_par_match[i]:
+                creneau = creneaux_physiques[j]
+                horaires_par_semaine.setdefault(creneau.semaine, set()).add(creneau.horaire)
+        capacite = sum(
+            min(max(0, max_matchs_par_semaine - fixes_par_equipe_semaine.get((equipe_id, semaine), 0)), len(horaires))
+            for semaine, horaires in horaires_par_semaine.items()
+        )
+        goulots_equipes.append({
+            'equipe': equipe.nom_complet,
+            'matchs': len(indices),
+            'semaines_requises': math.ceil(len(indices) / max(1, max_matchs_par_semaine)),
+            'semaines_disponibles': len(horaires_par_semaine),
+            'capacite': capacite,
+            'deficit': max(0, len(indices) - capacite),
+            'marge': capacite - len(indices),
+        })
+    goulots_equipes.sort(key=lambda g: (g['marge'], -g['matchs']))
+    goulots_equipes = [g for g in goulots_equipes if g['marge'] <= 1]
+    
+    # Un match non planifié compte dans le déficit d'au plus deux équipes
+    deficits = [g['deficit'] for g in goulots_equipes]
+    non_planifiables_equipes = max(max(deficits, default=0), math.ceil(sum(deficits) / 2))
+    borne_superieure = min(borne_flot, len(matchs) - non_planifiables_equipes)
+    
+    # Semaines et gymnases : demande attendue = part des créneaux faisables de chaque match
+    # tombant dans la semaine / le gymnase, comparée à la capacité
+    demande_semaine, demande_gymnase = {}, {}
+    for indices in creneaux_par_match:
+        if not indices:
+            continue
+        part = 1.0 / len(indices)
+        for j in indices:
+            creneau = creneaux_physiques[j]
+            demande_semaine[creneau.semaine] = demande_semaine.get(creneau.semaine, 0.0) + part
+            demande_gymnase[creneau.gymnase] = demande_gymnase.get(creneau.gymnase, 0.0) + part
+    capacite_semaine, capacite_gymnase = {}, {}
+    for j, capacite in capacites.items():
+        creneau = creneaux_physiques[j]
+        capacite_semaine[creneau.semaine] = capacite_semaine.get(creneau.semaine, 0) + capacite
+        capacite_gymnase[creneau.gymnase] = capacite_gymnase.get(creneau.gymnase, 0) + capacite
+    
+    def classer(demandes, capacites_groupe, cle):
+        goulots = [
+            {cle: nom, 'demande': demande, 'capacite': capacites_groupe[nom],
+             'taux': demande / capacites_groupe[nom]}
+            for nom, demande in demandes.items()
+        ]
+        return sorted(goulots, key=lambda g: g['taux'], reverse=True)
+    
+    return RapportFaisabilite(
+        nb_matchs=len(matchs),
+        nb_creneaux=len(capacites),
+        capacite_totale=sum(capacites.values()),
+        creneaux_par_match=[len(indices) for indices in creneaux_par_match],
+        matchs_sans_creneau=[matchs[i] for i, indices in enumerate(creneaux_par_match) if not indices],
+        borne_flot=borne_flot,
+        borne_superieure=borne_superieure,
+        goulots_equipes=goulots_equipes,
+        goulots_semaines=classer(demande_semaine, capacite_semaine, 'semaine'),
+        goulots_gymnases=classer(demande_gymnase, capacite_gymnase, 'gymnase'),
+        temps_secondes=time.perf_counter() - debut,
+    )
@@ -101,6 +101,68 @@ class Config:
     # Solution format
     solution_format: str = "v2.0"  # Format de sauvegarde: 'v1.0' ou 'v2.0' (défaut: 'v2.0')
     
+    # Règles d'arrêt anticipé de CP-SAT (0 / None = désactivée)
+    cpsat_arret_stagnation_secondes: float = 0.0  # Arrêt si aucune amélioration pendant N secondes
+    cpsat_arret_gap_relatif: float = 0.0  # Arrêt si |borne - objectif| / |objectif| <= gap
+    cpsat_arret_objectif_cible: Optional[float] = None  # Arrêt dès que l'objectif atteint cette valeur
+    
+    # Amorce gloutonne : solution du glouton transmise à CP-SAT comme indication
+    cpsat_amorce_glouton: bool = False
+    cpsat_amorce_glouton_essais: int = 1  # Essais gloutons (en parallèle, graines différentes), le meilleur est retenu
+    cpsat_amorce_glouton_mesure: bool = False  # Mesure le temps de première solution sans amorce (gain)
+    
+    # Cache des modèles CP-SAT construits (rechargés si entrées et poids inchangés)
+    cpsat_cache_modeles: bool = False
+    cpsat_cache_dossier: str = "cache/modeles_cpsat"  # Répertoire des modèles en cache
+    cpsat_cache_taille_max_mo: float = 200.0  # Taille max du cache (Mo), éviction LRU
+    
+    # Borne supérieure de l'objectif (relaxation d'affectation, SciPy optionnel) et gap de la solution
+    cpsat_borne_relaxation: bool = False
+    
+    # Parallélisme CP-SAT : workers et portfolio de processus indépendants (graines et profils différents)
+    cpsat_nb_workers: int = 0  # Workers d'une résolution (0 = nombre de cœurs, au plus 8)
+    cpsat_portfolio_actif: bool = False
+    cpsat_portfolio_processus: int = 0  # Nombre de processus (0 = cœurs / 8, au moins 2) ; les cœurs sont répartis
+    cpsat_portfolio_profils: List[str] = field(default_factory=lambda: ['defaut', 'lineaire', 'lns_seul', 'pseudo_cout'])
+    cpsat_portfolio_manches: int = 2  # Manches : la meilleure solution est transmise en indication à la suivante
+    cpsat_portfolio_graine: int = 0  # Graine du premier processus (les suivantes sont incrémentées)
+    
+    # Pool de solutions : K meilleures affectations distinctes vues pendant la recherche, exportées en variantes
+    cpsat_pool_taille: int = 0  # K (0 ou 1 = solution finale seule)
+    cpsat_pool_distance_min: int = 10  # Nombre minimal de matchs placés différemment entre deux variantes
+    
+    # Suivi d'une résolution longue : journal JSONL de progression et instantanés de la meilleure solution
+    cpsat_journal_progression: str = ""  # Fichier JSONL (une ligne par solution trouvée ; vide = désactivé)
+    cpsat_snapshot_secondes: float = 0.0  # Intervalle entre deux instantanés via SolutionStore (0 = désactivé)
+    
+    # Essais gloutons : répartis sur un pool de processus, reproductibles avec une graine maîtresse
+    greedy_nb_processus: int = 1  # Processus parallèles (1 = essais séquentiels, 0 = nombre de CPU)
+    greedy_graine: Optional[int] = None  # Graine maîtresse des essais (None = non reproductible)
+    greedy_ordre: str = "aleatoire"  # Ordre des matchs : "aleatoire", "contraint" (moins de candidats d'abord) ou "dynamique"
+    
+    # Décomposition en sous-problèmes indépendants (composantes connexes)
+    decomposition_actif: bool = False  # Résoudre séparément les groupes de matchs sans équipe ni créneau commun
+    decomposition_nb_processus: int = 0  # Nombre de processus parallèles (0 = nombre de CPU)
+    
+    # Analyse de faisabilité avant résolution (matchs sans créneau, goulots, borne de flot maximal)
+    analyse_faisabilite_actif: bool = False
+    analyse_faisabilite_bloquante: bool = False  # Arrêt avant résolution si la borne exclut un calendrier complet
+    
+    # Horizon glissant (stratégie "horizon") : fenêtres de semaines résolues successivement
+    horizon_semaines_fenetre: int = 4  # Nombre de semaines par fenêtre
+    horizon_semaines_chevauchement: int = 1  # Semaines replanifiables par la fenêtre suivante
+    
+    # Large Neighbourhood Search (stratégie "lns") : sous-modèles CP-SAT sur des voisinages
+    lns_temps_voisinage: float = 2.0  # Temps max (s) par sous-modèle
+    lns_taille_voisinage_max: int = 60  # Nombre max de matchs libérés par voisinage
+    lns_reaction: float = 0.2  # Vitesse d'adaptation des poids des voisinages (0-1)
+    
+    # Replanification incrémentale (stratégie "incremental") : perturbation minimale de la solution précédente
+    incremental_fichier_modifications: Optional[str] = None  # Modifications JSON exportées par l'interface
+    incremental_semaines_voisinage: int = 1  # Matchs des équipes en conflit libérés à ± N semaines
+    incremental_poids_deplacement: float = 500.0  # Pénalité par match déplacé hors de son créneau précédent
+    incremental_temps_max_secondes: int = 10  # Temps max de la replanification
+    
     # Additional parameters
     extra: Dict[str, Any] = field(default_factory=dict)
     
@@ -177,10 +239,17 @@ class Config:
             config_dict['fallback_greedy'] = p['fallback_greedy']
             config_dict['taille_poule_min'] = p['taille_poule_min']
             config_dict['taille_poule_max'] = p['taille_poule_max']
+            config_dict['decomposition_actif'] = p.get('decomposition_actif', False)
+            config_dict['decomposition_nb_processus'] = p.get('decomposition_nb_processus', 0)
+            config_dict['analyse_faisabilite_actif'] = p.get('analyse_faisabilite_actif', False)
+            config_dict['analyse_faisabilite_bloquante'] = p.get('analyse_faisabilite_bloquante', False)
         
         # Solver parameters
         if 'greedy' in merged_data:
             config_dict['nb_essais'] = merged_data['greedy']['nb_essais']
+            config_dict['greedy_nb_processus'] = merged_data['greedy'].get('nb_processus', 1)
+            config_dict['greedy_graine'] = merged_data['greedy'].get('graine')
+            config_dict['greedy_ordre'] = merged_data['greedy'].get('ordre', 'aleatoire')
         
         if 'cpsat' in merged_data:
             c = merged_data['cpsat']
@@ -189,6 +258,44 @@ class Config:
             config_dict['niveau_log'] = c['niveau_log']
             config_dict['cpsat_warm_start'] = c.get('warm_start', True)  # Par défaut True
             config_dict['cpsat_warm_start_file'] = c.get('warm_start_file', 'default')  # Par défaut "default"
+            config_dict['cpsat_arret_stagnation_secondes'] = c.get('arret_stagnation_secondes', 0.0)
+            config_dict['cpsat_arret_gap_relatif'] = c.get('arret_gap_relatif', 0.0)
+            config_dict['cpsat_arret_objectif_cible'] = c.get('arret_objectif_cible')
+            config_dict['cpsat_amorce_glouton'] = c.get('amorce_glouton', False)
+            config_dict['cpsat_amorce_glouton_essais'] = c.get('amorce_glouton_essais', 1)
+            config_dict['cpsat_amorce_glouton_mesure'] = c.get('amorce_glouton_mesure', False)
+            config_dict['cpsat_cache_modeles'] = c.get('cache_modeles', False)
+            config_dict['cpsat_cache_dossier'] = c.get('cache_dossier', "cache/modeles_cpsat")
+            config_dict['cpsat_cache_taille_max_mo'] = c.get('cache_taille_max_mo', 200.0)
+            config_dict['cpsat_borne_relaxation'] = c.get('borne_relaxation', False)
+            config_dict['cpsat_nb_workers'] = c.get('nb_workers', 0)
+            config_dict['cpsat_portfolio_actif'] = c.get('portfolio_actif', False)
+            config_dict['cpsat_portfolio_processus'] = c.get('portfolio_processus', 0)
+            config_dict['cpsat_portfolio_profils'] = c.get('portfolio_profils', ['defaut', 'lineaire', 'lns_seul', 'pseudo_cout'])
+            config_dict['cpsat_portfolio_manches'] = c.get('portfolio_manches', 2)
+            config_dict['cpsat_portfolio_graine'] = c.get('portfolio_graine', 0)
+            config_dict['cpsat_pool_taille'] = c.get('pool_taille', 0)
+            config_dict['cpsat_pool_distance_min'] = c.get('pool_distance_min', 10)
+            config_dict['cpsat_journal_progression'] = c.get('journal_progression', "")
+            config_dict['cpsat_snapshot_secondes'] = c.get('snapshot_secondes', 0.0)
+        
+        if 'horizon' in merged_data:
+            h = merged_data['horizon']
+            config_dict['horizon_semaines_fenetre'] = h.get('semaines_fenetre', 4)
+            config_dict['horizon_semaines_chevauchement'] = h.get('semaines_chevauchement', 1)
+        
+        if 'lns' in merged_data:
+            l = merged_data['lns']
+            config_dict['lns_temps_voisinage'] = l.get('temps_voisinage', 2.0)
+            config_dict['lns_taille_voisinage_max'] = l.get('taille_voisinage_max', 60)
+            config_dict['lns_reaction'] = l.get('reaction', 0.2)
+        
+        if 'incremental' in merged_data:
+            inc = merged_data['incremental']
+            config_dict['incremental_fichier_modifications'] = inc.get('fichier_modifications')
+            config_dict['incremental_semaines_voisinage'] = inc.get('semaines_voisinage', 1)
+            config_dict['incremental_poids_deplacement'] = inc.get('poids_deplacement', 500.0)
+            config_dict['incremental_temps_max_secondes'] = inc.get('temps_max_secondes', 10)
         
         # Constraints
         if 'contraintes' in merged_data:
@@ -285,14 +392,56 @@ class Config:
                 'fallback_greedy': self.fallback_greedy,
                 'taille_poule_min': self.taille_poule_min,
                 'taille_poule_max': self.taille_poule_max,
+                'decomposition_actif': self.decomposition_actif,
+                'decomposition_nb_processus': self.decomposition_nb_processus,
+                'analyse_faisabilite_actif': self.analyse_faisabilite_actif,
+                'analyse_faisabilite_bloquante': self.analyse_faisabilite_bloquante,
             },
             'greedy': {
                 'nb_essais': self.nb_essais,
+                'nb_processus': self.greedy_nb_processus,
+                'graine': self.greedy_graine,
+                'ordre': self.greedy_ordre,
             },
             'cpsat': {
                 'temps_max_secondes': self.temps_max_secondes,
                 'afficher_progression': self.afficher_progression,
                 'niveau_log': self.niveau_log,
+                'arret_stagnation_secondes': self.cpsat_arret_stagnation_secondes,
+                'arret_gap_relatif': self.cpsat_arret_gap_relatif,
+                'arret_objectif_cible': self.cpsat_arret_objectif_cible,
+                'amorce_glouton': self.cpsat_amorce_glouton,
+                'amorce_glouton_essais': self.cpsat_amorce_glouton_essais,
+                'amorce_glouton_mesure': self.cpsat_amorce_glouton_mesure,
+                'cache_modeles': self.cpsat_cache_modeles,
+                'cache_dossier': self.cpsat_cache_dossier,
+                'cache_taille_max_mo': self.cpsat_cache_taille_max_mo,
+                'borne_relaxation': self.cpsat_borne_relaxation,
+                'nb_workers': self.cpsat_nb_workers,
+                'portfolio_actif': self.cpsat_portfolio_actif,
+                'portfolio_processus': self.cpsat_portfolio_processus,
+                'portfolio_profils': self.cpsat_portfolio_profils,
+                'portfolio_manches': self.cpsat_portfolio_manches,
+                'portfolio_graine': self.cpsat_portfolio_graine,
+                'pool_taille': self.cpsat_pool_taille,
+                'pool_distance_min': self.cpsat_pool_distance_min,
+                'journal_progression': self.cpsat_journal_progression,
+                'snapshot_secondes': self.cpsat_snapshot_secondes,
+            },
+            'horizon': {
+                'semaines_fenetre': self.horizon_semaines_fenetre,
+                'semaines_chevauchement': self.horizon_semaines_chevauchement,
+            },
+            'lns': {
+                'temps_voisinage': self.lns_temps_voisinage,
+                'taille_voisinage_max': self.lns_taille_voisinage_max,
+                'reaction': self.lns_reaction,
+            },
+            'incremental': {
+                'fichier_modifications': self.incremental_fichier_modifications,
+                'semaines_voisinage': self.incremental_semaines_voisinage,
+                'poids_deplacement': self.incremental_poids_deplacement,
+                'temps_max_secondes': self.incremental_temps_max_secondes,
             },
             'contraintes': {
                 'poids_indisponibilite': self.poids_indisponibilite,
@@ -0,0 +1,357 @@
+"""Tables de pénalités souples partagées par les solveurs, la validation et l'interface."""
+
+import re
+import numpy as np
+from typing import List, Dict, Optional, Tuple
+from pycalendar.core.models import Match, Equipe
+from pycalendar.core.config import Config
+
+
+class PenaltyTables:
+    """
+    Pénalités souples factorisées par attribut de créneau.
+    
+    La plupart des pénalités d'un couple (match, créneau) ne dépendent que d'un seul
+    attribut du créneau :
+    - (match, horaire)  : préférences horaires
+    - (match, gymnase)  : préférences de gymnases, niveau des gymnases
+    - semaine           : compaction temporelle
+    
+    Chaque valeur est calculée une seule fois puis mémoïsée. Les clés portent sur les
+    attributs des équipes (et non sur les objets Match) : la table reste valide pour
+    des copies de matchs et est partagée entre les matchs ayant les mêmes préférences.
+    Les solveurs, le validateur et l'interface utilisent ainsi exactement les mêmes valeurs.
+    """
+    
+    def __init__(self, config: Config, niveaux_gymnases: Optional[Dict[str, str]] = None):
+        self.config = config
+        self.niveaux_gymnases = niveaux_gymnases or {}
+        self._minutes: Dict[str, int] = {}
+        self._penalites_horaires: Dict[Tuple, float] = {}
+        self._rangs_gymnases: Dict[Tuple, Dict[str, int]] = {}
+        self._penalites_gymnases: Dict[Tuple, float] = {}
+        self._niveaux_poules: Dict[str, Optional[int]] = {}
+        self._penalites_niveaux: Dict[Tuple, float] = {}
+        self._penalites_compaction: Dict[int, float] = {}
+    
+    def parse_horaire(self, horaire: str) -> int:
+        """
+        Convertit un horaire en minutes depuis minuit (mémoïsé).
+        Format: "14:00", "14H", "14H30", "20:00"
+        
+        Returns:
+            Nombre de minutes depuis minuit (14:00 si l'horaire est invalide)
+        """
+        minutes = self._minutes.get(horaire)
+        if minutes is None:
+            try:
+                # Nettoyer l'horaire
+                texte = horaire.strip().upper().replace('H', ':')
+                
+                # Ajouter ":00" si pas de minutes
+                if ':' not in texte:
+                    texte += ':00'
+                
+                parts = texte.split(':')
+                heures = int(parts[0])
+                minutes = heures * 60 + (int(parts[1]) if len(parts) > 1 and parts[1] else 0)
+            except (ValueError, IndexError, AttributeError):
+                print(f"ERREUR: Impossible de parser l'horaire '{horaire}'. Utilisation de 14:00 par défaut.")
+                minutes = 14 * 60
+            self._minutes[horaire] = minutes
+        return minutes
+    
+    def penalite_horaire(self, match: Match, horaire: str) -> float:
+        """
+        Pénalité des horaires préférés pour un match joué à un horaire donné.
+        
+        LOGIQUE DE TOLÉRANCE:
+        - Si l'horaire est exactement l'horaire préféré : pas de pénalité
+        - Si distance <= tolérance : PAS de pénalité (match accepté dans la zone de tolérance)
+        - Si distance > tolérance : pénalité calculée sur la distance TOTALE (pas seulement l'excédent)
+        
+        MULTIPLICATEURS selon le nombre d'équipes HORS tolérance jouant AVANT leur horaire préféré:
+        - 2 équipes : penalite_avant_horaire_min_deux (violation grave)
+        - 1 équipe : penalite_avant_horaire_min (violation moyenne)
+        - aucune : penalite_apres_horaire_min (dégradation acceptable)
+        
+        FORMULE: pénalité = Σ équipes hors tolérance multiplicateur × ((distance / diviseur)²)
+        
+        Args:
+            match: Le match
+            horaire: Horaire du créneau
+        
+        Returns:
+            Pénalité (float, 0 si aucune)
+        """
+        prefs = (self._horaire_prefere(match.equipe1), self._horaire_prefere(match.equipe2))
+        cle = (prefs, horaire)
+        penalite = self._penalites_horaires.get(cle)
+        if penalite is None:
+            penalite = self._calculer_penalite_horaire(prefs, horaire)
+            self._penalites_horaires[cle] = penalite
+        return penalite
+    
+    def _horaire_prefere(self, equipe: Equipe) -> Optional[str]:
+        """Horaire préféré d'une équipe (un seul par équipe), None si aucun."""
+        return equipe.horaires_preferes[0] if equipe.horaires_preferes else None
+    
+    def _calculer_penalite_horaire(self, prefs: Tuple[Optional[str], Optional[str]], horaire: str) -> float:
+        """Calcule penalite_horaire pour un couple d'horaires préférés (voir penalite_horaire)."""
+        horaire_min = self.parse_horaire(horaire)
+        
+        # Équipes HORS tolérance : (distance, joue avant l'horaire préféré)
+        hors_tolerance = []
+        for h_pref_str in prefs:
+            if h_pref_str is None or horaire == h_pref_str:
+                continue
+            h_pref_min = self.parse_horaire(h_pref_str)
+            distance = abs(horaire_min - h_pref_min)
+            if distance > self.config.penalite_horaire_tolerance:
+                hors_tolerance.append((distance, horaire_min < h_pref_min))
+        
+        if not hors_tolerance:
+            return 0.0
+        
+        multiplicateur = self._multiplicateur_horaire(sum(1 for _, avant in hors_tolerance if avant))
+        diviseur = self.config.penalite_horaire_diviseur
+        
+        penalite = 0.0
+        for distance, _ in hors_tolerance:
+            penalite += multiplicateur * ((distance / diviseur) ** 2)
+        return penalite
+    
+    def _multiplicateur_horaire(self, nb_equipes_avant: int) -> float:
+        """Multiplicateur selon le nombre d'équipes (hors tolérance) jouant avant leur horaire préféré."""
+        if nb_equipes_avant == 2:
+            return self.config.penalite_avant_horaire_min_deux
+        if nb_equipes_avant == 1:
+            return self.config.penalite_avant_horaire_min
+        return self.config.penalite_apres_horaire_min
+    
+    def table_horaires(self, matchs: List[Match], horaires: List[str]) -> np.ndarray:
+        """
+        Matrice (match × horaire) des pénalités d'horaires préférés.
+        
+        Même valeur que penalite_horaire, calculée par broadcasting sur les axes
+        (match, équipe, horaire) : chaque horaire n'est parsé qu'une seule fois.
+        
+        Args:
+            matchs: Matchs
+            horaires: Horaires distincts
+        
+        Returns:
+            Matrice (nb_matchs × nb_horaires) des pénalités (float)
+        """
+        horaires_min = np.array([self.parse_horaire(h) for h in horaires], dtype=float)
+        position_horaire = {h: k for k, h in enumerate(horaires)}
+        
+        # Horaire préféré (minutes) de chaque équipe du match, NaN si aucun,
+        # et position de l'horaire identique parmi les horaires (-1 si absent)
+        pref_min = np.full((len(matchs), 2), np.nan)
+        pref_idx = np.full((len(matchs), 2), -1, dtype=int)
+        for i, match in enumerate(matchs):
+            for e, equipe in enumerate((match.equipe1, match.equipe2)):
+                h_pref_str = self._horaire_prefere(equipe)
+                if h_pref_str is None:
+                    continue
+                pref_min[i, e] = self.parse_horaire(h_pref_str)
+                pref_idx[i, e] = position_horaire.get(h_pref_str, -1)
+        
+        # Dimensions (match, équipe, horaire)
+        exact = pref_idx[:, :, None] == np.arange(len(horaires))[None, None, :]
+        sans_distance = exact | np.isnan(pref_min)[:, :, None]
+        distances = np.where(sans_distance, 0.0, np.abs(horaires_min[None, None, :] - pref_min[:, :, None]))
+        est_avant = ~sans_distance & (horaires_min[None, None, :] < pref_min[:, :, None])
+        
+        # Seules les équipes HORS tolérance comptent (pénalité et multiplicateur)
+        hors_tolerance = distances > self.config.penalite_horaire_tolerance
+        nb_avant = np.sum(est_avant & hors_tolerance, axis=1)
+        multiplicateur = np.where(
+            nb_avant == 2, self._multiplicateur_horaire(2),
+            np.where(nb_avant == 1, self._multiplicateur_horaire(1), self._multiplicateur_horaire(0))
+        )
+        
+        diviseur = self.config.penalite_horaire_diviseur
+        termes = np.where(hors_tolerance, multiplicateur[:, None, :] * ((distances / diviseur) ** 2), 0.0)
+        return termes.sum(axis=1)
+    
+    def rang_prefere(self, equipe: Equipe, gymnase: str) -> Optional[int]:
+        """
+        Rang (0 = premier choix) d'un gymnase dans les préférences d'une équipe.
+        
+        Returns:
+            Premier rang du gymnase dans lieux_preferes, None s'il n'y figure pas
+        """
+        lieux = tuple(equipe.lieux_preferes or ())
+        rangs = self._rangs_gymnases.get(lieux)
+        if rangs is None:
+            rangs = {}
+            for rang, lieu in enumerate(lieux):
+                rangs.setdefault(lieu, rang)
+            self._rangs_gymnases[lieux] = rangs
+        return rangs.get(gymnase)
+    
+    def penalite_gymnase(self, match: Match, gymnase: str) -> float:
+        """
+        Pénalité/bonus des préférences de gymnase.
+        
+        Logique:
+        - Pénalité de base = 2 × max(bonus_preferences_gymnases)
+        - Pour chaque équipe, si le gymnase est dans ses préférences:
+          soustraire le bonus correspondant au rang de préférence
+        
+        Returns:
+            Pénalité (plus petit = meilleur), 0 si aucun bonus n'est configuré
+        """
+        bonus = self.config.bonus_preferences_gymnases
+        if not bonus:
+            return 0.0
+        
+        cle = (tuple(match.equipe1.lieux_preferes or ()), tuple(match.equipe2.lieux_preferes or ()), gymnase)
+        penalite = self._penalites_gymnases.get(cle)
+        if penalite is None:
+            penalite = 2 * max(bonus)
+            for equipe in (match.equipe1, match.equipe2):
+                rang = self.rang_prefere(equipe, gymnase)
+                if rang is not None and rang < len(bonus):
+                    penalite -= bonus[rang]
+            self._penalites_gymnases[cle] = penalite
+        return penalite
+    
+    def niveau_match(self, match: Match) -> Optional[int]:
+        """
+        Détermine le niveau d'un match basé sur sa poule.
+        
+        Returns:
+            Le niveau (0=A1, 1=A2, 2=A3, 3=A4, etc.) ou None si indéterminé
+        """
+        poule = match.poule.upper()
+        if poule not in self._niveaux_poules:
+            self._niveaux_poules[poule] = self._extraire_niveau(poule)
+        return self._niveaux_poules[poule]
+    
+    @staticmethod
+    def _extraire_niveau(poule: str) -> Optional[int]:
+        """Niveau (0=A1, ...) d'une poule en majuscules, None si indéterminé."""
+        # Chercher un pattern comme A1, A2, A3, A4 ou similaire
+        match_niveau = re.search(r'A(\d+)', poule)
+        if match_niveau:
+            return int(match_niveau.group(1)) - 1  # A1=0, A2=1, A3=2, A4=3
+        
+        # Autres patterns possibles
+        if 'A1' in poule or '1' in poule and 'A' in poule:
+            return 0
+        elif 'A2' in poule or '2' in poule and 'A' in poule:
+            return 1
+        elif 'A3' in poule or '3' in poule and 'A' in poule:
+            return 2
+        elif 'A4' in poule or '4' in poule and 'A' in poule:
+            return 3
+        
+        return None  # Niveau indéterminé
+    
+    def penalite_niveau_gymnase(self, match: Match, gymnase: str) -> float:
+        """
+        Pénalité pour un match joué dans un gymnase de niveau inapproprié.
+        
+        Valeurs positives = pénalité (augmente le coût, à éviter).
+        
+        Returns:
+            Pénalité (0 si niveau du match ou du gymnase indéterminé)
+        """
+        haut = self.config.penalite_niveau_gymnases_haut
+        bas = self.config.penalite_niveau_gymnases_bas
+        if not self.niveaux_gymnases or not (haut or bas):
+            return 0.0
+        
+        niveau_match = self.niveau_match(match)
+        if niveau_match is None:
+            return 0.0
+        
+        cle = (niveau_match, gymnase)
+        penalite = self._penalites_niveaux.get(cle)
+        if penalite is None:
+            niveau_gymnase = self.niveaux_gymnases.get(gymnase)
+            penalite = 0.0
+            if niveau_gymnase == 'Haut niveau' and niveau_match < len(haut):
+                penalite = haut[niveau_match]
+            elif niveau_gymnase == 'Bas niveau' and niveau_match < len(bas):
+                penalite = bas[niveau_match]
+            self._penalites_niveaux[cle] = penalite
+        return penalite
+    
+    def table_preferences_gymnases(self, matchs: List[Match], gymnases: List[str]) -> np.ndarray:
+        """
+        Matrice (match × gymnase) des pénalités de préférences de gymnases (voir penalite_gymnase).
+        
+        Returns:
+            Matrice (nb_matchs × nb_gymnases) des pénalités (float), nulle si aucun bonus configuré
+        """
+        bonus = self.config.bonus_preferences_gymnases
+        if not bonus:
+            return np.zeros((len(matchs), len(gymnases)))
+        
+        # Pénalité de base moins le bonus du rang de chaque équipe (seuls les gymnases préférés)
+        penalites = np.full((len(matchs), len(gymnases)), 2 * max(bonus), dtype=float)
+        position_gymnase = {g: k for k, g in enumerate(gymnases)}
+        for i, match in enumerate(matchs):
+            for equipe in (match.equipe1, match.equipe2):
+                for gymnase in set((equipe.lieux_preferes or ())[:len(bonus)]):
+                    k = position_gymnase.get(gymnase)
+                    if k is not None:
+                        penalites[i, k] -= bonus[self.rang_prefere(equipe, gymnase)]
+        return penalites
+    
+    def table_niveaux_gymnases(self, matchs: List[Match], gymnases: List[str]) -> np.ndarray:
+        """
+        Matrice (match × gymnase) des pénalités de niveau (voir penalite_niveau_gymnase),
+        par broadcasting (niveau du match) × (niveau du gymnase).
+        
+        Returns:
+            Matrice (nb_matchs × nb_gymnases) des pénalités (float)
+        """
+        haut = self.config.penalite_niveau_gymnases_haut
+        bas = self.config.penalite_niveau_gymnases_bas
+        if not self.niveaux_gymnases or not (haut or bas):
+            return np.zeros((len(matchs), len(gymnases)))
+        
+        est_haut = np.array([self.niveaux_gymnases.get(g) == 'Haut niveau' for g in gymnases], dtype=bool)
+        est_bas = np.array([self.niveaux_gymnases.get(g) == 'Bas niveau' for g in gymnases], dtype=bool)
+        
+        niveaux = [self.niveau_match(match) for match in matchs]
+        pen_haut = np.array([haut[n] if n is not None and n < len(haut) else 0 for n in niveaux], dtype=float)
+        pen_bas = np.array([bas[n] if n is not None and n < len(bas) else 0 for n in niveaux], dtype=float)
+        
+        return np.where(est_haut[None, :], pen_haut[:, None],
+                        np.where(est_bas[None, :], pen_bas[:, None], 0.0))
+    
+    def penalite_compaction(self, semaine: int) -> float:
+        """
+        Pénalité de compaction temporelle d'une semaine (indice 0 = semaine 1,
+        au-delà de la liste : dernière pénalité).
+        
+        Returns:
+            Pénalité configurée, 0 si la compaction est désactivée
+        """
+        if not self.config.compaction_temporelle_actif or not self.config.compaction_penalites_par_semaine:
+            return 0.0
+        
+        penalite = self._penalites_compaction.get(semaine)
+        if penalite is None:
+            penalites = self.config.compaction_penalites_par_semaine
+            if semaine <= len(penalites):
+                penalite = penalites[semaine - 1]
+            else:
+                penalite = penalites[-1]
+            self._penalites_compaction[semaine] = penalite
+        return penalite
+    
+    def table_compaction(self, semaines: List[int]) -> np.ndarray:
+        """
+        Vecteur des pénalités de compaction par semaine (voir penalite_compaction).
+        
+        Returns:
+            Vecteur (nb_semaines) des pénalités (float)
+        """
+        return np.array([self.penalite_compaction(s) for s in semaines], dtype=float)
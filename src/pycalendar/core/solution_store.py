@@ -93,6 +93,7 @@ class SolutionStore:
         
         self.solution_name = solution_name
         self.latest_file = self.solutions_dir / f"latest_{solution_name}.json"
+        self.snapshot_file = self.solutions_dir / f"snapshot_{solution_name}.json"
     
     @staticmethod
     def compute_file_hash(file_path: Path) -> str:
@@ -296,6 +297,57 @@ class SolutionStore:
             print(f"  ⚠️  Erreur lors du chargement de la solution précédente: {e}")
             return None
     
+    def save_snapshot(self, assignments: List[dict], metadata: dict) -> Path:
+        """
+        Sauvegarde un instantané léger de la meilleure solution d'une résolution en cours.
+        
+        Seules les affectations sont écrites (format "assignments" lu par le warm start
+        et le solveur incrémental). L'écriture passe par un fichier temporaire remplacé
+        atomiquement : un processus interrompu laisse toujours un instantané complet.
+        
+        Args:
+            assignments: Affectations {equipe1_id, equipe2_id, semaine, horaire, gymnase}
+            metadata: Métadonnées (score, borne, temps écoulé...)
+            
+        Returns:
+            Path de l'instantané
+        """
+        data = {
+            "metadata": {
+                "solution_name": self.solution_name,
+                "date": datetime.now().isoformat(),
+                "snapshot": True,
+                "matchs_planifies": len(assignments),
+                **metadata
+            },
+            "assignments": assignments
+        }
+        
+        temporaire = self.snapshot_file.with_suffix(".tmp")
+        with open(temporaire, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        temporaire.replace(self.snapshot_file)
+        return self.snapshot_file
+    
+    def load_snapshot(self) -> Optional[dict]:
+        """
+        Charge l'instantané d'une résolution interrompue.
+        
+        Returns:
+            L'instantané s'il est plus récent que la dernière solution sauvegardée, sinon None
+        """
+        if not self.snapshot_file.exists():
+            return None
+        if self.latest_file.exists() and self.latest_file.stat().st_mtime >= self.snapshot_file.stat().st_mtime:
+            return None
+        
+        try:
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"  ⚠️  Erreur lors du chargement de l'instantané: {e}")
+            return None
+    
     def validate_and_adapt_solution(self, solution_data: dict, 
                                     current_signature: ConfigSignature,
                                     matchs: List[Match], 
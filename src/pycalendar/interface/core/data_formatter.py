@@ -13,6 +13,7 @@ import json
 
 from pycalendar.core.models import Solution, Match, Equipe, Creneau, Gymnase
 from pycalendar.core.config import Config
+from pycalendar.core.penalty_tables import PenaltyTables
 from pycalendar.core.utils import determiner_genre_match
 
 
@@ -83,6 +84,28 @@ class DataFormatter:
         if "penalty_breakdown" in metadata:
             result["penalty_breakdown"] = metadata["penalty_breakdown"]
         
+        # Taille du modèle CP-SAT par famille de contraintes si disponible
+        if "statistiques_modele" in metadata:
+            result["statistiques_modele"] = metadata["statistiques_modele"]
+        
+        # Borne supérieure du score et écart à l'optimum si disponibles
+        if metadata.get("borne"):
+            result["borne"] = metadata["borne"]
+        
+        # Résultat de chaque processus du portfolio CP-SAT si disponible
+        if metadata.get("portfolio"):
+            result["portfolio"] = metadata["portfolio"]
+        
+        # Pool de solutions : variantes exportées, et position de cette variante
+        if metadata.get("pool"):
+            result["pool"] = metadata["pool"]
+        if "variante" in metadata:
+            result["variante"] = metadata["variante"]
+        
+        # Analyse de faisabilité (borne de matchs planifiables, goulots) si disponible
+        if "faisabilite" in metadata:
+            result["faisabilite"] = metadata["faisabilite"]
+        
         return result
     
     @staticmethod
@@ -229,12 +252,15 @@ class DataFormatter:
         """Format all matches (scheduled and unscheduled)."""
         
         # Pre-calculate context for global penalties (espacement, compaction, overlap)
+        # and the shared penalty tables (preferred times, compaction)
+        tables = None
         if config:
             DataFormatter._precalculate_penalty_context(solution, config)
+            tables = PenaltyTables(config)
         
         scheduled = []
         for idx, match in enumerate(solution.matchs_planifies):
-            match_data = DataFormatter._format_single_match(match, idx, True, config)
+            match_data = DataFormatter._format_single_match(match, idx, True, config, tables)
             scheduled.append(match_data)
         
         unscheduled = []
@@ -243,7 +269,8 @@ class DataFormatter:
                 match, 
                 len(solution.matchs_planifies) + idx, 
                 False, 
-                config
+                config,
+                tables
             )
             unscheduled.append(match_data)
         
@@ -318,7 +345,8 @@ class DataFormatter:
         match: Match, 
         index: int, 
         is_scheduled: bool,
-        config: Optional[Config]
+        config: Optional[Config],
+        tables: Optional[PenaltyTables] = None
     ) -> Dict[str, Any]:
         """Format a single match."""
         
@@ -417,7 +445,7 @@ class DataFormatter:
             
             # Calculate penalties if config available
             if config:
-                penalties = DataFormatter._calculate_match_penalties(match, config)
+                penalties = DataFormatter._calculate_match_penalties(match, config, tables)
                 match_data["penalties"] = penalties
             else:
                 # Return structure with zeros if no config
@@ -438,7 +466,8 @@ class DataFormatter:
         return match_data
     
     @staticmethod
-    def _calculate_match_penalties(match: Match, config: Config) -> Dict[str, float]:
+    def _calculate_match_penalties(match: Match, config: Config,
+                                   tables: Optional[PenaltyTables] = None) -> Dict[str, float]:
         """
         Calculate penalties for a scheduled match.
         
@@ -448,16 +477,20 @@ class DataFormatter:
         Args:
             match: The match to calculate penalties for
             config: Configuration with penalty weights
+            tables: Shared penalty tables (created from config if None)
             
         Returns:
             Dictionary with all penalty types and total
         """
+        if tables is None:
+            tables = PenaltyTables(config)
+        
         penalties = {
             "total": 0.0,
-            "horaire_prefere": DataFormatter._calculate_horaire_prefere_penalty(match, config),
+            "horaire_prefere": DataFormatter._calculate_horaire_prefere_penalty(match, config, tables),
             "espacement": DataFormatter._calculate_espacement_penalty(match, config),
             "indisponibilite": DataFormatter._calculate_indisponibilite_penalty(match, config),
-            "compaction": DataFormatter._calculate_compaction_penalty(match, config),
+            "compaction": DataFormatter._calculate_compaction_penalty(match, config, tables),
             "overlap": DataFormatter._calculate_overlap_penalty(match, config),
         }
         
@@ -467,83 +500,21 @@ class DataFormatter:
         return penalties
     
     @staticmethod
-    def _calculate_horaire_prefere_penalty(match: Match, config: Config) -> float:
+    def _calculate_horaire_prefere_penalty(match: Match, config: Config,
+                                           tables: Optional[PenaltyTables] = None) -> float:
         """
         Calculate penalty for non-preferred time slots.
         
-        Uses the same logic as PreferredTimeSlotConstraint.
+        Looked up in the shared penalty tables (same values as the solvers).
         Formula: penalty = multiplier × ((distance_minutes) / divisor)²
         """
         if not match.creneau:
             return 0.0
-            
-        # Get penalty parameters from config (use exact attribute names)
-        weight = getattr(config, 'penalite_apres_horaire_min', 1.0)
-        penalty_before_one = getattr(config, 'penalite_avant_horaire_min', 6.0)
-        penalty_before_both = getattr(config, 'penalite_avant_horaire_min_deux', 15.0)
-        tolerance_minutes = getattr(config, 'penalite_horaire_tolerance', 30.0)
-        divisor = getattr(config, 'penalite_horaire_diviseur', 60.0)
-        
-        def parse_horaire(horaire: str) -> int:
-            """Parse HH:MM to minutes since midnight"""
-            try:
-                parts = horaire.split(':')
-                heures = int(parts[0])
-                minutes = int(parts[1]) if len(parts) > 1 else 0
-                return heures * 60 + minutes
-            except (ValueError, IndexError):
-                return 14 * 60  # Default 14h
-        
-        def calculate_for_equipe(equipe) -> tuple:
-            """Returns (distance_minutes, is_before)"""
-            if not equipe.horaires_preferes:
-                return 0.0, False
-            
-            creneau_horaire = match.creneau.horaire
-            if creneau_horaire in equipe.horaires_preferes:
-                return 0.0, False
-            
-            horaire_match = parse_horaire(creneau_horaire)
-            horaire_pref = parse_horaire(equipe.horaires_preferes[0])
-            
-            distance_minutes = abs(horaire_match - horaire_pref)
-            
-            if distance_minutes <= tolerance_minutes:
-                return 0.0, False
-            
-            is_before = horaire_match < horaire_pref
-            return distance_minutes, is_before
         
-        # Calculate for both teams
-        distance1, is_before1 = calculate_for_equipe(match.equipe1)
-        distance2, is_before2 = calculate_for_equipe(match.equipe2)
+        if tables is None:
+            tables = PenaltyTables(config)
         
-        if distance1 == 0 and distance2 == 0:
-            return 0.0
-        
-        # Count teams playing before their preferred time (outside tolerance)
-        nb_equipes_avant = 0
-        if distance1 > 0 and is_before1:
-            nb_equipes_avant += 1
-        if distance2 > 0 and is_before2:
-            nb_equipes_avant += 1
-        
-        # Determine multiplier
-        if nb_equipes_avant == 2:
-            multiplicateur = penalty_before_both
-        elif nb_equipes_avant == 1:
-            multiplicateur = penalty_before_one
-        else:
-            multiplicateur = weight
-        
-        # Calculate total penalty
-        penalty = 0.0
-        if distance1 > 0:
-            penalty += multiplicateur * ((distance1 / divisor) ** 2)
-        if distance2 > 0:
-            penalty += multiplicateur * ((distance2 / divisor) ** 2)
-        
-        return penalty
+        return tables.penalite_horaire(match, match.creneau.horaire)
     
     @staticmethod
     def _calculate_espacement_penalty(match: Match, config: Config) -> float:
@@ -636,12 +607,13 @@ class DataFormatter:
         return penalty
     
     @staticmethod
-    def _calculate_compaction_penalty(match: Match, config: Config) -> float:
+    def _calculate_compaction_penalty(match: Match, config: Config,
+                                      tables: Optional[PenaltyTables] = None) -> float:
         """
-        Calculate penalty for spreading matches too much or too little across weeks.
+        Calculate penalty for scheduling a match late in the calendar.
         
         Uses config.compaction_penalites_par_semaine: [penalty_week1, penalty_week2, ...]
-        The penalty represents how undesirable it is to schedule in that week.
+        looked up in the shared penalty tables (same values as the solvers).
         
         Returns:
             Penalty value (0.0 = good distribution, higher = worse)
@@ -649,22 +621,10 @@ class DataFormatter:
         if not match.creneau:
             return 0.0
         
-        # Get penalty list from config (indexed by week number - 1)
-        penalites = getattr(config, 'compaction_penalites_par_semaine', [])
-        if not penalites:
-            return 0.0
-        
-        current_week = match.creneau.semaine
-        
-        # Week indices are 0-based in the list, but semaine starts at 1 or semaine_min
-        semaine_min = getattr(config, 'semaine_min', 1)
-        week_index = current_week - semaine_min
-        
-        # Return penalty for this week if defined
-        if 0 <= week_index < len(penalites):
-            return float(penalites[week_index])
+        if tables is None:
+            tables = PenaltyTables(config)
         
-        return 0.0
+        return float(tables.penalite_compaction(match.creneau.semaine))
     
     @staticmethod
     def _calculate_overlap_penalty(match: Match, config: Config) -> float:
@@ -0,0 +1,234 @@
+"""Découpage du problème en sous-problèmes indépendants (composantes connexes)."""
+
+from dataclasses import dataclass
+from typing import List, Dict, Optional
+from pycalendar.core.models import Match, Creneau, Gymnase, Solution
+
+
+@dataclass
+class SousProbleme:
+    """
+    Sous-problème indépendant : matchs d'une ou plusieurs composantes connexes
+    et créneaux qu'eux seuls peuvent utiliser.
+    """
+    matchs: List[Match]
+    creneaux: List[Creneau]
+    nb_composantes: int = 1
+    temps_max_secondes: Optional[int] = None
+
+
+class _UnionFind:
+    """Union-find avec compression de chemin (indices de matchs)."""
+    
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+    
+    def find(self, i: int) -> int:
+        racine = i
+        while self.parent[racine] != racine:
+            racine = self.parent[racine]
+        while self.parent[i] != racine:
+            self.parent[i], i = racine, self.parent[i]
+        return racine
+    
+    def union(self, i: int, j: int):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            self.parent[rj] = ri
+
+
+def calculer_creneaux_possibles(matchs: List[Match], creneaux: List[Creneau],
+                                gymnases: Dict[str, Gymnase], obligations_presence: Dict[str, str],
+                                semaine_min: int = 1) -> List[List[int]]:
+    """
+    Calcule, pour chaque match, les créneaux qu'il pourrait occuper.
+    
+    Sur-ensemble du masque de faisabilité du solveur CP-SAT : gymnase ouvert,
+    semaine >= semaine_min, deux équipes disponibles, obligation de présence
+    satisfaite. Un sur-ensemble ne fait que fusionner davantage de composantes,
+    le découpage reste donc exact.
+    
+    Args:
+        matchs: Matchs à planifier
+        creneaux: Créneaux disponibles
+        gymnases: Dictionnaire des gymnases
+        obligations_presence: Institution requise par gymnase
+        semaine_min: Première semaine planifiable
+    
+    Returns:
+        Liste (indexée par match) des indices de créneaux possibles
+    """
+    creneaux_ouverts = []
+    for j, creneau in enumerate(creneaux):
+        if creneau.semaine < semaine_min:
+            continue
+        gymnase = gymnases.get(creneau.gymnase)
+        if gymnase and gymnase.get_capacite_disponible(creneau.semaine, creneau.horaire) <= 0:
+            continue
+        creneaux_ouverts.append(j)
+    
+    # Disponibilités calculées une seule fois par équipe
+    disponibilites_equipes = {}
+    for match in matchs:
+        for equipe in (match.equipe1, match.equipe2):
+            if equipe.id_unique not in disponibilites_equipes:
+                disponibilites_equipes[equipe.id_unique] = {
+                    j for j in creneaux_ouverts
+                    if equipe.est_disponible(creneaux[j].semaine, creneaux[j].horaire, creneaux[j].gymnase)
+                }
+    
+    creneaux_par_match = []
+    for match in matchs:
+        institutions = (match.equipe1.institution, match.equipe2.institution)
+        communs = disponibilites_equipes[match.equipe1.id_unique] & disponibilites_equipes[match.equipe2.id_unique]
+        creneaux_par_match.append(sorted(
+            j for j in communs
+            if not obligations_presence.get(creneaux[j].gymnase)
+            or obligations_presence[creneaux[j].gymnase] in institutions
+        ))
+    
+    return creneaux_par_match
+
+
+def calculer_composantes(matchs: List[Match], creneaux_par_match: List[List[int]]) -> List[List[int]]:
+    """
+    Découpe les matchs en composantes connexes du graphe d'interaction.
+    
+    Deux matchs interagissent s'ils partagent une équipe (max par semaine, simultanéité,
+    espacement, aller-retour) ou un créneau possible (capacité des gymnases). Les
+    groupes de non-simultanéité ne pénalisent que des matchs sur un même créneau :
+    ils sont donc couverts par le partage de créneau.
+    
+    Args:
+        matchs: Matchs à planifier
+        creneaux_par_match: Créneaux possibles de chaque match
+    
+    Returns:
+        Composantes (listes d'indices de matchs), de la plus grande à la plus petite
+    """
+    uf = _UnionFind(len(matchs))
+    
+    premier_match_par_equipe = {}
+    premier_match_par_creneau = {}
+    for i, match in enumerate(matchs):
+        for equipe_id in (match.equipe1.id_unique, match.equipe2.id_unique):
+            uf.union(premier_match_par_equipe.setdefault(equipe_id, i), i)
+        for j in creneaux_par_match[i]:
+            uf.union(premier_match_par_creneau.setdefault(j, i), i)
+    
+    composantes = {}
+    for i in range(len(matchs)):
+        composantes.setdefault(uf.find(i), []).append(i)
+    
+    return sorted(composantes.values(), key=len, reverse=True)
+
+
+def construire_sous_problemes(matchs: List[Match], creneaux: List[Creneau],
+                              creneaux_par_match: List[List[int]], nb_max: int,
+                              temps_max_secondes: int) -> List[SousProbleme]:
+    """
+    Regroupe les composantes connexes en au plus nb_max sous-problèmes équilibrés.
+    
+    Les composantes sont réparties de la plus grande à la plus petite dans le
+    sous-problème le moins chargé (en nombre de couples match/créneau possibles).
+    Chaque sous-problème reçoit les seuls créneaux possibles de ses matchs et un
+    budget de temps proportionnel à sa taille (le plus gros reçoit temps_max_secondes).
+    
+    Args:
+        matchs: Matchs à planifier
+        creneaux: Créneaux disponibles
+        creneaux_par_match: Créneaux possibles de chaque match
+        nb_max: Nombre maximum de sous-problèmes (processus disponibles)
+        temps_max_secondes: Budget de temps du plus gros sous-problème
+    
+    Returns:
+        Sous-problèmes indépendants (vide si le problème est connexe)
+    """
+    composantes = calculer_composantes(matchs, creneaux_par_match)
+    if len(composantes) <= 1:
+        return []
+    
+    taille = lambda composante: sum(len(creneaux_par_match[i]) for i in composante) + len(composante)
+    nb_groupes = max(1, min(nb_max, len(composantes)))
+    groupes = [[] for _ in range(nb_groupes)]
+    charges = [0] * nb_groupes
+    nb_par_groupe = [0] * nb_groupes
+    for composante in sorted(composantes, key=taille, reverse=True):
+        k = charges.index(min(charges))
+        groupes[k].extend(composante)
+        charges[k] += taille(composante)
+        nb_par_groupe[k] += 1
+    
+    charge_max = max(charges)
+    sous_problemes = []
+    for indices, charge, nb in zip(groupes, charges, nb_par_groupe):
+        if not indices:
+            continue
+        indices.sort()
+        indices_creneaux = sorted({j for i in indices for j in creneaux_par_match[i]})
+        sous_problemes.append(SousProbleme(
+            matchs=[matchs[i] for i in indices],
+            creneaux=[creneaux[j] for j in indices_creneaux],
+            nb_composantes=nb,
+            temps_max_secondes=max(1, round(temps_max_secondes * charge / charge_max)),
+        ))
+    
+    return sous_problemes
+
+
+def fusionner_solutions(solutions: List[Solution], sous_problemes: List[SousProbleme],
+                        solver: str) -> Solution:
+    """
+    Fusionne les solutions des sous-problèmes indépendants en une seule solution.
+    
+    Les sous-problèmes ne partagent ni équipe ni créneau : l'union des solutions
+    est réalisable et son score est la somme des scores.
+    
+    Args:
+        solutions: Solution de chaque sous-problème (None si échec)
+        sous_problemes: Sous-problèmes correspondants
+        solver: Nom de la stratégie utilisée
+    
+    Returns:
+        Solution fusionnée (metadata['decomposition'] détaille chaque sous-problème)
+    """
+    matchs_planifies = []
+    matchs_non_planifies = []
+    score = 0.0
+    details = []
+    
+    for solution, sous_probleme in zip(solutions, sous_problemes):
+        detail = {
+            'nb_matchs': len(sous_probleme.matchs),
+            'nb_creneaux': len(sous_probleme.creneaux),
+            'nb_composantes': sous_probleme.nb_composantes,
+            'temps_max_secondes': sous_probleme.temps_max_secondes,
+        }
+        if solution is None:
+            # Échec du sous-problème : ses matchs restent non planifiés
+            matchs_non_planifies.extend(sous_probleme.matchs)
+            detail['status'] = 'ECHEC'
+        else:
+            matchs_planifies.extend(solution.matchs_planifies)
+            matchs_non_planifies.extend(solution.matchs_non_planifies)
+            score += solution.score
+            detail['status'] = solution.metadata.get('status')
+            detail['nb_planifies'] = len(solution.matchs_planifies)
+            detail['score'] = solution.score
+        details.append(detail)
+    
+    statuts = {detail['status'] for detail in details}
+    return Solution(
+        matchs_planifies=matchs_planifies,
+        matchs_non_planifies=matchs_non_planifies,
+        score=score,
+        metadata={
+            'solver': solver,
+            'status': statuts.pop() if len(statuts) == 1 else 'MIXTE',
+            'decomposition': {
+                'nb_sous_problemes': len(sous_problemes),
+                'nb_composantes': sum(sp.nb_composantes for sp in sous_problemes),
+                'sous_problemes': details,
+            },
+        }
+    )
@@ -1,5 +1,9 @@
 """Main scheduling pipeline orchestrator."""
 
+import copy
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List
 from pathlib import Path
 from pycalendar.core.models import Equipe, Gymnase, Solution
@@ -13,9 +17,17 @@ from pycalendar.exporters.excel_exporter import ExcelExporter
 from pycalendar.core.statistics import Statistics
 from pycalendar.interface.core.generator import InterfaceGenerator
 from pycalendar.validation.solution_validator import SolutionValidator, afficher_rapport_validation
+from pycalendar.analysis.feasibility import analyser_faisabilite
+from pycalendar.solvers.cpsat_portfolio import nb_coeurs, nb_workers_cpsat
+from pycalendar.orchestrator.decomposition import (calculer_creneaux_possibles, construire_sous_problemes,
+                                                   fusionner_solutions)
 
 try:
     from pycalendar.solvers.cpsat_solver import CPSATSolver
+    from pycalendar.solvers.model_cache import ModelCache
+    from pycalendar.solvers.rolling_horizon_solver import RollingHorizonSolver
+    from pycalendar.solvers.lns_solver import LNSSolver
+    from pycalendar.solvers.incremental_solver import IncrementalSolver, charger_modifications
     CPSAT_AVAILABLE = True
 except ImportError:
     CPSAT_AVAILABLE = False
@@ -34,6 +46,12 @@ class SchedulingPipeline:
         self.niveaux_gymnases = {}
         self.types_poules = {}  # Store pool types for export
     
+    def __getstate__(self):
+        """Pickling support for worker processes: the data source is not needed to solve."""
+        state = self.__dict__.copy()
+        state.pop('source', None)
+        return state
+    
     def run(self):
         """Execute the complete scheduling pipeline."""
         print("\n" + "="*60)
@@ -97,6 +115,10 @@ class SchedulingPipeline:
             self._valider_solution(solution, gymnases)
             
             self._exporter_solution(solution)
+            
+            # Variantes du pool de solutions CP-SAT : une solution JSON et une interface chacune
+            for numero, variante in enumerate(solution.metadata.get('variantes', []), 1):
+                self._exporter_variante(numero, variante, matchs, creneaux, gymnases, matchs_fixes)
             return solution
         
         return None
@@ -393,6 +415,117 @@ class SchedulingPipeline:
         
         gymnases_dict = {g.nom: g for g in gymnases}
         
+        # Analyse de faisabilité : borne de matchs planifiables et goulots, avant toute résolution
+        rapport = None
+        if self.config.analyse_faisabilite_actif:
+            rapport = analyser_faisabilite(matchs, creneaux, gymnases_dict, self.obligations_presence, matchs_fixes,
+                                           self.config.max_matchs_par_equipe_par_semaine, self.config.semaine_min)
+            rapport.afficher()
+            if rapport.borne_superieure == 0:
+                print("⛔ Aucun match planifiable : résolution inutile\n")
+                return Solution(matchs_non_planifies=list(matchs), score=0.0,
+                                metadata={'solver': 'analyse', 'status': 'INFEASIBLE',
+                                          'faisabilite': rapport.to_dict()})
+            if self.config.analyse_faisabilite_bloquante and not rapport.est_complet:
+                print(f"⛔ Au moins {rapport.nb_non_planifiables_min} match(s) ne peuvent pas être planifiés : "
+                      f"arrêt avant résolution (analyse_faisabilite_bloquante)\n")
+                return None
+        
+        solution = self._resoudre_decomposition(matchs, creneaux, gymnases_dict, matchs_fixes)
+        
+        if rapport is not None and solution is not None:
+            solution.metadata['faisabilite'] = rapport.to_dict()
+            depassement = len(solution.matchs_planifies) > rapport.borne_superieure
+            print(f"🔎 Matchs planifiés: {len(solution.matchs_planifies)} / borne supérieure {rapport.borne_superieure}"
+                  + (" (borne dépassée : contraintes dures non respectées)" if depassement else ""))
+        
+        return solution
+    
+    def _resoudre_decomposition(self, matchs, creneaux, gymnases_dict, matchs_fixes=None):
+        """Solve, split into independent sub-problems when decomposition is enabled.
+        
+        Args:
+            matchs: Matchs à planifier
+            creneaux: Créneaux disponibles
+            gymnases_dict: Dictionnaire des gymnases
+            matchs_fixes: Matchs déjà planifiés/fixés
+        """
+        # Décomposition en sous-problèmes indépendants (équipes et créneaux disjoints)
+        if self.config.decomposition_actif:
+            nb_processus = self.config.decomposition_nb_processus or os.cpu_count() or 1
+            creneaux_par_match = calculer_creneaux_possibles(
+                matchs, creneaux, gymnases_dict, self.obligations_presence, self.config.semaine_min
+            )
+            sous_problemes = construire_sous_problemes(
+                matchs, creneaux, creneaux_par_match, nb_processus, self.config.temps_max_secondes
+            )
+            if sous_problemes:
+                return self._resoudre_sous_problemes(sous_problemes, gymnases_dict, matchs_fixes, nb_processus)
+            print("   Problème connexe : résolution en un seul modèle\n")
+        
+        return self._resoudre_strategie(matchs, creneaux, gymnases_dict, matchs_fixes)
+    
+    def _resoudre_sous_problemes(self, sous_problemes, gymnases_dict, matchs_fixes, nb_processus):
+        """Solve independent sub-problems concurrently and merge their solutions.
+        
+        Args:
+            sous_problemes: Sous-problèmes indépendants (voir construire_sous_problemes)
+            gymnases_dict: Dictionnaire des gymnases
+            matchs_fixes: Matchs déjà planifiés/fixés (transmis à chaque sous-problème)
+            nb_processus: Nombre maximum de processus
+        """
+        print(f"🧩 Décomposition: {len(sous_problemes)} sous-problème(s) indépendant(s)")
+        for k, sous_probleme in enumerate(sous_problemes, 1):
+            print(f"   [{k}] {len(sous_probleme.matchs)} matchs, {len(sous_probleme.creneaux)} créneaux, "
+                  f"{sous_probleme.nb_composantes} composante(s), {sous_probleme.temps_max_secondes}s")
+        print()
+        
+        # Sous-problèmes résolus en même temps : les cœurs sont répartis entre eux (workers
+        # CP-SAT, processus gloutons), comme entre les processus du portfolio
+        nb_processus = min(nb_processus, len(sous_problemes))
+        workers = max(1, (self.config.cpsat_nb_workers or nb_coeurs()) // nb_processus)
+        
+        taches = []
+        for k, sous_probleme in enumerate(sous_problemes, 1):
+            config = copy.copy(self.config)
+            config.temps_max_secondes = sous_probleme.temps_max_secondes
+            if nb_processus > 1:
+                config.cpsat_nb_workers = workers
+                config.greedy_nb_processus = min(config.greedy_nb_processus or workers, workers)
+            # Un journal par sous-problème ; pas d'instantané (affectation partielle du calendrier)
+            if config.cpsat_journal_progression:
+                chemin = Path(config.cpsat_journal_progression)
+                config.cpsat_journal_progression = str(chemin.with_name(f"{chemin.stem}_sp{k}{chemin.suffix}"))
+            config.cpsat_snapshot_secondes = 0.0
+            taches.append((config, sous_probleme))
+        
+        if nb_processus <= 1:
+            solutions = [_resoudre_sous_probleme(self, config, sous_probleme, gymnases_dict, matchs_fixes)
+                         for config, sous_probleme in taches]
+        else:
+            with ProcessPoolExecutor(max_workers=nb_processus) as executor:
+                futures = [executor.submit(_resoudre_sous_probleme, self, config, sous_probleme,
+                                           gymnases_dict, matchs_fixes)
+                           for config, sous_probleme in taches]
+                solutions = []
+                for k, future in enumerate(futures, 1):
+                    try:
+                        solutions.append(future.result())
+                    except Exception as e:
+                        print(f"⚠️  Sous-problème {k} en échec: {e}")
+                        solutions.append(None)
+        
+        return fusionner_solutions(solutions, sous_problemes, self.config.strategie)
+    
+    def _resoudre_strategie(self, matchs, creneaux, gymnases_dict, matchs_fixes=None):
+        """Solve one (sub-)problem with the configured strategy.
+        
+        Args:
+            matchs: Matchs à planifier
+            creneaux: Créneaux disponibles
+            gymnases_dict: Dictionnaire des gymnases
+            matchs_fixes: Matchs déjà planifiés/fixés
+        """
         if self.config.strategie == "greedy":
             solver = GreedySolver(self.config, self.groupes_non_simultaneite, self.ententes, self.contraintes_temporelles, self.niveaux_gymnases)
             # Les matchs fixés sont passés au solver mais ne seront pas replanifiés
@@ -411,10 +544,22 @@ class SchedulingPipeline:
             try:
                 # CP-SAT avec warm start activé par défaut
                 use_warm_start = getattr(self.config, 'cpsat_warm_start', True)
+                # Modèle réutilisé depuis le cache si données et poids sont inchangés
+                cache_modeles = ModelCache.pour_config(self.config) if self.config.cpsat_cache_modeles else None
+                # Amorce gloutonne : transmise comme indication (remplace le warm start sur disque)
+                creneaux_initiaux, amorce = None, None
+                if self.config.cpsat_amorce_glouton:
+                    creneaux_initiaux, amorce = self._amorce_gloutonne(solver, matchs, creneaux, gymnases_dict, matchs_fixes)
                 solution = solver.solve(matchs, creneaux, gymnases_dict, 
                                        self.obligations_presence,
                                        use_warm_start=use_warm_start,
-                                       matchs_fixes=matchs_fixes)
+                                       matchs_fixes=matchs_fixes,
+                                       creneaux_initiaux=creneaux_initiaux,
+                                       cache_modeles=cache_modeles,
+                                       mesurer_demarrage_froid=self.config.cpsat_amorce_glouton_mesure)
+                
+                if amorce is not None:
+                    self._rapporter_amorce(amorce, solution)
                 
                 return solution
                 
@@ -425,17 +570,163 @@ class SchedulingPipeline:
                     return solver.solve(matchs, creneaux, gymnases_dict, self.obligations_presence, matchs_fixes)
                 raise
         
+        elif self.config.strategie == "horizon":
+            if not CPSAT_AVAILABLE:
+                print("⚠️  OR-Tools non installé, basculement vers Greedy")
+                solver = GreedySolver(self.config, self.groupes_non_simultaneite, self.ententes, self.contraintes_temporelles, self.niveaux_gymnases)
+                return solver.solve(matchs, creneaux, gymnases_dict, self.obligations_presence, matchs_fixes)
+            
+            # CP-SAT par fenêtres de semaines ; les fenêtres passées sont figées comme matchs fixés
+            solver = RollingHorizonSolver(self.config, self.groupes_non_simultaneite, self.ententes, self.contraintes_temporelles, self.niveaux_gymnases)
+            try:
+                return solver.solve(matchs, creneaux, gymnases_dict, self.obligations_presence, matchs_fixes)
+            
+            except Exception as e:
+                if self.config.fallback_greedy:
+                    print(f"⚠️  Horizon glissant a échoué ({e}), basculement vers Greedy")
+                    solver = GreedySolver(self.config, self.groupes_non_simultaneite, self.ententes, self.contraintes_temporelles, self.niveaux_gymnases)
+                    return solver.solve(matchs, creneaux, gymnases_dict, self.obligations_presence, matchs_fixes)
+                raise
+        
+        elif self.config.strategie == "lns":
+            if not CPSAT_AVAILABLE:
+                print("⚠️  OR-Tools non installé, basculement vers Greedy")
+                solver = GreedySolver(self.config, self.groupes_non_simultaneite, self.ententes, self.contraintes_temporelles, self.niveaux_gymnases)
+                return solver.solve(matchs, creneaux, gymnases_dict, self.obligations_presence, matchs_fixes)
+            
+            # Glouton puis réoptimisation de voisinages (semaine, gymnase, poule, institution) par CP-SAT
+            solver = LNSSolver(self.config, self.groupes_non_simultaneite, self.ententes, self.contraintes_temporelles, self.niveaux_gymnases)
+            try:
+                return solver.solve(matchs, creneaux, gymnases_dict, self.obligations_presence, matchs_fixes)
+            
+            except Exception as e:
+                if self.config.fallback_greedy:
+                    print(f"⚠️  LNS a échoué ({e}), basculement vers Greedy")
+                    solver = GreedySolver(self.config, self.groupes_non_simultaneite, self.ententes, self.contraintes_temporelles, self.niveaux_gymnases)
+                    return solver.solve(matchs, creneaux, gymnases_dict, self.obligations_presence, matchs_fixes)
+                raise
+        
+        elif self.config.strategie == "incremental":
+            if not CPSAT_AVAILABLE:
+                print("⚠️  OR-Tools non installé, basculement vers Greedy")
+                solver = GreedySolver(self.config, self.groupes_non_simultaneite, self.ententes, self.contraintes_temporelles, self.niveaux_gymnases)
+                return solver.solve(matchs, creneaux, gymnases_dict, self.obligations_presence, matchs_fixes)
+            
+            from pycalendar.core.solution_store import SolutionStore
+            
+            # Solution publiée (dernière sauvegarde) + modifications de l'interface
+            solution_precedente = SolutionStore(solution_name=self.config.cpsat_warm_start_file).load_latest()
+            if solution_precedente is None:
+                print("⚠️  Aucune solution précédente, résolution complète CP-SAT")
+                config = copy.copy(self.config)
+                config.strategie = "cpsat"
+                pipeline = copy.copy(self)
+                pipeline.config = config
+                return pipeline._resoudre_strategie(matchs, creneaux, gymnases_dict, matchs_fixes)
+            
+            modifications = []
+            if self.config.incremental_fichier_modifications:
+                modifications = charger_modifications(Path(self.config.incremental_fichier_modifications))
+            
+            solver = IncrementalSolver(self.config, solution_precedente, modifications, self.groupes_non_simultaneite,
+                                       self.ententes, self.contraintes_temporelles, self.niveaux_gymnases)
+            return solver.solve(matchs, creneaux, gymnases_dict, self.obligations_presence, matchs_fixes)
+        
         else:
             print(f"❌ Stratégie inconnue: {self.config.strategie}")
             return None
     
-    def _save_solution(self, solution: Solution, matchs, creneaux, gymnases, matchs_fixes=None):
-        """Sauvegarde la solution avec sa signature pour réutilisation future."""
+    def _amorce_gloutonne(self, solver, matchs, creneaux, gymnases_dict, matchs_fixes=None):
+        """Run greedy tries and turn the best one into a CP-SAT hint.
+        
+        Les essais utilisent des graines différentes et tournent en parallèle si
+        plusieurs essais sont demandés. Les placements qui violent une contrainte
+        dure du modèle (le glouton ne vérifie pas la capacité) sont retirés.
+        
+        Args:
+            solver: Solveur CP-SAT (réparation et évaluation de l'amorce)
+            matchs: Matchs à planifier
+            creneaux: Créneaux disponibles
+            gymnases_dict: Dictionnaire des gymnases
+            matchs_fixes: Matchs déjà planifiés/fixés
+        
+        Returns:
+            Tuple (créneau de départ de chaque match, statistiques de l'amorce)
+        """
+        nb_essais = max(1, self.config.cpsat_amorce_glouton_essais)
+        nb_processus = min(nb_essais, nb_workers_cpsat(self.config))
+        config = copy.copy(self.config)
+        config.nb_essais = 1
+        config.greedy_graine = None  # Chaque essai a sa graine (fixée dans _essai_glouton)
+        config.greedy_nb_processus = 1
+        
+        debut = time.time()
+        if nb_processus <= 1:
+            resultats = [_essai_glouton(self, config, graine, matchs, creneaux, gymnases_dict, matchs_fixes)
+                         for graine in range(nb_essais)]
+        else:
+            with ProcessPoolExecutor(max_workers=nb_processus) as executor:
+                resultats = list(executor.map(
+                    _essai_glouton, [self] * nb_essais, [config] * nb_essais, range(nb_essais),
+                    [matchs] * nb_essais, [creneaux] * nb_essais, [gymnases_dict] * nb_essais,
+                    [matchs_fixes] * nb_essais
+                ))
+        
+        # Meilleur essai : le plus de matchs planifiés, puis la plus faible pénalité
+        _, affectation = min(resultats, key=lambda resultat: resultat[0])
+        nb_glouton = sum(1 for creneau in affectation if creneau is not None)
+        affectation = solver.reparer_affectation(matchs, affectation, creneaux, gymnases_dict,
+                                                 self.obligations_presence, matchs_fixes)
+        nb_planifies = sum(1 for creneau in affectation if creneau is not None)
+        temps_glouton = time.time() - debut
+        score = solver.evaluer_affectation(matchs, affectation, matchs_fixes)
+        
+        print(f"🌱 Amorce gloutonne: {nb_essais} essai(s) en {temps_glouton:.2f}s, "
+              f"{nb_planifies}/{len(matchs)} matchs ({nb_glouton - nb_planifies} placement(s) invalide(s) retiré(s)), "
+              f"score CP-SAT {score:.0f}")
+        
+        return affectation, {
+            'essais': nb_essais,
+            'temps_glouton': temps_glouton,
+            'nb_planifies': nb_planifies,
+            'nb_retires': nb_glouton - nb_planifies,
+            'score': score,
+        }
+    
+    def _rapporter_amorce(self, amorce, solution):
+        """Print the time to first solution saved by the greedy hint and store it in metadata.
+        
+        Args:
+            amorce: Statistiques de l'amorce (voir _amorce_gloutonne)
+            solution: Solution CP-SAT obtenue avec l'amorce
+        """
+        amorce['temps_premiere_solution'] = solution.metadata.get('temps_premiere_solution')
+        amorce['temps_premiere_solution_froid'] = solution.metadata.get('temps_premiere_solution_froid')
+        
+        if amorce['temps_premiere_solution'] is not None and amorce['temps_premiere_solution_froid'] is not None:
+            # Gain net : le temps du glouton est décompté
+            amorce['gain_secondes'] = (amorce['temps_premiere_solution_froid']
+                                       - amorce['temps_premiere_solution'] - amorce['temps_glouton'])
+            print(f"🌱 Amorce: première solution à {amorce['temps_premiere_solution']:.2f}s "
+                  f"(+{amorce['temps_glouton']:.2f}s de glouton) contre {amorce['temps_premiere_solution_froid']:.2f}s "
+                  f"à froid, gain {amorce['gain_secondes']:+.2f}s")
+        elif amorce['temps_premiere_solution'] is not None:
+            print(f"🌱 Amorce: première solution à {amorce['temps_premiere_solution']:.2f}s "
+                  f"(+{amorce['temps_glouton']:.2f}s de glouton)")
+        
+        solution.metadata['amorce_glouton'] = amorce
+    
+    def _save_solution(self, solution: Solution, matchs, creneaux, gymnases, matchs_fixes=None, suffixe: str = ""):
+        """Sauvegarde la solution avec sa signature pour réutilisation future.
+        
+        Args:
+            suffixe: Ajouté au nom de la solution (variantes du pool, hors warm start)
+        """
         try:
             from pycalendar.core.solution_store import SolutionStore
             
             # Créer le store avec le nom de fichier configuré
-            solution_name = getattr(self.config, 'cpsat_warm_start_file', 'default')
+            solution_name = getattr(self.config, 'cpsat_warm_start_file', 'default') + suffixe
             store = SolutionStore(solution_name=solution_name)
             
             # Créer la signature de configuration
@@ -560,3 +851,78 @@ class SchedulingPipeline:
         
         print(f"\n🌐 Ouvrez le calendrier dans votre navigateur:")
         print(f"   file://{html_file}")
+    
+    def _exporter_variante(self, numero: int, variante: Solution, matchs, creneaux, gymnases, matchs_fixes=None):
+        """Export one solution-pool variant: solution JSON and HTML interface (no Excel).
+        
+        Args:
+            numero: Numéro de la variante (suffixe des fichiers)
+            variante: Solution de la variante (metadata['variante'] : score, distance)
+            matchs: Matchs planifiés
+            creneaux: Créneaux disponibles
+            gymnases: Liste des gymnases
+            matchs_fixes: Matchs déjà planifiés/fixés
+        """
+        print(f"\n🎲 Variante {numero}: score {variante.score:.0f}, "
+              f"{variante.metadata['variante']['distance']} match(s) placé(s) différemment")
+        if matchs_fixes:
+            variante = self._integrer_matchs_fixes(variante, matchs_fixes, gymnases)
+        
+        self._save_solution(variante, matchs, creneaux, gymnases, matchs_fixes, suffixe=f"_variante{numero}")
+        
+        variante.metadata['creneaux_disponibles'] = DataTransformer.generer_creneaux(
+            self.source.charger_gymnases(), self.config.nb_semaines, self.config.calendar_manager
+        )
+        html_path = self.config.fichier_sortie.replace('.xlsx', f'_variante{numero}.html')
+        html_file = InterfaceGenerator().generate(variante, html_path, self.config, types_poules=self.types_poules)
+        print(f"   file://{html_file}")
+
+
+def _resoudre_sous_probleme(pipeline: SchedulingPipeline, config: Config, sous_probleme,
+                            gymnases_dict: Dict[str, Gymnase], matchs_fixes) -> Solution:
+    """Solve one independent sub-problem (runs in a worker process).
+    
+    Args:
+        pipeline: Pipeline appelant (non modifié ; sans source de données dans un processus fils)
+        config: Configuration du sous-problème (budget de temps propre)
+        sous_probleme: Matchs et créneaux du sous-problème
+        gymnases_dict: Dictionnaire des gymnases
+        matchs_fixes: Matchs déjà planifiés/fixés
+    """
+    pipeline = copy.copy(pipeline)
+    pipeline.config = config
+    return pipeline._resoudre_strategie(sous_probleme.matchs, sous_probleme.creneaux, gymnases_dict, matchs_fixes)
+
+
+def _essai_glouton(pipeline: SchedulingPipeline, config: Config, graine: int, matchs, creneaux,
+                   gymnases_dict: Dict[str, Gymnase], matchs_fixes):
+    """Run one seeded greedy try (runs in a worker process for parallel tries).
+    
+    Les créneaux des objets Match sont restaurés après l'essai : l'amorce ne doit
+    laisser aucune trace sur les matchs que CP-SAT résout ensuite.
+    
+    Args:
+        pipeline: Pipeline appelant (groupes, ententes, contraintes temporelles, niveaux)
+        config: Configuration (un essai par appel)
+        graine: Graine aléatoire de l'essai
+        matchs: Matchs à planifier
+        creneaux: Créneaux disponibles
+        gymnases_dict: Dictionnaire des gymnases
+        matchs_fixes: Matchs déjà planifiés/fixés
+    
+    Returns:
+        Tuple ((nb non planifiés, pénalité), créneau de chaque match ou None)
+    """
+    config = copy.copy(config)
+    config.greedy_graine = graine
+    creneaux_avant = [match.creneau for match in matchs]
+    solver = GreedySolver(config, pipeline.groupes_non_simultaneite, pipeline.ententes,
+                          pipeline.contraintes_temporelles, pipeline.niveaux_gymnases)
+    try:
+        solution = solver.solve(matchs, creneaux, gymnases_dict, pipeline.obligations_presence, matchs_fixes)
+        planifies = {id(match) for match in solution.matchs_planifies}
+        affectation = [match.creneau if id(match) in planifies else None for match in matchs]
+    finally:
+        for match, creneau in zip(matchs, creneaux_avant):
+            match.creneau = creneau
+    return (len(solution.matchs_non_planifies), solution.score), affectation
@@ -5,6 +5,9 @@ from .greedy_solver import GreedySolver
 
 try:
     from .cpsat_solver import CPSATSolver
-    __all__ = ['BaseSolver', 'GreedySolver', 'CPSATSolver']
+    from .rolling_horizon_solver import RollingHorizonSolver
+    from .lns_solver import LNSSolver
+    from .incremental_solver import IncrementalSolver
+    __all__ = ['BaseSolver', 'GreedySolver', 'CPSATSolver', 'RollingHorizonSolver', 'LNSSolver', 'IncrementalSolver']
 except ImportError:
     __all__ = ['BaseSolver', 'GreedySolver']
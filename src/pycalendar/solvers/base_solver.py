@@ -1,5 +1,6 @@
 """Base solver interface."""
 
+import dataclasses
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
 from pycalendar.core.models import Match, Creneau, Gymnase, Solution
@@ -63,6 +64,23 @@ class BaseSolver(ABC):
         
         return state
     
+    def _figer_match(self, match: Match, creneau: Creneau) -> Match:
+        """Copie d'un match placé au format des matchs fixés (metadata semaine/horaire/gymnase).
+        
+        Args:
+            match: Match placé
+            creneau: Créneau du match
+        
+        Returns:
+            Nouveau Match, utilisable dans matchs_fixes
+        """
+        return dataclasses.replace(match, creneau=creneau, metadata={
+            **match.metadata,
+            'semaine': creneau.semaine,
+            'horaire': creneau.horaire,
+            'gymnase': creneau.gymnase,
+        })
+    
     def _update_solution_state(self, state: Dict, match: Match, creneau: Creneau):
         """Update solution state after assigning a match.
         
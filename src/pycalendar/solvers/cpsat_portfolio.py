@@ -0,0 +1,220 @@
+"""CP-SAT portfolio: independent solver processes with different seeds and parameter profiles."""
+
+try:
+    from ortools.sat.python import cp_model
+    ORTOOLS_AVAILABLE = True
+except ImportError:
+    ORTOOLS_AVAILABLE = False
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional
+from pycalendar.core.config import Config
+from .model_cache import modele_depuis_texte, modele_vers_texte
+
+
+# Profils de paramètres CP-SAT (les énumérations sont données par leur nom dans cp_model)
+PROFILS_PORTFOLIO = {
+    'defaut': {},
+    'lineaire': {'linearization_level': 2},
+    'sans_lp': {'linearization_level': 0},
+    'lns_seul': {'use_lns_only': True},
+    'pseudo_cout': {'search_branching': 'PSEUDO_COST_SEARCH'},
+    'redemarrages': {'search_branching': 'PORTFOLIO_WITH_QUICK_RESTART_SEARCH'},
+}
+
+
+# Workers d'une résolution quand cpsat_nb_workers vaut 0 (borne : plusieurs résolutions
+# peuvent tourner en même temps, sous-problèmes ou amorce gloutonne)
+NB_WORKERS_DEFAUT = 8
+
+
+def nb_coeurs() -> int:
+    """Nombre de cœurs utilisables par le processus (affinité CPU si disponible)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def nb_workers_cpsat(config: Config) -> int:
+    """
+    Nombre de workers CP-SAT d'une résolution : cpsat_nb_workers, ou (0) le nombre de
+    cœurs dans la limite de NB_WORKERS_DEFAUT.
+    
+    Args:
+        config: Configuration
+    
+    Returns:
+        Nombre de workers (au moins 1)
+    """
+    return max(1, config.cpsat_nb_workers or min(NB_WORKERS_DEFAUT, nb_coeurs()))
+
+
+def _resoudre_profil(texte_modele: str, parametres: Dict, profil: str) -> dict:
+    """
+    Résout le modèle dans un processus du portfolio.
+    
+    Args:
+        texte_modele: Modèle CP-SAT au format texte (indications comprises)
+        parametres: Paramètres CP-SAT (temps, workers, graine, profil)
+        profil: Nom du profil (pour le rapport)
+    
+    Returns:
+        Dict sérialisable : statut, objectif, borne, valeurs des variables et compteurs
+    """
+    model = modele_depuis_texte(texte_modele)
+    
+    solver = cp_model.CpSolver()
+    for nom, valeur in parametres.items():
+        setattr(solver.parameters, nom, getattr(cp_model, valeur) if isinstance(valeur, str) else valeur)
+    
+    status = solver.Solve(model)
+    reponse = solver.ResponseProto()
+    trouve = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+    return {
+        'profil': profil,
+        'graine': parametres['random_seed'],
+        'status': int(status),
+        'objectif': solver.ObjectiveValue() if trouve else None,
+        'borne': solver.BestObjectiveBound(),
+        'valeurs': list(reponse.solution) if trouve else None,
+        'branches': solver.NumBranches(),
+        'conflits': solver.NumConflicts(),
+    }
+
+
+class ResultatPortfolio:
+    """
+    Meilleur résultat du portfolio, avec l'interface de CpSolver utilisée après la
+    résolution (Value, ObjectiveValue, BestObjectiveBound, StatusName, compteurs).
+    """
+    
+    def __init__(self, status, objectif: float, borne: float, valeurs: Optional[List[int]],
+                 branches: int, conflits: int, temps: float, essais: List[dict]):
+        self.status = status
+        self._objectif = objectif
+        self._borne = borne
+        self._valeurs = valeurs
+        self._branches = branches
+        self._conflits = conflits
+        self._temps = temps
+        self.essais = essais  # Résultat de chaque processus, manche par manche
+    
+    def Value(self, var) -> int:
+        return self._valeurs[var.Index()]
+    
+    def ObjectiveValue(self) -> float:
+        return self._objectif
+    
+    def BestObjectiveBound(self) -> float:
+        return self._borne
+    
+    def StatusName(self, status=None) -> str:
+        return cp_model.CpSolver().StatusName(self.status if status is None else status)
+    
+    def NumBranches(self) -> int:
+        return self._branches
+    
+    def NumConflicts(self) -> int:
+        return self._conflits
+    
+    def WallTime(self) -> float:
+        return self._temps
+
+
+def resoudre_portfolio(model, config: Config) -> ResultatPortfolio:
+    """
+    Lance plusieurs résolutions CP-SAT indépendantes, en processus séparés.
+    
+    Chaque processus a sa graine et son profil (cpsat_portfolio_profils, en tourniquet) ;
+    les cœurs sont répartis entre les processus. Le temps est découpé en
+    cpsat_portfolio_manches manches : à chaque nouvelle manche, la meilleure solution
+    connue est transmise à tous les processus comme indication complète.
+    
+    Args:
+        model: Modèle CP-SAT construit (ses indications servent à la première manche)
+        config: Configuration
+    
+    Returns:
+        ResultatPortfolio (meilleur objectif, borne la plus serrée)
+    """
+    coeurs = nb_coeurs()
+    nb_processus = config.cpsat_portfolio_processus or max(2, coeurs // 8)
+    workers = max(1, (config.cpsat_nb_workers or coeurs) // nb_processus)
+    profils = [p for p in config.cpsat_portfolio_profils if p in PROFILS_PORTFOLIO] or ['defaut']
+    manches = max(1, config.cpsat_portfolio_manches)
+    temps_manche = config.temps_max_secondes / manches
+    
+    print(f"\n🏁 Portfolio CP-SAT: {nb_processus} processus × {workers} worker(s), {manches} manche(s) "
+          f"de {temps_manche:.1f}s, profils {', '.join(profils)}")
+    
+    debut = time.time()
+    meilleur = None
+    borne = None
+    branches, conflits = 0, 0
+    optimal, infaisable = False, False
+    essais = []
+    
+    for manche in range(manches):
+        if meilleur is not None:
+            # Meilleure solution connue : indication complète pour tous les processus
+            model.ClearHints()
+            for k, valeur in enumerate(meilleur['valeurs']):
+                model.AddHint(model.GetIntVarFromProtoIndex(k), valeur)
+        texte_modele = modele_vers_texte(model)
+        
+        taches = []
+        for k in range(nb_processus):
+            profil = profils[k % len(profils)]
+            parametres = {
+                'max_time_in_seconds': temps_manche,
+                'num_workers': workers,
+                'random_seed': config.cpsat_portfolio_graine + manche * nb_processus + k,
+                'relative_gap_limit': config.cpsat_arret_gap_relatif,
+                **PROFILS_PORTFOLIO[profil],
+            }
+            taches.append((parametres, profil))
+        
+        with ProcessPoolExecutor(max_workers=nb_processus) as executor:
+            futures = [executor.submit(_resoudre_profil, texte_modele, parametres, profil)
+                       for parametres, profil in taches]
+            resultats = []
+            for future in futures:
+                try:
+                    resultats.append(future.result())
+                except Exception as e:
+                    print(f"   ⚠️  Processus du portfolio en échec: {e}")
+        
+        for resultat in resultats:
+            resultat['manche'] = manche + 1
+            essais.append({cle: valeur for cle, valeur in resultat.items() if cle != 'valeurs'})
+            branches += resultat['branches']
+            conflits += resultat['conflits']
+            optimal = optimal or resultat['status'] == int(cp_model.OPTIMAL)
+            infaisable = infaisable or resultat['status'] == int(cp_model.INFEASIBLE)
+            if resultat['objectif'] is not None:
+                # Maximisation : la borne prouvée la plus serrée est la plus petite
+                borne = resultat['borne'] if borne is None else min(borne, resultat['borne'])
+                if meilleur is None or resultat['objectif'] > meilleur['objectif']:
+                    meilleur = resultat
+            
+            objectif = f"{resultat['objectif']:.0f}" if resultat['objectif'] is not None else "-"
+            print(f"   Manche {manche + 1} [{resultat['profil']}, graine {resultat['graine']}]: "
+                  f"{cp_model.CpSolver().StatusName(cp_model.CpSolverStatus(resultat['status']))}, score {objectif}, "
+                  f"borne {resultat['borne']:.0f}")
+        
+        if optimal or infaisable:
+            break
+    
+    if meilleur is None:
+        status = cp_model.INFEASIBLE if infaisable else cp_model.UNKNOWN
+        return ResultatPortfolio(status, 0.0, 0.0, None, branches, conflits, time.time() - debut, essais)
+    
+    optimal = optimal or meilleur['objectif'] >= borne
+    status = cp_model.OPTIMAL if optimal else cp_model.FEASIBLE
+    print(f"   🏆 Meilleur: {meilleur['profil']} (graine {meilleur['graine']}, manche {meilleur['manche']}), "
+          f"score {meilleur['objectif']:.0f}")
+    return ResultatPortfolio(status, meilleur['objectif'], borne, meilleur['valeurs'],
+                             branches, conflits, time.time() - debut, essais)
@@ -6,10 +6,21 @@ try:
 except ImportError:
     ORTOOLS_AVAILABLE = False
 
-from typing import List, Dict, Optional, Set
+import copy
+import time
+import numpy as np
+from typing import List, Dict, Optional, Set, Tuple
 from pycalendar.core.models import Match, Creneau, Gymnase, Solution
 from pycalendar.core.config import Config
+from pycalendar.core.penalty_tables import PenaltyTables
 from .base_solver import BaseSolver
+from .model_index import ModelIndex
+from .model_cache import ModelCache
+from .model_stats import StatistiquesModele
+from .relaxation import borne_affectation
+from .cpsat_portfolio import nb_workers_cpsat, resoudre_portfolio
+from .solution_pool import PoolSolutions, distance_hamming
+from .progression import JournalProgression
 
 
 class CPSATSolver(BaseSolver):
@@ -25,36 +36,8 @@ class CPSATSolver(BaseSolver):
         self.ententes = ententes or {}  # Dict avec paires d'institutions et leurs pénalités
         self.contraintes_temporelles = contraintes_temporelles or {}  # Dict avec paires d'équipes et leurs contraintes temporelles
         self.niveaux_gymnases = niveaux_gymnases or {}  # Dict avec niveaux des gymnases
-    
-    def _get_niveau_match(self, match: Match) -> Optional[int]:
-        """
-        Détermine le niveau d'un match basé sur sa poule.
-        
-        Args:
-            match: Le match dont on veut connaître le niveau
-            
-        Returns:
-            Le niveau (0=A1, 1=A2, 2=A3, 3=A4, etc.) ou None si indéterminé
-        """
-        poule = match.poule.upper()
-        
-        # Chercher un pattern comme A1, A2, A3, A4 ou similaire
-        import re
-        match_niveau = re.search(r'A(\d+)', poule)
-        if match_niveau:
-            return int(match_niveau.group(1)) - 1  # A1=0, A2=1, A3=2, A4=3
-        
-        # Autres patterns possibles
-        if 'A1' in poule or '1' in poule and 'A' in poule:
-            return 0
-        elif 'A2' in poule or '2' in poule and 'A' in poule:
-            return 1
-        elif 'A3' in poule or '3' in poule and 'A' in poule:
-            return 2
-        elif 'A4' in poule or '4' in poule and 'A' in poule:
-            return 3
-        
-        return None  # Niveau indéterminé
+        self.penalty_tables = PenaltyTables(config, self.niveaux_gymnases)
+        self.statistiques_modele: Optional[StatistiquesModele] = None  # Modèle du dernier solve()
     
     def _est_entente(self, match: Match) -> bool:
         """
@@ -91,6 +74,19 @@ class CPSATSolver(BaseSolver):
             return self.config.entente_penalite_non_planif
         return penalite
     
+    def _get_bonus_planification(self, match: Match) -> int:
+        """
+        Bonus de l'objectif pour un match planifié (= pénalité s'il ne l'est pas).
+        
+        Returns:
+            Bonus réduit pour une entente, penalite_match_non_planif sinon
+        """
+        if self._est_entente(match):
+            # Match entente : bonus réduit = pénalité faible si non planifié
+            return int(self._get_penalite_entente(match))
+        # Match normal : bonus configurable = pénalité si non planifié
+        return int(self.config.penalite_match_non_planif)
+    
     def _get_contrainte_temporelle(self, match: Match):
         """
         Récupère la contrainte temporelle pour un match s'il en existe une.
@@ -123,249 +119,580 @@ class CPSATSolver(BaseSolver):
         
         return None
     
-    def _sont_matchs_aller_retour(self, match1: Match, match2: Match) -> bool:
+    def _detecter_paires_aller_retour(self, matchs: List[Match]) -> List[Tuple[int, int]]:
         """
-        Vérifie si deux matchs sont une paire aller-retour.
+        Détecte les paires aller-retour parmi les matchs.
         
         Une paire aller-retour a les mêmes équipes mais dans l'ordre inverse:
         - Match aller: Équipe A vs Équipe B
         - Match retour: Équipe B vs Équipe A
         
+        Les matchs sont indexés par (poule, équipe1, équipe2) pour éviter la comparaison
+        de toutes les paires de matchs.
+        
         Args:
-            match1: Premier match
-            match2: Deuxième match
+            matchs: Liste des matchs
             
         Returns:
-            True si c'est une paire aller-retour, False sinon
+            Liste de paires d'indices (i1, i2) avec i1 < i2
         """
-        return (match1.equipe1.nom == match2.equipe2.nom and
-                match1.equipe2.nom == match2.equipe1.nom and
-                match1.equipe1.genre == match2.equipe2.genre and
-                match1.equipe2.genre == match2.equipe1.genre and
-                match1.poule == match2.poule)
+        index_matchs = {}
+        for i, match in enumerate(matchs):
+            key = (match.poule, match.equipe1.id_unique, match.equipe2.id_unique)
+            index_matchs.setdefault(key, []).append(i)
+        
+        paires = []
+        for i1, match in enumerate(matchs):
+            key_retour = (match.poule, match.equipe2.id_unique, match.equipe1.id_unique)
+            for i2 in index_matchs.get(key_retour, []):
+                if i1 < i2:
+                    paires.append((i1, i2))
+        
+        return paires
     
-    def _parse_horaire(self, horaire: str) -> int:
+    def _compter_matchs_fixes(self, matchs_fixes: Optional[List[Match]]) -> Tuple[Dict[tuple, int], Dict[tuple, int]]:
         """
-        Convertit un horaire en minutes depuis minuit.
-        Format: "14:00", "14H", "14H30", "20:00"
+        Compte les matchs fixés par équipe/semaine et par créneau.
         
+        Args:
+            matchs_fixes: Matchs déjà planifiés/fixés
+            
         Returns:
-            Nombre de minutes depuis minuit
+            Tuple (nombre par (équipe, semaine), nombre par (semaine, gymnase, horaire))
         """
-        try:
-            # Nettoyer l'horaire
-            horaire = horaire.strip().upper().replace('H', ':')
-            
-            # Ajouter ":00" si pas de minutes
-            if ':' not in horaire:
-                horaire += ':00'
-            
-            parts = horaire.split(':')
-            heures = int(parts[0])
-            minutes = int(parts[1]) if len(parts) > 1 else 0
+        matchs_fixes_par_equipe_semaine = {}
+        matchs_fixes_par_creneau = {}
+        for match_fixe in matchs_fixes or []:
+            if match_fixe.metadata and 'semaine' in match_fixe.metadata:
+                semaine = match_fixe.metadata['semaine']
+                # Compter par équipe/semaine
+                for equipe_id in [match_fixe.equipe1.id_unique, match_fixe.equipe2.id_unique]:
+                    key = (equipe_id, semaine)
+                    matchs_fixes_par_equipe_semaine[key] = matchs_fixes_par_equipe_semaine.get(key, 0) + 1
+                
+                # Compter par créneau pour gérer la capacité
+                if 'horaire' in match_fixe.metadata and 'gymnase' in match_fixe.metadata:
+                    # Normaliser l'horaire (strip whitespace)
+                    horaire_normalise = match_fixe.metadata['horaire'].strip()
+                    gymnase_normalise = match_fixe.metadata['gymnase'].strip()
+                    creneau_key = (semaine, gymnase_normalise, horaire_normalise)
+                    matchs_fixes_par_creneau[creneau_key] = matchs_fixes_par_creneau.get(creneau_key, 0) + 1
+        
+        return matchs_fixes_par_equipe_semaine, matchs_fixes_par_creneau
+    
+    def _detecter_retours_fixes(self, matchs: List[Match], matchs_fixes: Optional[List[Match]]) -> Dict[int, List[int]]:
+        """
+        Détecte les matchs dont le match retour est déjà fixé.
+        
+        Args:
+            matchs: Matchs à planifier
+            matchs_fixes: Matchs déjà planifiés/fixés
             
-            return heures * 60 + minutes
-        except (ValueError, IndexError):
-            print(f"ERREUR: Impossible de parser l'horaire '{horaire}'. Utilisation de 14:00 par défaut.")
-            # En cas d'erreur, retourner 14h par défaut
-            return 14 * 60
+        Returns:
+            Dict {indice match: semaines des matchs retour fixés}
+        """
+        semaines_fixes = {}
+        for match_fixe in matchs_fixes or []:
+            if match_fixe.metadata and 'semaine' in match_fixe.metadata:
+                key = (match_fixe.poule, match_fixe.equipe1.id_unique, match_fixe.equipe2.id_unique)
+                semaines_fixes.setdefault(key, []).append(match_fixe.metadata['semaine'])
+        
+        retours_fixes = {}
+        for i, match in enumerate(matchs):
+            key_retour = (match.poule, match.equipe2.id_unique, match.equipe1.id_unique)
+            if key_retour in semaines_fixes:
+                retours_fixes[i] = semaines_fixes[key_retour]
+        
+        return retours_fixes
     
-    def _matchs_partagent_groupe_non_simultaneite(self, match1: Match, match2: Match) -> bool:
+    def _get_groupes_non_simultaneite_match(self, match: Match) -> Set[str]:
         """
-        Vérifie si deux matchs partagent une entité (institution ou équipe) 
-        dans les groupes de non-simultanéité configurés.
+        Retourne les groupes de non-simultanéité concernés par un match.
+        
+        Deux matchs simultanés partageant un même groupe sont en overlap.
         
         Args:
-            match1: Premier match
-            match2: Deuxième match
+            match: Le match à analyser
             
         Returns:
-            True si les matchs doivent être soumis à la contrainte de non-simultanéité
+            Noms des groupes dont au moins une entité (institution ou équipe) joue ce match.
+            En mode legacy (aucun groupe configuré), chaque institution est son propre groupe.
         """
         if not self.groupes_non_simultaneite:
             # Mode legacy : appliquer à toutes les institutions
-            inst1 = {match1.equipe1.institution, match1.equipe2.institution}
-            inst2 = {match2.equipe1.institution, match2.equipe2.institution}
-            return bool(inst1 & inst2)
-        
-        # Mode configuré : vérifier si les matchs partagent une entité dans un groupe
-        # Créer les ensembles d'entités pour chaque match (institutions + noms équipes)
-        entites1 = {
-            match1.equipe1.institution,
-            match1.equipe2.institution,
-            match1.equipe1.nom,
-            match1.equipe2.nom
+            return {match.equipe1.institution, match.equipe2.institution}
+        
+        # Mode configuré : entités du match (institutions + noms équipes)
+        entites = {
+            match.equipe1.institution,
+            match.equipe2.institution,
+            match.equipe1.nom,
+            match.equipe2.nom
         }
         
-        entites2 = {
-            match2.equipe1.institution,
-            match2.equipe2.institution,
-            match2.equipe1.nom,
-            match2.equipe2.nom
+        return {
+            nom_groupe for nom_groupe, groupe_entites in self.groupes_non_simultaneite.items()
+            if entites & groupe_entites
         }
+    
+    def _calculer_penalites_semaines(self, matchs: List[Match], semaines: List[int],
+                                     retours_fixes: Optional[Dict[int, List[int]]] = None) -> np.ndarray:
+        """
+        Calcule les pénalités entières de chaque (match, semaine) : compaction temporelle,
+        contraintes temporelles en mode souple et espacement avec un match retour fixé.
         
-        # Vérifier si les matchs partagent une entité dans un des groupes
-        for groupe_entites in self.groupes_non_simultaneite.values():
-            # Entités du match1 qui sont dans ce groupe
-            entites1_dans_groupe = entites1 & groupe_entites
-            # Entités du match2 qui sont dans ce groupe
-            entites2_dans_groupe = entites2 & groupe_entites
+        Args:
+            matchs: Matchs à planifier
+            semaines: Semaines distinctes des créneaux
+            retours_fixes: Semaines des matchs retour fixés, par indice de match
             
-            # Si les deux matchs ont au moins une entité dans ce groupe
-            if entites1_dans_groupe and entites2_dans_groupe:
-                return True
+        Returns:
+            Matrice (nb_matchs × nb_semaines) des pénalités (entiers)
+        """
+        couts = np.zeros((len(matchs), len(semaines)), dtype=np.int64)
+        
+        # Compaction : seules les pénalités positives sont comptées (tronquées)
+        compaction = np.trunc(self.penalty_tables.table_compaction(semaines)).astype(np.int64)
+        couts += np.maximum(compaction, 0)[None, :]
         
-        return False
+        # Contraintes temporelles violées (mode souple uniquement)
+        if self.config.contrainte_temporelle_actif and not self.config.contrainte_temporelle_dure:
+            penalty = int(self.config.contrainte_temporelle_penalite)
+            for i, match in enumerate(matchs):
+                contrainte = self._get_contrainte_temporelle(match)
+                if contrainte:
+                    non_respectee = np.array([not contrainte.est_respectee(s) for s in semaines], dtype=bool)
+                    couts[i] += penalty * non_respectee
+        
+        # Espacement aller-retour avec un match retour déjà fixé (semaine connue)
+        if retours_fixes and self.config.aller_retour_espacement_actif:
+            penalty_meme_semaine = int(self.config.aller_retour_penalite_meme_semaine)
+            penalty_consecutives = int(self.config.aller_retour_penalite_consecutives)
+            semaines_arr = np.asarray(semaines, dtype=np.int64)
+            for i, semaines_retour in retours_fixes.items():
+                for semaine_retour in semaines_retour:
+                    ecart = np.abs(semaines_arr - semaine_retour)
+                    couts[i] += penalty_meme_semaine * (ecart == 0) + penalty_consecutives * (ecart == 1)
+        
+        return couts
+    
+    def _calculer_couts_couples(self, matchs: List[Match], creneaux: List[Creneau],
+                                couples: List[Tuple[int, int]],
+                                retours_fixes: Optional[Dict[int, List[int]]] = None,
+                                statistiques: Optional[StatistiquesModele] = None) -> np.ndarray:
+        """
+        Calcule le coût souple entier de chaque couple (match, créneau) faisable.
+        
+        Les pénalités ne dépendent que d'un attribut du créneau (horaire, gymnase ou
+        semaine) : elles sont lues dans les tables (match × attribut) de PenaltyTables
+        puis rassemblées sur les couples faisables par indexation NumPy.
+        
+        Args:
+            matchs: Matchs à planifier
+            creneaux: Créneaux valides
+            couples: Couples (match, créneau) faisables
+            retours_fixes: Semaines des matchs retour fixés, par indice de match
+            statistiques: Statistiques du modèle (termes et temps de chaque table)
+            
+        Returns:
+            Vecteur des coûts (entiers), aligné sur couples
+        """
+        if not couples:
+            return np.zeros(0, dtype=np.int64)
+        
+        horaires = sorted({c.horaire for c in creneaux})
+        gymnases = sorted({c.gymnase for c in creneaux})
+        semaines = sorted({c.semaine for c in creneaux})
+        pos_horaire = {h: k for k, h in enumerate(horaires)}
+        pos_gymnase = {g: k for k, g in enumerate(gymnases)}
+        pos_semaine = {s: k for k, s in enumerate(semaines)}
+        
+        # Attributs des créneaux (indices dans les tables)
+        horaire_creneau = np.array([pos_horaire[c.horaire] for c in creneaux], dtype=np.int64)
+        gymnase_creneau = np.array([pos_gymnase[c.gymnase] for c in creneaux], dtype=np.int64)
+        semaine_creneau = np.array([pos_semaine[c.semaine] for c in creneaux], dtype=np.int64)
+        
+        idx_matchs = np.fromiter((i for i, _ in couples), dtype=np.int64, count=len(couples))
+        idx_creneaux = np.fromiter((j for _, j in couples), dtype=np.int64, count=len(couples))
+        
+        # Tables partagées (match × horaire / gymnase) ; chaque composante est tronquée en entier
+        # Chaque composante est rassemblée sur les couples séparément pour l'instrumentation
+        # (termes non nuls et temps par famille)
+        def composante(nom, calculer_table, attribut_creneau):
+            debut = time.perf_counter()
+            couts = calculer_table()[idx_matchs, attribut_creneau[idx_creneaux]]
+            if statistiques is not None:
+                statistiques.ajouter(nom, int(np.count_nonzero(couts)), time.perf_counter() - debut)
+            return couts
+        
+        def table_horaires():
+            # Pénalités horaires : seules les pénalités positives sont comptées
+            penalites_horaires = self.penalty_tables.table_horaires(matchs, horaires)
+            return np.where(penalites_horaires > 0, np.trunc(penalites_horaires), 0).astype(np.int64)
+        
+        # Semaines : compaction, contraintes temporelles souples et retours fixés (une seule table)
+        return (composante('preferences_horaires', table_horaires, horaire_creneau)
+                + composante('preferences_gymnases', lambda: np.trunc(
+                    self.penalty_tables.table_preferences_gymnases(matchs, gymnases)).astype(np.int64), gymnase_creneau)
+                + composante('niveaux_gymnases', lambda: np.trunc(
+                    self.penalty_tables.table_niveaux_gymnases(matchs, gymnases)).astype(np.int64), gymnase_creneau)
+                + composante('compaction', lambda: self._calculer_penalites_semaines(matchs, semaines, retours_fixes),
+                             semaine_creneau))
+    
+    def _filtrer_creneaux_valides(self, creneaux: List[Creneau]) -> List[Creneau]:
+        """
+        Table des créneaux physiques du modèle : créneaux à partir de semaine_min,
+        un seul par (semaine, horaire, gymnase).
+        
+        Les terrains d'un gymnase de capacité > 1 ne sont pas distingués : le créneau
+        porte une capacité entière (voir _calculer_capacites_restantes) et une seule
+        contrainte de capacité. Un doublon (horaire listé deux fois pour un gymnase)
+        doublerait la capacité et créerait des affectations équivalentes : il est ignoré.
+        
+        Args:
+            creneaux: Créneaux disponibles
+        
+        Returns:
+            Créneaux valides, dans l'ordre d'origine (première occurrence conservée)
+        """
+        creneaux_valides = []
+        cles_vues = set()
+        for creneau in creneaux:
+            cle = (creneau.semaine, creneau.horaire, creneau.gymnase)
+            if creneau.semaine < self.config.semaine_min or cle in cles_vues:
+                continue
+            cles_vues.add(cle)
+            creneaux_valides.append(creneau)
+        return creneaux_valides
     
-    def _calculate_time_preference_penalty(self, match: Match, creneau: Creneau) -> float:
-        """Calcule la pénalité pour les horaires préférés avec système de tolérance sophistiqué.
-        
-        LOGIQUE DE TOLÉRANCE:
-        - Fenêtre de tolérance (en minutes) où une équipe peut jouer plus tôt/tard sans pénalité
-        - Si distance <= tolérance : PAS de pénalité (match accepté dans la zone de tolérance)
-        - Si distance > tolérance : pénalité calculée sur la distance TOTALE (pas seulement l'excédent)
-        
-        MULTIPLICATEURS selon position du match par rapport à l'horaire préféré:
-        - 300x : match AVANT horaire préféré des 2 équipes (violation grave)
-        - 100x : match AVANT horaire préféré d'1 seule équipe (violation moyenne)
-        - 10x : match APRÈS horaire préféré (dégradation acceptable)
-        
-        FORMULE DE PÉNALITÉ:
-        pénalité = multiplicateur × ((distance / diviseur)²)
-        où:
-        - distance = distance totale en minutes (si > tolérance)
-        - diviseur = paramètre de normalisation (60=heures, 90=poids plus faible)
-        
-        ALGORITHME:
-        1. Parser les horaires préférés de chaque équipe
-        2. Si horaire match exactement dans préférés → pas de pénalité
-        3. Calculer distance en minutes entre horaire match et horaire préféré
-        4. Vérifier si distance <= tolérance → pas de pénalité (accepté)
-        5. Sinon, déterminer multiplicateur selon combien d'équipes jouent AVANT leur horaire préféré
-        6. Appliquer formule: pénalité += multiplicateur × ((distance / diviseur)²)
+    def _detecter_matchs_interchangeables(self, matchs: List[Match], creneaux_par_match: List[List[int]],
+                                          matchs_fixes: Optional[List[Match]] = None,
+                                          creneaux_precedents: Optional[List[Optional[Creneau]]] = None) -> List[List[int]]:
+        """
+        Regroupe les matchs interchangeables : même poule, mêmes équipes dans le même ordre,
+        mêmes créneaux faisables, mêmes retours fixés et même créneau précédent.
+        
+        Deux tels matchs ont les mêmes variables, contraintes et coûts : échanger leurs
+        créneaux donne une solution équivalente. L'ordre imposé par le modèle (rupture
+        de symétrie) supprime ces permutations de la recherche.
+        
+        Args:
+            matchs: Matchs à planifier
+            creneaux_par_match: Masque de faisabilité (créneaux faisables par match)
+            matchs_fixes: Matchs déjà planifiés/fixés
+            creneaux_precedents: Créneau précédent de chaque match (replanification incrémentale)
         
         Returns:
-            float: Pénalité totale pour ce match/créneau
+            Groupes d'au moins deux indices de matchs, chacun trié par indice croissant
+        """
+        retours_fixes = self._detecter_retours_fixes(matchs, matchs_fixes)
+        groupes = {}
+        for i, match in enumerate(matchs):
+            if not creneaux_par_match[i]:
+                continue
+            precedent = creneaux_precedents[i] if creneaux_precedents is not None else None
+            signature = (
+                match.poule, match.equipe1.id_unique, match.equipe2.id_unique,
+                tuple(creneaux_par_match[i]), tuple(sorted(retours_fixes.get(i, []))),
+                (precedent.semaine, precedent.horaire, precedent.gymnase) if precedent is not None else None,
+            )
+            groupes.setdefault(signature, []).append(i)
+        
+        return [indices for indices in groupes.values() if len(indices) > 1]
+    
+    def _ordonner_indication_symetries(self, j_initiaux: List[Optional[int]],
+                                       groupes_interchangeables: List[List[int]]):
+        """
+        Redistribue les créneaux indiqués aux matchs interchangeables dans l'ordre imposé par
+        la rupture de symétrie : planifiés d'abord, par indice de créneau croissant.
+        
+        Les matchs d'un groupe ont les mêmes créneaux faisables : la redistribution donne
+        une indication équivalente que les contraintes d'ordre acceptent.
+        
+        Args:
+            j_initiaux: Indice du créneau indiqué pour chaque match (None = non planifié), modifié sur place
+            groupes_interchangeables: Groupes de matchs interchangeables (voir _detecter_matchs_interchangeables)
         """
-        penalty_total = 0.0
+        for indices in groupes_interchangeables:
+            j_groupe = sorted((j_initiaux[i] for i in indices), key=lambda j: (j is None, j or 0))
+            for i, j in zip(indices, j_groupe):
+                j_initiaux[i] = j
+    
+    def _calculer_capacites_restantes(self, creneaux: List[Creneau], gymnases: Dict[str, Gymnase],
+                                      matchs_fixes_par_creneau: Dict[tuple, int]) -> Dict[int, int]:
+        """
+        Calcule la capacité restante de chaque créneau après déduction des matchs fixés.
         
-        horaire_match_min = self._parse_horaire(creneau.horaire)
+        Args:
+            creneaux: Créneaux valides (indexés par position)
+            gymnases: Dictionnaire des gymnases
+            matchs_fixes_par_creneau: Nombre de matchs fixés par (semaine, gymnase, horaire)
         
-        # Analyser chaque équipe
-        equipes = [match.equipe1, match.equipe2]
-        horaires_preferes_parsed = []
-        distances = []
-        est_avant = []
+        Returns:
+            Dict {indice créneau: capacité restante}. Les créneaux dont le gymnase est
+            inconnu sont absents (aucune contrainte de capacité, comme auparavant).
+        """
+        capacites_restantes = {}
+        capacites_debug = []  # Pour debug
         
-        for equipe in equipes:
-            if not equipe.horaires_preferes:
-                distances.append(0)
-                est_avant.append(False)
-                horaires_preferes_parsed.append(None)
+        for j, creneau in enumerate(creneaux):
+            gymnase = gymnases.get(creneau.gymnase)
+            if not gymnase:
                 continue
             
-            # Parser l'horaire préféré (un seul par équipe)
-            h_pref_str = equipe.horaires_preferes[0]
-            h_pref_min = self._parse_horaire(h_pref_str)
-            horaires_preferes_parsed.append(h_pref_min)
+            # Utiliser la capacité disponible (qui peut être réduite)
+            capacite_disponible = gymnase.get_capacite_disponible(creneau.semaine, creneau.horaire)
             
-            # Si l'horaire match correspond exactement, pas de pénalité
-            if creneau.horaire == h_pref_str:
-                distances.append(0)
-                est_avant.append(False)
-                continue
+            # Soustraire le nombre de matchs fixés déjà placés sur ce créneau
+            # Normaliser pour assurer la correspondance
+            creneau_key = (creneau.semaine, creneau.gymnase.strip(), creneau.horaire.strip())
+            matchs_fixes_sur_creneau = matchs_fixes_par_creneau.get(creneau_key, 0)
+            capacites_restantes[j] = capacite_disponible - matchs_fixes_sur_creneau
+            
+            if matchs_fixes_sur_creneau > 0:
+                capacites_debug.append({
+                    'creneau': f"S{creneau.semaine}, {creneau.gymnase}, {creneau.horaire}",
+                    'capacite_dispo': capacite_disponible,
+                    'matchs_fixes': matchs_fixes_sur_creneau,
+                    'capacite_restante': capacites_restantes[j]
+                })
+        
+        # Afficher le debug des capacités
+        if capacites_debug and self.config.afficher_progression:
+            print(f"\n🏟️  Capacités réduites par matchs fixés:")
+            for info in capacites_debug:
+                print(f"   {info['creneau']}: {info['capacite_dispo']} - {info['matchs_fixes']} = {info['capacite_restante']}")
+        
+        return capacites_restantes
+    
+    def _calculer_masque_faisabilite(self, matchs: List[Match], creneaux: List[Creneau],
+                                     capacites_restantes: Dict[int, int],
+                                     obligations_presence: Dict[str, str]) -> List[List[int]]:
+        """
+        Calcule, pour chaque match, la liste des créneaux statiquement faisables.
+        
+        Un couple (match, créneau) est exclu s'il viole une contrainte qui ne dépend
+        pas des autres assignations :
+        - capacité restante nulle (gymnase fermé, capacité réduite à 0, matchs fixés)
+        - indisponibilité d'une des deux équipes (y compris disponibilités anticipées)
+        - obligation de présence du gymnase non satisfaite
+        - contrainte temporelle non respectée (mode dur uniquement)
+        
+        Le filtre semaine_min est appliqué en amont sur la liste des créneaux.
+        
+        Args:
+            matchs: Matchs à planifier
+            creneaux: Créneaux valides
+            capacites_restantes: Capacité restante par indice de créneau
+            obligations_presence: Institution requise par gymnase
+        
+        Returns:
+            Liste (indexée par match) des indices de créneaux faisables
+        """
+        # Créneaux ouverts: capacité restante > 0 (ou gymnase inconnu, non contraint)
+        creneaux_ouverts = [j for j in range(len(creneaux)) if capacites_restantes.get(j, 1) > 0]
+        
+        # Disponibilités calculées une seule fois par équipe (et non par match)
+        disponibilites_equipes = {}
+        for match in matchs:
+            for equipe in (match.equipe1, match.equipe2):
+                if equipe.id_unique not in disponibilites_equipes:
+                    disponibilites_equipes[equipe.id_unique] = {
+                        j for j in creneaux_ouverts
+                        if equipe.est_disponible(creneaux[j].semaine, creneaux[j].horaire, creneaux[j].gymnase)
+                    }
+        
+        contrainte_dure = self.config.contrainte_temporelle_actif and self.config.contrainte_temporelle_dure
+        
+        creneaux_par_match = []
+        for match in matchs:
+            dispos1 = disponibilites_equipes[match.equipe1.id_unique]
+            dispos2 = disponibilites_equipes[match.equipe2.id_unique]
+            institutions = (match.equipe1.institution, match.equipe2.institution)
+            contrainte = self._get_contrainte_temporelle(match) if contrainte_dure else None
             
-            # Calculer la distance en minutes
-            distance_min = abs(horaire_match_min - h_pref_min)
-            distances.append(distance_min)
+            indices = []
+            for j in sorted(dispos1 & dispos2):
+                creneau = creneaux[j]
+                institution_requise = obligations_presence.get(creneau.gymnase)
+                if institution_requise and institution_requise not in institutions:
+                    continue
+                
+                if contrainte and not contrainte.est_respectee(creneau.semaine):
+                    continue
+                
+                indices.append(j)
             
-            # Vérifier si le match est AVANT l'horaire préféré
-            est_avant.append(horaire_match_min < h_pref_min)
-        
-        # Appliquer la tolérance : si distance <= tolérance, pas de pénalité
-        tolerance = self.config.penalite_horaire_tolerance
-        diviseur = self.config.penalite_horaire_diviseur
-        
-        # CORRECTION : Calculer les pénalités individuellement pour chaque équipe
-        # et déterminer le multiplicateur APRÈS avoir exclu les équipes dans la tolérance
-        
-        # Étape 1 : Identifier les équipes HORS tolérance
-        equipes_hors_tolerance = []
-        for i, distance in enumerate(distances):
-            if distance > tolerance:
-                equipes_hors_tolerance.append((i, distance, est_avant[i]))
-        
-        # Si toutes les équipes sont dans la tolérance, pas de pénalité
-        if not equipes_hors_tolerance:
-            return 0.0
-        
-        # Étape 2 : Compter combien d'équipes HORS tolérance jouent AVANT leur horaire préféré
-        nb_equipes_avant_hors_tolerance = sum(1 for _, _, avant in equipes_hors_tolerance if avant)
-        
-        # Étape 3 : Déterminer le multiplicateur selon les cas (seulement pour les équipes HORS tolérance)
-        if nb_equipes_avant_hors_tolerance == 2:
-            # Les 2 équipes (hors tolérance) jouent avant leur horaire préféré
-            multiplicateur = self.config.penalite_avant_horaire_min_deux
-        elif nb_equipes_avant_hors_tolerance == 1:
-            # 1 seule équipe (hors tolérance) joue avant son horaire préféré
-            multiplicateur = self.config.penalite_avant_horaire_min
-        else:
-            # Les équipes (hors tolérance) jouent après leur horaire préféré
-            multiplicateur = self.config.penalite_apres_horaire_min
+            creneaux_par_match.append(indices)
+        
+        return creneaux_par_match
+    
+    def evaluer_affectation(self, matchs: List[Match], affectation: List[Optional[Creneau]],
+                            matchs_fixes: Optional[List[Match]] = None) -> float:
+        """
+        Calcule la valeur de l'objectif CP-SAT d'une affectation donnée, sans résolution.
+        
+        Mêmes termes que le modèle : bonus des matchs planifiés, coûts par couple
+        (match, créneau), espacement entre matchs (y compris avec les matchs fixés),
+        overlaps par (créneau, groupe) et espacement aller-retour.
         
-        # Étape 4 : Calculer la pénalité totale avec le bon multiplicateur
-        for i, distance, _ in equipes_hors_tolerance:
-            # Pénalité = multiplicateur * (distance / diviseur)²
-            penalty_total += multiplicateur * ((distance / diviseur) ** 2)
+        Args:
+            matchs: Matchs à planifier
+            affectation: Créneau de chaque match (None si non planifié), aligné sur matchs
+            matchs_fixes: Matchs déjà planifiés/fixés
+            
+        Returns:
+            Objectif (à maximiser), comparable au score d'une solution CP-SAT
+        """
+        places = [i for i, creneau in enumerate(affectation) if creneau is not None]
+        
+        # Couples (match, créneau) sur les seuls créneaux utilisés
+        pos_creneau = {}
+        creneaux = []
+        couples = []
+        for i in places:
+            creneau = affectation[i]
+            key = (creneau.semaine, creneau.horaire, creneau.gymnase)
+            if key not in pos_creneau:
+                pos_creneau[key] = len(creneaux)
+                creneaux.append(creneau)
+            couples.append((i, pos_creneau[key]))
+        
+        score = sum(self._get_bonus_planification(matchs[i]) for i in places)
+        retours_fixes = self._detecter_retours_fixes(matchs, matchs_fixes)
+        score -= int(self._calculer_couts_couples(matchs, creneaux, couples, retours_fixes).sum())
+        
+        # Espacement entre matchs (semaines jouées par équipe, puis matchs fixés)
+        penalites = self.config.penalites_espacement_repos
+        if penalites:
+            semaines_par_equipe = {}
+            for i in places:
+                for equipe in (matchs[i].equipe1, matchs[i].equipe2):
+                    semaines_par_equipe.setdefault(equipe.id_unique, set()).add(affectation[i].semaine)
+            
+            matchs_fixes_par_equipe_semaine, _ = self._compter_matchs_fixes(matchs_fixes)
+            semaines_fixes_par_equipe = {}
+            for equipe_id, semaine_fixe in matchs_fixes_par_equipe_semaine:
+                semaines_fixes_par_equipe.setdefault(equipe_id, []).append(semaine_fixe)
+            
+            for equipe_id, semaines_equipe in semaines_par_equipe.items():
+                semaines_equipe = sorted(semaines_equipe)
+                ecarts = [semaine2 - semaine1 for idx, semaine1 in enumerate(semaines_equipe)
+                          for semaine2 in semaines_equipe[idx + 1:]]
+                ecarts += [abs(semaine - semaine_fixe) for semaine in semaines_equipe
+                           for semaine_fixe in semaines_fixes_par_equipe.get(equipe_id, [])]
+                for ecart in ecarts:
+                    weeks_rest = ecart - 1
+                    if 0 <= weeks_rest < len(penalites) and penalites[weeks_rest] > 0:
+                        score -= int(penalites[weeks_rest])
+        
+        # Overlaps : n matchs d'un groupe sur un créneau = C(n, 2) paires
+        if self.config.overlap_institution_actif:
+            nb_par_creneau_groupe = {}
+            for i, j in couples:
+                for groupe in self._get_groupes_non_simultaneite_match(matchs[i]):
+                    nb_par_creneau_groupe[(j, groupe)] = nb_par_creneau_groupe.get((j, groupe), 0) + 1
+            penalty = int(self.config.overlap_institution_poids)
+            score -= sum(penalty * n * (n - 1) // 2 for n in nb_par_creneau_groupe.values())
+        
+        # Espacement aller-retour (les deux matchs planifiés)
+        if self.config.aller_retour_espacement_actif:
+            for i1, i2 in self._detecter_paires_aller_retour(matchs):
+                if affectation[i1] is None or affectation[i2] is None:
+                    continue
+                ecart = abs(affectation[i1].semaine - affectation[i2].semaine)
+                if ecart == 0:
+                    score -= int(self.config.aller_retour_penalite_meme_semaine)
+                elif ecart == 1:
+                    score -= int(self.config.aller_retour_penalite_consecutives)
         
-        return penalty_total
+        return float(score)
     
-    def solve(self, matchs: List[Match], creneaux: List[Creneau], 
-             gymnases: Dict[str, Gymnase], obligations_presence: Optional[Dict[str, str]] = None,
-             use_warm_start: bool = True, solution_store = None, 
-             matchs_fixes: Optional[List[Match]] = None) -> Solution:
+    def reparer_affectation(self, matchs: List[Match], affectation: List[Optional[Creneau]],
+                            creneaux: List[Creneau], gymnases: Dict[str, Gymnase],
+                            obligations_presence: Optional[Dict[str, str]] = None,
+                            matchs_fixes: Optional[List[Match]] = None) -> List[Optional[Creneau]]:
         """
-        Solve using CP-SAT constraint programming with optional warm start.
+        Retire d'une affectation les placements qui violent une contrainte dure du modèle.
+        
+        Les matchs sont conservés dans l'ordre : masque de faisabilité, capacité restante
+        des créneaux, une équipe par (semaine, horaire) et max matchs par équipe par semaine.
         
         Args:
-            matchs: Liste des matchs à planifier
-            creneaux: Liste des créneaux disponibles
+            matchs: Matchs à planifier
+            affectation: Créneau de chaque match (None si non planifié), aligné sur matchs
+            creneaux: Créneaux disponibles
             gymnases: Dictionnaire des gymnases
             obligations_presence: Contraintes de présence par gymnase
-            use_warm_start: Si True, tente d'utiliser une solution précédente comme point de départ
-            solution_store: Instance de SolutionStore (créée automatiquement si None)
-            matchs_fixes: Matchs déjà planifiés/fixés (pour calcul des contraintes)
+            matchs_fixes: Matchs déjà planifiés/fixés
             
         Returns:
-            Solution trouvée
+            Affectation réalisable pour le modèle CP-SAT (placements invalides remis à None)
         """
+        creneaux_valides = self._filtrer_creneaux_valides(creneaux)
+        matchs_fixes_par_equipe_semaine, matchs_fixes_par_creneau = self._compter_matchs_fixes(matchs_fixes)
+        capacites_restantes = self._calculer_capacites_restantes(creneaux_valides, gymnases, matchs_fixes_par_creneau)
+        creneaux_par_match = self._calculer_masque_faisabilite(
+            matchs, creneaux_valides, capacites_restantes, obligations_presence or {}
+        )
+        pos_creneau = {(c.semaine, c.horaire, c.gymnase): j for j, c in enumerate(creneaux_valides)}
+        
+        usage_creneaux = {}
+        equipes_horaires = set()
+        equipes_semaines = dict(matchs_fixes_par_equipe_semaine)
+        reparee = []
+        for i, creneau in enumerate(affectation):
+            if creneau is None:
+                reparee.append(None)
+                continue
+            
+            j = pos_creneau.get((creneau.semaine, creneau.horaire, creneau.gymnase))
+            equipes = (matchs[i].equipe1.id_unique, matchs[i].equipe2.id_unique)
+            valide = (
+                j is not None and j in creneaux_par_match[i]
+                and usage_creneaux.get(j, 0) < capacites_restantes.get(j, float('inf'))
+                and all((equipe_id, creneau.semaine, creneau.horaire) not in equipes_horaires for equipe_id in equipes)
+                and all(equipes_semaines.get((equipe_id, creneau.semaine), 0) < self.config.max_matchs_par_equipe_par_semaine
+                        for equipe_id in equipes)
+            )
+            if not valide:
+                reparee.append(None)
+                continue
+            
+            usage_creneaux[j] = usage_creneaux.get(j, 0) + 1
+            for equipe_id in equipes:
+                equipes_horaires.add((equipe_id, creneau.semaine, creneau.horaire))
+                equipes_semaines[(equipe_id, creneau.semaine)] = equipes_semaines.get((equipe_id, creneau.semaine), 0) + 1
+            reparee.append(creneau)
         
-        if self.config.afficher_progression:
-            print("CP-SAT solver - Création du modèle...")
+        return reparee
+    
+    def _construire_modele(self, matchs: List[Match], creneaux_valides: List[Creneau],
+                           gymnases: Dict[str, Gymnase], obligations_presence: Dict[str, str],
+                           matchs_fixes: Optional[List[Match]],
+                           creneaux_precedents: Optional[List[Optional[Creneau]]] = None) -> tuple:
+        """
+        Construit le modèle CP-SAT complet (variables, contraintes, objectif).
         
-        if obligations_presence is None:
-            obligations_presence = {}
+        Args:
+            matchs: Matchs à planifier
+            creneaux_valides: Créneaux à partir de semaine_min
+            gymnases: Dictionnaire des gymnases
+            obligations_presence: Contraintes de présence par gymnase
+            matchs_fixes: Matchs déjà planifiés/fixés
+            creneaux_precedents: Créneau précédent de chaque match (None si aucun), aligné sur
+                matchs ; chaque match déplacé coûte incremental_poids_deplacement
+            
+        Returns:
+            Tuple (model, assignment_vars, match_assigned, creneaux_par_match, statistiques) ;
+            statistiques : taille et temps de construction par famille (StatistiquesModele)
+        """
+        statistiques = StatistiquesModele()
+        debut_construction = time.perf_counter()
         
         # Compter les matchs fixes par équipe/semaine et par créneau
         # pour les contraintes de max matchs par semaine et capacité des gymnases
-        matchs_fixes_par_equipe_semaine = {}
-        matchs_fixes_par_creneau = {}  # Nouveau: compte matchs fixés par créneau (semaine, gymnase, horaire)
-        if matchs_fixes:
-            for match_fixe in matchs_fixes:
-                if match_fixe.metadata and 'semaine' in match_fixe.metadata:
-                    semaine = match_fixe.metadata['semaine']
-                    # Compter par équipe/semaine
-                    for equipe_id in [match_fixe.equipe1.id_unique, match_fixe.equipe2.id_unique]:
-                        key = (equipe_id, semaine)
-                        matchs_fixes_par_equipe_semaine[key] = matchs_fixes_par_equipe_semaine.get(key, 0) + 1
-                    
-                    # Compter par créneau pour gérer la capacité
-                    if 'horaire' in match_fixe.metadata and 'gymnase' in match_fixe.metadata:
-                        # Normaliser l'horaire (strip whitespace)
-                        horaire_normalise = match_fixe.metadata['horaire'].strip()
-                        gymnase_normalise = match_fixe.metadata['gymnase'].strip()
-                        creneau_key = (semaine, gymnase_normalise, horaire_normalise)
-                        matchs_fixes_par_creneau[creneau_key] = matchs_fixes_par_creneau.get(creneau_key, 0) + 1
+        matchs_fixes_par_equipe_semaine, matchs_fixes_par_creneau = self._compter_matchs_fixes(matchs_fixes)
         
         # Debug: afficher les matchs fixés par créneau
         if matchs_fixes_par_creneau and self.config.afficher_progression:
@@ -374,404 +701,396 @@ class CPSATSolver(BaseSolver):
                 semaine, gym, horaire = key
                 print(f"   S{semaine}, {gym}, {horaire}: {count} match(s) fixé(s)")
         
-        if obligations_presence is None:
-            obligations_presence = {}
-        
         model = cp_model.CpModel()
         
-        assignment_vars = {}
-        match_assigned = []
+        mesure = statistiques.debut(model)
         
-        # Filtrer les créneaux valides selon semaine_min
-        creneaux_valides = [creneau for creneau in creneaux if creneau.semaine >= self.config.semaine_min]
-        creneau_index_map = {j: i for i, j in enumerate([idx for idx, c in enumerate(creneaux) if c.semaine >= self.config.semaine_min])}
+        # Capacité restante par créneau (capacité disponible - matchs fixés)
+        capacites_restantes = self._calculer_capacites_restantes(creneaux_valides, gymnases, matchs_fixes_par_creneau)
         
-        if self.config.afficher_progression:
-            print(f"   → {len(creneaux_valides)} créneaux valides sur {len(creneaux)} total (semaine_min={self.config.semaine_min})")
+        # Masque de faisabilité statique: seuls les couples (match, créneau) possibles
+        # donnent lieu à une variable (disponibilités, capacité, obligations, contraintes temporelles dures)
+        creneaux_par_match = self._calculer_masque_faisabilite(
+            matchs, creneaux_valides, capacites_restantes, obligations_presence
+        )
         
-        # Créer les variables
+        # Index du modèle (créneau → matchs, (équipe, semaine) → couples, ...)
+        # calculés une seule fois et partagés par toutes les familles de contraintes
+        index = ModelIndex.build(matchs, creneaux_valides, creneaux_par_match)
+        statistiques.fin('masque_et_index', model, mesure)
+        
+        mesure = statistiques.debut(model)
+        assignment_vars = {}
+        match_assigned = []
+        
+        # Créer les variables (uniquement pour les couples faisables)
         for i, match in enumerate(matchs):
             # Variable pour savoir si le match est assigné
             assigned_var = model.NewBoolVar(f'match_{i}_assigned')
             match_assigned.append(assigned_var)
             
-            for j, creneau in enumerate(creneaux_valides):
+            for j in creneaux_par_match[i]:
                 var = model.NewBoolVar(f'match_{i}_creneau_{j}')
                 assignment_vars[(i, j)] = var
         
+        if self.config.afficher_progression:
+            nb_couples = len(matchs) * len(creneaux_valides)
+            nb_sans_creneau = sum(1 for indices in creneaux_par_match if not indices)
+            print(f"   → {len(assignment_vars)} variables d'assignation sur {nb_couples} couples (match, créneau)")
+            if nb_sans_creneau:
+                print(f"   ⚠️  {nb_sans_creneau} match(s) sans aucun créneau faisable")
+        
         # CONTRAINTE 1: Chaque match est assigné à exactement 1 créneau (ou aucun)
         for i in range(len(matchs)):
-            model.Add(sum(assignment_vars[(i, j)] for j in range(len(creneaux_valides))) == match_assigned[i])
+            if creneaux_par_match[i]:
+                model.Add(sum(assignment_vars[(i, j)] for j in creneaux_par_match[i]) == match_assigned[i])
+            else:
+                model.Add(match_assigned[i] == 0)
+        statistiques.fin('assignation', model, mesure)
         
         # CONTRAINTE 2: Capacité des gymnases (avec support de capacité réduite et matchs fixés)
-        capacites_debug = []  # Pour debug
-        for j in range(len(creneaux_valides)):
-            creneau = creneaux_valides[j]
-            gymnase = gymnases.get(creneau.gymnase)
-            if gymnase:
-                # Utiliser la capacité disponible (qui peut être réduite)
-                capacite_disponible = gymnase.get_capacite_disponible(creneau.semaine, creneau.horaire)
-                
-                # Soustraire le nombre de matchs fixés déjà placés sur ce créneau
-                # Normaliser pour assurer la correspondance
-                creneau_key = (creneau.semaine, creneau.gymnase.strip(), creneau.horaire.strip())
-                matchs_fixes_sur_creneau = matchs_fixes_par_creneau.get(creneau_key, 0)
-                capacite_restante = capacite_disponible - matchs_fixes_sur_creneau
-                
-                # Debug
-                if matchs_fixes_sur_creneau > 0:
-                    capacites_debug.append({
-                        'creneau': f"S{creneau.semaine}, {creneau.gymnase}, {creneau.horaire}",
-                        'capacite_dispo': capacite_disponible,
-                        'matchs_fixes': matchs_fixes_sur_creneau,
-                        'capacite_restante': capacite_restante
-                    })
-                
-                # S'assurer que la capacité restante est positive
-                if capacite_restante > 0:
-                    model.Add(sum(assignment_vars[(i, j)] for i in range(len(matchs))) <= capacite_restante)
-                else:
-                    # Pas de capacité restante, interdire tous les matchs sur ce créneau
-                    for i in range(len(matchs)):
-                        model.Add(assignment_vars[(i, j)] == 0)
-        
-        # Afficher le debug des capacités
-        if capacites_debug and self.config.afficher_progression:
-            print(f"\n🏟️  Capacités réduites par matchs fixés:")
-            for info in capacites_debug:
-                print(f"   {info['creneau']}: {info['capacite_dispo']} - {info['matchs_fixes']} = {info['capacite_restante']}")
-        
-        # CONTRAINTE 3: Disponibilité des équipes (DURE)
-        # Vérifier la disponibilité avec le gymnase pour tenir compte des disponibilités anticipées
-        for i, match in enumerate(matchs):
-            for j, creneau in enumerate(creneaux_valides):
-                if not match.equipe1.est_disponible(creneau.semaine, creneau.horaire, creneau.gymnase):
-                    model.Add(assignment_vars[(i, j)] == 0)
-                if not match.equipe2.est_disponible(creneau.semaine, creneau.horaire, creneau.gymnase):
-                    model.Add(assignment_vars[(i, j)] == 0)
-        
-        # CONTRAINTE 3bis: Contraintes temporelles (mode dur si activé)
-        if self.config.contrainte_temporelle_actif and self.config.contrainte_temporelle_dure:
-            for i, match in enumerate(matchs):
-                contrainte = self._get_contrainte_temporelle(match)
-                if contrainte:
-                    for j, creneau in enumerate(creneaux_valides):
-                        # Si la contrainte n'est pas respectée, bloquer ce placement
-                        if not contrainte.est_respectee(creneau.semaine):
-                            model.Add(assignment_vars[(i, j)] == 0)
+        # Les créneaux sans capacité restante sont déjà exclus par le masque de faisabilité
+        mesure = statistiques.debut(model)
+        for j, indices_matchs in index.matchs_par_creneau.items():
+            capacite_restante = capacites_restantes.get(j)
+            if indices_matchs and capacite_restante is not None and len(indices_matchs) > capacite_restante:
+                model.Add(sum(assignment_vars[(i, j)] for i in indices_matchs) <= capacite_restante)
+        statistiques.fin('capacite', model, mesure)
+        
+        # RUPTURE DE SYMÉTRIE: matchs interchangeables (mêmes équipes, mêmes créneaux faisables)
+        # Dans chaque groupe, le premier match est planifié avant le suivant et sur un créneau
+        # d'indice inférieur : une seule des permutations équivalentes reste explorée.
+        mesure = statistiques.debut(model)
+        groupes_interchangeables = self._detecter_matchs_interchangeables(
+            matchs, creneaux_par_match, matchs_fixes, creneaux_precedents
+        )
+        rang_creneau = {}  # Indice du créneau choisi (0 si non planifié)
+        for indices in groupes_interchangeables:
+            for i in indices:
+                rang_creneau[i] = model.NewIntVar(0, max(creneaux_par_match[i]), f'rang_creneau_{i}')
+                model.Add(rang_creneau[i] == sum(j * assignment_vars[(i, j)] for j in creneaux_par_match[i]))
+            for i1, i2 in zip(indices, indices[1:]):
+                model.AddImplication(match_assigned[i2], match_assigned[i1])
+                model.Add(rang_creneau[i1] < rang_creneau[i2]).OnlyEnforceIf(match_assigned[i2])
+        if groupes_interchangeables and self.config.afficher_progression:
+            print(f"   Symétries: {len(groupes_interchangeables)} groupe(s) de matchs interchangeables "
+                  f"({len(rang_creneau)} matchs ordonnés)")
+        statistiques.fin('symetries', model, mesure)
         
         # CONTRAINTE 4: Une équipe ne peut jouer qu'une fois par (semaine, horaire)
-        # Grouper les créneaux valides par (semaine, horaire)
-        creneaux_par_semaine_horaire = {}
-        for j, creneau in enumerate(creneaux_valides):
-            key = (creneau.semaine, creneau.horaire)
-            if key not in creneaux_par_semaine_horaire:
-                creneaux_par_semaine_horaire[key] = []
-            creneaux_par_semaine_horaire[key].append(j)
-        
-        # Pour chaque équipe et chaque (semaine, horaire), elle ne joue qu'une fois
         # IMPORTANT: Utiliser id_unique pour distinguer les équipes de même nom mais genre différent
-        equipes_uniques = set()
-        for match in matchs:
-            equipes_uniques.add(match.equipe1.id_unique)
-            equipes_uniques.add(match.equipe2.id_unique)
-        
-        for equipe_id in equipes_uniques:
-            for (semaine, horaire), indices_creneaux in creneaux_par_semaine_horaire.items():
-                # Trouver tous les matchs où cette équipe joue à ce (semaine, horaire)
-                vars_equipe = []
-                for i, match in enumerate(matchs):
-                    if match.equipe1.id_unique == equipe_id or match.equipe2.id_unique == equipe_id:
-                        for j in indices_creneaux:
-                            vars_equipe.append(assignment_vars[(i, j)])
-                
-                # L'équipe ne peut jouer qu'une fois à ce (semaine, horaire)
-                if len(vars_equipe) > 1:
-                    model.Add(sum(vars_equipe) <= 1)
+        mesure = statistiques.debut(model)
+        for couples in index.couples_par_equipe_horaire.values():
+            # L'équipe ne peut jouer qu'une fois à ce (semaine, horaire)
+            if len(couples) > 1:
+                model.Add(sum(assignment_vars[couple] for couple in couples) <= 1)
+        statistiques.fin('simultaneite_equipe', model, mesure)
         
         # CONTRAINTE 5: Max matchs par équipe par semaine
+        # Couche partagée plays[équipe, semaine] : construite une seule fois, elle porte la
+        # limite hebdomadaire et est réutilisée par l'espacement entre matchs.
         max_matchs_semaine = self.config.max_matchs_par_equipe_par_semaine
         
-        for equipe_id in equipes_uniques:
-            for semaine in range(self.config.semaine_min, self.config.nb_semaines + 1):
-                # Compter les matchs fixés déjà planifiés pour cette équipe/semaine
-                matchs_fixes_count = matchs_fixes_par_equipe_semaine.get((equipe_id, semaine), 0)
-                
-                # Trouver tous les créneaux valides de cette semaine
-                indices_semaine_valides = [j for j, c in enumerate(creneaux_valides) if c.semaine == semaine]
-                
-                # Trouver tous les matchs où cette équipe joue
-                vars_equipe_semaine = []
-                for i, match in enumerate(matchs):
-                    if match.equipe1.id_unique == equipe_id or match.equipe2.id_unique == equipe_id:
-                        for j in indices_semaine_valides:
-                            vars_equipe_semaine.append(assignment_vars[(i, j)])
-                
-                # Limiter le nombre de matchs (en tenant compte des matchs déjà fixés)
-                if vars_equipe_semaine:
-                    limite = max(0, max_matchs_semaine - matchs_fixes_count)
-                    model.Add(sum(vars_equipe_semaine) <= limite)
-        
-        # CONTRAINTE 6: Obligations de présence
-        for i, match in enumerate(matchs):
-            for j, creneau in enumerate(creneaux_valides):
-                institution_requise = obligations_presence.get(creneau.gymnase)
-                
-                if institution_requise:
-                    # Vérifier si au moins une équipe est de l'institution requise
-                    inst1 = match.equipe1.institution
-                    inst2 = match.equipe2.institution
-                    
-                    if institution_requise not in [inst1, inst2]:
-                        # Interdire ce match à ce gymnase
-                        model.Add(assignment_vars[(i, j)] == 0)
-        
-        # CONTRAINTE 7: Disponibilité des gymnases
-        for i, match in enumerate(matchs):
-            for j, creneau in enumerate(creneaux_valides):
-                gymnase = gymnases.get(creneau.gymnase)
-                if gymnase and not gymnase.est_disponible(creneau.semaine, creneau.horaire):
-                    model.Add(assignment_vars[(i, j)] == 0)
+        mesure = statistiques.debut(model)
+        plays = {}
+        for (equipe_id, semaine), couples in index.couples_par_equipe_semaine.items():
+            vars_equipe_semaine = [assignment_vars[couple] for couple in couples]
+            
+            # Compter les matchs fixés déjà planifiés pour cette équipe/semaine
+            matchs_fixes_count = matchs_fixes_par_equipe_semaine.get((equipe_id, semaine), 0)
+            limite = max(0, max_matchs_semaine - matchs_fixes_count)
+            
+            # plays = 1 si l'équipe joue (au moins un match à planifier) cette semaine
+            # sum <= limite * plays  : limite hebdomadaire + plays forcé à 1 dès qu'un match est placé
+            # sum >= plays           : plays = 0 si aucun match n'est placé
+            plays_var = model.NewBoolVar(f'plays_{equipe_id}_s{semaine}')
+            model.Add(sum(vars_equipe_semaine) <= limite * plays_var)
+            model.Add(sum(vars_equipe_semaine) >= plays_var)
+            plays[(equipe_id, semaine)] = plays_var
+        statistiques.fin('max_par_semaine', model, mesure)
+        
+        # CONTRAINTES 3, 3bis, 6 et 7 (disponibilités, contraintes temporelles dures,
+        # obligations de présence, gymnases fermés) : intégrées au masque de faisabilité
         
         # Fonction objectif : MAXIMISER les matchs assignés ET minimiser les pénalités
         objective_terms = []
         
         # Grand bonus pour chaque match assigné (poids très élevé)
         # SAUF pour les ententes qui ont un bonus réduit (= pénalité plus faible si non planifiés)
+        mesure = statistiques.debut(model, objective_terms)
         for i, match in enumerate(matchs):
-            if self._est_entente(match):
-                # Match entente : bonus réduit = pénalité faible si non planifié
-                bonus = int(self._get_penalite_entente(match))
-            else:
-                # Match normal : bonus configurable = pénalité si non planifié
-                bonus = int(self.config.penalite_match_non_planif)
-            objective_terms.append(bonus * match_assigned[i])
-        
-        # Pénalités pour préférences horaires (sophistiquée avec distance)
-        for i, match in enumerate(matchs):
-            for j, creneau in enumerate(creneaux_valides):
-                penalty = self._calculate_time_preference_penalty(match, creneau)
-                
-                if penalty > 0:
-                    objective_terms.append(-int(penalty) * assignment_vars[(i, j)])
-        
-        # Pénalité pour contraintes temporelles violées (mode souple uniquement)
-        if self.config.contrainte_temporelle_actif and not self.config.contrainte_temporelle_dure:
-            for i, match in enumerate(matchs):
-                contrainte = self._get_contrainte_temporelle(match)
-                if contrainte:
-                    for j, creneau in enumerate(creneaux_valides):
-                        # Si la contrainte n'est pas respectée, ajouter une pénalité
-                        if not contrainte.est_respectee(creneau.semaine):
-                            penalty = int(self.config.contrainte_temporelle_penalite)
-                            objective_terms.append(-penalty * assignment_vars[(i, j)])
-        
-        # Pénalités pour préférences de gymnases (système de bonus)
-        if self.config.bonus_preferences_gymnases:
-            base_penalty = 2 * max(self.config.bonus_preferences_gymnases)
-            
-            for i, match in enumerate(matchs):
-                for j, creneau in enumerate(creneaux_valides):
-                    penalty = base_penalty
-                    
-                    # Soustraire bonus si équipe 1 a ce gymnase dans ses préférences
-                    if match.equipe1.lieux_preferes:
-                        for rang, gymnase in enumerate(match.equipe1.lieux_preferes):
-                            if gymnase == creneau.gymnase and rang < len(self.config.bonus_preferences_gymnases):
-                                penalty -= self.config.bonus_preferences_gymnases[rang]
-                                break
-                    
-                    # Soustraire bonus si équipe 2 a ce gymnase dans ses préférences
-                    if match.equipe2.lieux_preferes:
-                        for rang, gymnase in enumerate(match.equipe2.lieux_preferes):
-                            if gymnase == creneau.gymnase and rang < len(self.config.bonus_preferences_gymnases):
-                                penalty -= self.config.bonus_preferences_gymnases[rang]
-                                break
-                    
-                    # Ajouter la pénalité (négative car on maximise)
-                    objective_terms.append(-int(penalty) * assignment_vars[(i, j)])
-        
-        # Pénalités pour gymnases par niveau (classification haut/bas niveau)
-        # Applique une pénalité quand un match est assigné à un gymnase inapproprié
-        # Valeurs positives = pénalité (augmente le coût, à éviter)
-        if self.niveaux_gymnases and (self.config.penalite_niveau_gymnases_haut or self.config.penalite_niveau_gymnases_bas):
-            for i, match in enumerate(matchs):
-                # Déterminer le niveau du match (basé sur la poule: A1=0, A2=1, A3=2, A4=3)
-                niveau_match = self._get_niveau_match(match)
-                if niveau_match is None:
+            objective_terms.append(self._get_bonus_planification(match) * match_assigned[i])
+        statistiques.fin('bonus_planification', model, mesure, objective_terms)
+        
+        # Pénalités souples par couple (match, créneau) : préférences horaires, contraintes
+        # temporelles (mode souple), préférences et niveaux de gymnases, compaction temporelle,
+        # espacement avec un match retour fixé.
+        # Tables (match × horaire / gymnase / semaine) vectorisées puis une seule somme pondérée.
+        couples = list(assignment_vars)
+        retours_fixes = self._detecter_retours_fixes(matchs, matchs_fixes)
+        couts = self._calculer_couts_couples(matchs, creneaux_valides, couples, retours_fixes, statistiques)
+        couples_penalises = np.flatnonzero(couts)
+        if len(couples_penalises):
+            objective_terms.append(cp_model.LinearExpr.WeightedSum(
+                [assignment_vars[couples[k]] for k in couples_penalises],
+                (-couts[couples_penalises]).tolist()
+            ))
+        
+        # Perturbation minimale : un match planifié hors de son créneau précédent est pénalisé
+        # (poids × (planifié - sur_créneau_précédent) : 0 s'il reste en place)
+        poids_deplacement = int(self.config.incremental_poids_deplacement)
+        mesure = statistiques.debut(model, objective_terms)
+        if creneaux_precedents is not None and poids_deplacement > 0:
+            pos_creneau = {(c.semaine, c.horaire, c.gymnase): j for j, c in enumerate(creneaux_valides)}
+            for i, creneau_precedent in enumerate(creneaux_precedents):
+                if creneau_precedent is None:
                     continue
-                
-                for j, creneau in enumerate(creneaux_valides):
-                    # Récupérer le niveau du gymnase
-                    niveau_gymnase = self.niveaux_gymnases.get(creneau.gymnase)
-                    if not niveau_gymnase:
-                        continue
-                    
-                    # Calculer la pénalité selon le niveau du gymnase et du match
-                    penalite = 0
-                    if niveau_gymnase == 'Haut niveau' and niveau_match < len(self.config.penalite_niveau_gymnases_haut):
-                        penalite = self.config.penalite_niveau_gymnases_haut[niveau_match]
-                    elif niveau_gymnase == 'Bas niveau' and niveau_match < len(self.config.penalite_niveau_gymnases_bas):
-                        penalite = self.config.penalite_niveau_gymnases_bas[niveau_match]
-                    
-                    # Ajouter la pénalité à l'objectif avec signe NÉGATIF (on maximise l'objectif global)
-                    # Pénalité positive = contribution négative = à éviter
-                    # Exemple: penalite=10 pour A1 en bas niveau -> objective_terms.append(-10) -> on veut éviter
-                    if penalite != 0:
-                        objective_terms.append(-int(penalite) * assignment_vars[(i, j)])
-
-
+                j = pos_creneau.get((creneau_precedent.semaine, creneau_precedent.horaire, creneau_precedent.gymnase))
+                objective_terms.append(-poids_deplacement * match_assigned[i])
+                if (i, j) in assignment_vars:
+                    objective_terms.append(poids_deplacement * assignment_vars[(i, j)])
+        if creneaux_precedents is not None:
+            statistiques.fin('deplacement', model, mesure, objective_terms)
         
         # CONTRAINTE SOUPLE: Espacement entre matchs d'une même équipe
-        # Pour chaque équipe, pénaliser les matchs trop rapprochés
+        # Pour chaque équipe, pénaliser les matchs trop rapprochés (réutilise plays[équipe, semaine])
+        mesure = statistiques.debut(model, objective_terms)
         if self.config.penalites_espacement_repos:
-            # Grouper les créneaux par semaine pour chaque équipe
-            for equipe_id in equipes_uniques:
+            # Semaines où chaque équipe peut jouer (les autres ont plays = 0)
+            for equipe_id, semaines_equipe in index.semaines_par_equipe.items():
                 # Pour chaque paire de semaines, détecter si l'équipe joue aux deux
-                for semaine1 in range(self.config.semaine_min, self.config.nb_semaines + 1):
-                    for semaine2 in range(semaine1 + 1, self.config.nb_semaines + 1):
+                for idx, semaine1 in enumerate(semaines_equipe):
+                    for semaine2 in semaines_equipe[idx + 1:]:
                         # Calculer le nombre de semaines de repos entre ces deux semaines
                         weeks_rest = semaine2 - semaine1 - 1
                         
-                        # Vérifier si on doit pénaliser cet écart
-                        if weeks_rest < len(self.config.penalites_espacement_repos):
-                            penalty_value = self.config.penalites_espacement_repos[weeks_rest]
-                            
-                            if penalty_value > 0:
-                                # Trouver tous les créneaux valides de semaine1 et semaine2
-                                creneaux_s1 = [j for j, c in enumerate(creneaux_valides) if c.semaine == semaine1]
-                                creneaux_s2 = [j for j, c in enumerate(creneaux_valides) if c.semaine == semaine2]
-                                
-                                # Trouver tous les matchs où cette équipe joue
-                                matchs_equipe = [i for i, m in enumerate(matchs) 
-                                               if m.equipe1.id_unique == equipe_id or m.equipe2.id_unique == equipe_id]
-                                
-                                # Créer une variable pour détecter si l'équipe joue aux deux semaines
-                                plays_s1 = model.NewBoolVar(f'plays_{equipe_id}_s{semaine1}')
-                                plays_s2 = model.NewBoolVar(f'plays_{equipe_id}_s{semaine2}')
-                                
-                                # plays_s1 = 1 si l'équipe joue en semaine1
-                                vars_s1 = [assignment_vars[(i, j)] 
-                                          for i in matchs_equipe for j in creneaux_s1]
-                                if vars_s1:
-                                    model.Add(sum(vars_s1) >= 1).OnlyEnforceIf(plays_s1)
-                                    model.Add(sum(vars_s1) == 0).OnlyEnforceIf(plays_s1.Not())
-                                
-                                # plays_s2 = 1 si l'équipe joue en semaine2
-                                vars_s2 = [assignment_vars[(i, j)] 
-                                          for i in matchs_equipe for j in creneaux_s2]
-                                if vars_s2:
-                                    model.Add(sum(vars_s2) >= 1).OnlyEnforceIf(plays_s2)
-                                    model.Add(sum(vars_s2) == 0).OnlyEnforceIf(plays_s2.Not())
-                                
-                                # Créer une variable pour détecter si l'équipe joue aux DEUX semaines
-                                plays_both = model.NewBoolVar(f'plays_both_{equipe_id}_s{semaine1}_s{semaine2}')
-                                model.Add(plays_s1 + plays_s2 >= 2).OnlyEnforceIf(plays_both)
-                                model.Add(plays_s1 + plays_s2 <= 1).OnlyEnforceIf(plays_both.Not())
-                                
-                                # Pénaliser si l'équipe joue aux deux semaines
-                                objective_terms.append(-int(penalty_value) * plays_both)
+                        # Les écarts plus grands ne sont plus pénalisés
+                        if weeks_rest >= len(self.config.penalites_espacement_repos):
+                            break
+                        
+                        penalty_value = self.config.penalites_espacement_repos[weeks_rest]
+                        if penalty_value <= 0:
+                            continue
+                        
+                        # plays_both = 1 si l'équipe joue aux DEUX semaines
+                        # (variable pénalisée : seule l'implication vers 1 est nécessaire)
+                        plays_both = model.NewBoolVar(f'plays_both_{equipe_id}_s{semaine1}_s{semaine2}')
+                        model.AddBoolOr([
+                            plays[(equipe_id, semaine1)].Not(),
+                            plays[(equipe_id, semaine2)].Not(),
+                            plays_both
+                        ])
+                        
+                        # Pénaliser si l'équipe joue aux deux semaines
+                        objective_terms.append(-int(penalty_value) * plays_both)
+            
+            # Espacement avec les matchs fixés : la semaine fixée est connue, la pénalité
+            # porte directement sur plays[équipe, semaine]
+            semaines_fixes_par_equipe = {}
+            for equipe_id, semaine_fixe in matchs_fixes_par_equipe_semaine:
+                semaines_fixes_par_equipe.setdefault(equipe_id, []).append(semaine_fixe)
+            
+            for (equipe_id, semaine), plays_var in plays.items():
+                for semaine_fixe in semaines_fixes_par_equipe.get(equipe_id, []):
+                    weeks_rest = abs(semaine - semaine_fixe) - 1
+                    if 0 <= weeks_rest < len(self.config.penalites_espacement_repos):
+                        penalty_value = self.config.penalites_espacement_repos[weeks_rest]
+                        if penalty_value > 0:
+                            objective_terms.append(-int(penalty_value) * plays_var)
+        statistiques.fin('espacement_repos', model, mesure, objective_terms)
         
         # CONTRAINTE SOUPLE 1: Compaction temporelle (prioriser les matchs en début de calendrier)
-        if self.config.compaction_temporelle_actif:
-            for i in range(len(matchs)):
-                for j, creneau in enumerate(creneaux_valides):
-                    semaine = creneau.semaine
-                    
-                    # Récupérer la pénalité pour cette semaine (indice 0 = semaine 1)
-                    if semaine <= len(self.config.compaction_penalites_par_semaine):
-                        penalty = int(self.config.compaction_penalites_par_semaine[semaine - 1])
-                    else:
-                        # Si on dépasse le nb de semaines définies, utiliser la dernière pénalité
-                        penalty = int(self.config.compaction_penalites_par_semaine[-1])
-                    
-                    if penalty > 0:
-                        objective_terms.append(-penalty * assignment_vars[(i, j)])
+        # Intégrée aux coûts par couple (table par semaine)
         
         # CONTRAINTE SOUPLE 2: Éviter les overlaps d'institution (matchs simultanés de même institution/équipe)
         # Appliqué seulement aux groupes configurés dans groupes_non_simultaneite
+        # Formulation agrégée : un compteur par (créneau, groupe) au lieu d'une variable par
+        # paire de matchs. Coût linéaire en nombre de variables d'assignation.
+        mesure = statistiques.debut(model, objective_terms)
         if self.config.overlap_institution_actif:
-            # Grouper les créneaux valides identiques (même semaine, même horaire, même gymnase)
-            creneaux_identiques = {}
-            for j, creneau in enumerate(creneaux_valides):
-                key = (creneau.semaine, creneau.horaire, creneau.gymnase)
-                if key not in creneaux_identiques:
-                    creneaux_identiques[key] = []
-                creneaux_identiques[key].append(j)
+            penalty = int(self.config.overlap_institution_poids)
+            groupes_par_match = [self._get_groupes_non_simultaneite_match(match) for match in matchs]
+            nb_compteurs = 0
             
-            # Pour chaque créneau unique, pénaliser si plusieurs matchs partagent un groupe de non-simultanéité
-            for creneaux_list in creneaux_identiques.values():
-                if len(creneaux_list) > 1:
-                    # Pour chaque paire de créneaux simultanés
-                    for j1 in creneaux_list:
-                        for j2 in creneaux_list:
-                            if j1 < j2:  # Éviter de compter deux fois
-                                # Pour chaque paire de matchs
-                                for i1, match1 in enumerate(matchs):
-                                    for i2, match2 in enumerate(matchs):
-                                        if i1 < i2:  # Éviter de compter deux fois
-                                            # Vérifier si les matchs partagent un groupe de non-simultanéité
-                                            if self._matchs_partagent_groupe_non_simultaneite(match1, match2):
-                                                # Créer une variable pour détecter l'overlap
-                                                overlap_var = model.NewBoolVar(f'overlap_{i1}_{i2}_{j1}_{j2}')
-                                                
-                                                # overlap_var = 1 si les deux matchs sont assignés simultanément
-                                                model.Add(assignment_vars[(i1, j1)] + assignment_vars[(i2, j2)] >= 2).OnlyEnforceIf(overlap_var)
-                                                model.Add(assignment_vars[(i1, j1)] + assignment_vars[(i2, j2)] <= 1).OnlyEnforceIf(overlap_var.Not())
-                                                
-                                                # Pénaliser l'overlap
-                                                penalty = int(self.config.overlap_institution_poids)
-                                                objective_terms.append(-penalty * overlap_var)
+            for j, indices_matchs in index.matchs_par_creneau.items():
+                if len(indices_matchs) < 2:
+                    continue
+                
+                # Matchs candidats sur ce créneau, regroupés par groupe de non-simultanéité
+                matchs_par_groupe = {}
+                for i in indices_matchs:
+                    for groupe in groupes_par_match[i]:
+                        matchs_par_groupe.setdefault(groupe, []).append(i)
+                
+                capacite = capacites_restantes.get(j, len(indices_matchs))
+                for groupe, indices_groupe in matchs_par_groupe.items():
+                    nb_max = min(len(indices_groupe), capacite)
+                    if nb_max < 2:
+                        continue
+                    
+                    # n matchs du groupe sur le créneau = C(n, 2) paires en overlap.
+                    # overlap_k = 1 si au moins k matchs du groupe sont sur ce créneau ;
+                    # la k-ième présence coûte (k - 1) paires, donc le solveur active
+                    # toujours les premiers paliers en priorité (coûts croissants).
+                    paliers = [model.NewBoolVar(f'overlap_c{j}_{groupe}_{k}') for k in range(2, nb_max + 1)]
+                    model.Add(sum(assignment_vars[(i, j)] for i in indices_groupe) <= 1 + sum(paliers))
+                    for k, palier in enumerate(paliers, start=2):
+                        objective_terms.append(-penalty * (k - 1) * palier)
+                    nb_compteurs += 1
+            
+            if self.config.afficher_progression:
+                print(f"   Overlaps: {nb_compteurs} compteur(s) (créneau, groupe)")
+        statistiques.fin('overlap', model, mesure, objective_terms)
         
         # CONTRAINTE SOUPLE 3: Espacement aller-retour (pour poules de type Aller-Retour)
+        # Une variable entière "semaine du match" par match concerné, liée une seule fois aux
+        # variables d'assignation ; les pénalités portent ensuite sur l'écart de semaines.
+        mesure = statistiques.debut(model, objective_terms)
         if self.config.aller_retour_espacement_actif:
-            # Détecter toutes les paires aller-retour
-            paires_aller_retour = []
-            for i1, match1 in enumerate(matchs):
-                for i2, match2 in enumerate(matchs):
-                    if i1 < i2 and self._sont_matchs_aller_retour(match1, match2):
-                        paires_aller_retour.append((i1, i2))
+            # Détecter toutes les paires aller-retour (index par équipes, linéaire)
+            paires_aller_retour = [
+                (i1, i2) for i1, i2 in self._detecter_paires_aller_retour(matchs)
+                if creneaux_par_match[i1] and creneaux_par_match[i2]
+            ]
             
             if paires_aller_retour:
                 if self.config.afficher_progression:
                     print(f"   Détecté {len(paires_aller_retour)} paire(s) aller-retour")
                 
-                # Pour chaque paire aller-retour
+                semaine_max = max(creneau.semaine for creneau in creneaux_valides)
+                penalty_meme_semaine = int(self.config.aller_retour_penalite_meme_semaine)
+                penalty_consecutives = int(self.config.aller_retour_penalite_consecutives)
+                
+                # semaine_match[i] = semaine du créneau choisi (0 si non planifié)
+                semaine_match = {}
+                for i in {i for paire in paires_aller_retour for i in paire}:
+                    semaine_match[i] = model.NewIntVar(0, semaine_max, f'semaine_match_{i}')
+                    model.Add(semaine_match[i] == sum(
+                        creneaux_valides[j].semaine * assignment_vars[(i, j)] for j in creneaux_par_match[i]
+                    ))
+                
                 for i1, i2 in paires_aller_retour:
-                    # Variables pour détecter si planifiés dans même semaine ou semaines consécutives
-                    for j1, creneau1 in enumerate(creneaux_valides):
-                        for j2, creneau2 in enumerate(creneaux_valides):
-                            semaine_diff = abs(creneau1.semaine - creneau2.semaine)
-                            
-                            # Pénalité si dans même semaine
-                            if semaine_diff == 0:
-                                conflict_var = model.NewBoolVar(f'aller_retour_meme_semaine_{i1}_{i2}_{j1}_{j2}')
-                                # conflict_var = 1 si les deux matchs sont planifiés dans ces créneaux
-                                model.Add(assignment_vars[(i1, j1)] + assignment_vars[(i2, j2)] >= 2).OnlyEnforceIf(conflict_var)
-                                model.Add(assignment_vars[(i1, j1)] + assignment_vars[(i2, j2)] <= 1).OnlyEnforceIf(conflict_var.Not())
-                                
-                                penalty = int(self.config.aller_retour_penalite_meme_semaine)
-                                objective_terms.append(-penalty * conflict_var)
-                            
-                            # Pénalité si dans semaines consécutives
-                            elif semaine_diff == 1:
-                                conflict_var = model.NewBoolVar(f'aller_retour_consecutif_{i1}_{i2}_{j1}_{j2}')
-                                # conflict_var = 1 si les deux matchs sont planifiés dans ces créneaux
-                                model.Add(assignment_vars[(i1, j1)] + assignment_vars[(i2, j2)] >= 2).OnlyEnforceIf(conflict_var)
-                                model.Add(assignment_vars[(i1, j1)] + assignment_vars[(i2, j2)] <= 1).OnlyEnforceIf(conflict_var.Not())
-                                
-                                penalty = int(self.config.aller_retour_penalite_consecutives)
-                                objective_terms.append(-penalty * conflict_var)
+                    ecart = model.NewIntVar(0, semaine_max, f'aller_retour_ecart_{i1}_{i2}')
+                    model.AddAbsEquality(ecart, semaine_match[i1] - semaine_match[i2])
+                    
+                    # Les pénalités ne s'appliquent que si les deux matchs sont planifiés
+                    deux_planifies = [match_assigned[i1], match_assigned[i2]]
+                    
+                    # Pénalité si dans même semaine (écart = 0)
+                    meme_semaine = model.NewBoolVar(f'aller_retour_meme_semaine_{i1}_{i2}')
+                    model.Add(ecart == 0).OnlyEnforceIf(meme_semaine)
+                    model.Add(ecart >= 1).OnlyEnforceIf(deux_planifies + [meme_semaine.Not()])
+                    objective_terms.append(-penalty_meme_semaine * meme_semaine)
+                    
+                    # Pénalité si dans semaines consécutives (écart = 1)
+                    if penalty_consecutives > 0:
+                        consecutives = model.NewBoolVar(f'aller_retour_consecutif_{i1}_{i2}')
+                        model.Add(ecart == 1).OnlyEnforceIf(consecutives)
+                        model.Add(ecart != 1).OnlyEnforceIf(deux_planifies + [consecutives.Not()])
+                        objective_terms.append(-penalty_consecutives * consecutives)
+        statistiques.fin('aller_retour', model, mesure, objective_terms)
         
         # MAXIMISER (bonus - pénalités)
+        mesure = statistiques.debut(model)
         if objective_terms:
             model.Maximize(sum(objective_terms))
-
+        statistiques.fin('objectif', model, mesure)
+        statistiques.temps_construction = time.perf_counter() - debut_construction
+        
+        return model, assignment_vars, match_assigned, creneaux_par_match, statistiques
+    
+    def solve(self, matchs: List[Match], creneaux: List[Creneau],
+             gymnases: Dict[str, Gymnase], obligations_presence: Optional[Dict[str, str]] = None,
+             use_warm_start: bool = True, solution_store = None, 
+             matchs_fixes: Optional[List[Match]] = None,
+             creneaux_initiaux: Optional[List[Optional[Creneau]]] = None,
+             cache_modeles: Optional[ModelCache] = None,
+             mesurer_demarrage_froid: bool = False,
+             creneaux_precedents: Optional[List[Optional[Creneau]]] = None) -> Solution:
+        """
+        Solve using CP-SAT constraint programming with optional warm start.
+        
+        Args:
+            matchs: Liste des matchs à planifier
+            creneaux: Liste des créneaux disponibles
+            gymnases: Dictionnaire des gymnases
+            obligations_presence: Contraintes de présence par gymnase
+            use_warm_start: Si True, tente d'utiliser une solution précédente comme point de départ
+            solution_store: Instance de SolutionStore (créée automatiquement si None)
+            matchs_fixes: Matchs déjà planifiés/fixés (pour calcul des contraintes)
+            creneaux_initiaux: Créneau de départ de chaque match (None si non planifié),
+                aligné sur matchs ; transmis au solveur comme indication (remplace le warm start)
+            cache_modeles: Cache disque des modèles construits (None = toujours reconstruire)
+            mesurer_demarrage_froid: Si True (avec creneaux_initiaux), mesure d'abord le temps
+                jusqu'à la première solution sans indication, pour évaluer le gain de l'amorce
+            creneaux_precedents: Créneau précédent de chaque match (None si aucun), aligné sur
+                matchs ; les déplacements sont pénalisés (replanification incrémentale)
+            
+        Returns:
+            Solution trouvée
+        """
+        
+        if self.config.afficher_progression:
+            print("CP-SAT solver - Création du modèle...")
+        
+        if obligations_presence is None:
+            obligations_presence = {}
+        
+        # Filtrer les créneaux valides selon semaine_min (un seul par créneau physique)
+        creneaux_valides = self._filtrer_creneaux_valides(creneaux)
+        
+        if self.config.afficher_progression:
+            print(f"   → {len(creneaux_valides)} créneaux valides sur {len(creneaux)} total (semaine_min={self.config.semaine_min})")
+        
+        # Modèle déjà construit pour les mêmes entrées et les mêmes poids : chargé depuis le cache
+        modele = None
+        if cache_modeles is not None:
+            cle_cache = cache_modeles.calculer_cle(matchs, creneaux_valides, matchs_fixes, obligations_presence,
+                                                   creneaux_precedents)
+            modele = cache_modeles.charger(cle_cache)
+            if modele is not None:
+                print(f"   ♻️  Modèle CP-SAT chargé depuis le cache ({cle_cache[:12]})")
+        
+        if modele is None:
+            modele = self._construire_modele(matchs, creneaux_valides, gymnases, obligations_presence, matchs_fixes,
+                                             creneaux_precedents)
+            if cache_modeles is not None:
+                cache_modeles.sauvegarder(cle_cache, *modele)
+        
+        model, assignment_vars, match_assigned, creneaux_par_match, statistiques = modele
+        self.statistiques_modele = statistiques
+        if self.config.afficher_progression:
+            statistiques.afficher()
+        
+        # Référence pour évaluer une amorce : première solution du modèle sans indication
+        temps_premiere_solution_froid = None
+        if mesurer_demarrage_froid and creneaux_initiaux is not None:
+            temps_premiere_solution_froid = self._mesurer_premiere_solution(model)
+            print(f"   Démarrage à froid: première solution en {temps_premiere_solution_froid:.2f}s"
+                  if temps_premiere_solution_froid is not None else
+                  "   Démarrage à froid: aucune solution dans le temps imparti")
+        
+        # Indication de départ fournie par l'appelant (ex : LNS) : créneau courant de chaque match
+        if creneaux_initiaux is not None:
+            pos_creneau = {(c.semaine, c.horaire, c.gymnase): j for j, c in enumerate(creneaux_valides)}
+            j_initiaux = [
+                pos_creneau.get((creneau.semaine, creneau.horaire, creneau.gymnase)) if creneau is not None else None
+                for creneau in creneaux_initiaux
+            ]
+            # Matchs interchangeables : créneaux redistribués dans l'ordre imposé par la rupture de symétrie
+            self._ordonner_indication_symetries(
+                j_initiaux,
+                self._detecter_matchs_interchangeables(matchs, creneaux_par_match, matchs_fixes, creneaux_precedents)
+            )
+            for i, j_initial in enumerate(j_initiaux):
+                for j in creneaux_par_match[i]:
+                    model.AddHint(assignment_vars[(i, j)], int(j == j_initial))
+                model.AddHint(match_assigned[i], int((i, j_initial) in assignment_vars))
         
         # ============================================================================
         # WARM START : Utiliser une solution précédente comme point de départ
         # ============================================================================
-        if use_warm_start:
+        if use_warm_start and creneaux_initiaux is None:
             try:
                 from pycalendar.core.solution_store import SolutionStore
                 
@@ -780,7 +1099,13 @@ class CPSATSolver(BaseSolver):
                     solution_name = getattr(self.config, 'cpsat_warm_start_file', 'default')
                     solution_store = SolutionStore(solution_name=solution_name)
                 
-                previous_solution = solution_store.load_latest()
+                # Instantané d'une résolution interrompue, s'il est plus récent que la dernière solution
+                previous_solution = solution_store.load_snapshot()
+                if previous_solution:
+                    print(f"\n📸 Instantané d'une résolution interrompue "
+                          f"(score {previous_solution['metadata']['score']:.0f}, {previous_solution['metadata']['date']})")
+                else:
+                    previous_solution = solution_store.load_latest()
                 
                 if previous_solution:
                     solution_name = previous_solution['metadata'].get('solution_name', 'unknown')
@@ -797,7 +1122,9 @@ class CPSATSolver(BaseSolver):
                     # Note: La signature sera créée/passée depuis l'orchestrateur
                     # Pour l'instant, on fait une validation basique
                     hint, stats = self._apply_warm_start_basic(
-                        previous_solution, matchs, creneaux_valides, assignment_vars, model
+                        previous_solution, matchs, creneaux_valides, assignment_vars, model,
+                        self._detecter_matchs_interchangeables(matchs, creneaux_par_match, matchs_fixes,
+                                                               creneaux_precedents)
                     )
                     
                     # Toujours afficher les statistiques de réutilisation (important!)
@@ -832,8 +1159,9 @@ class CPSATSolver(BaseSolver):
         solver.parameters.log_search_progress = self.config.afficher_progression
         
         # Configuration pour améliorer la recherche
-        solver.parameters.num_search_workers = 8  # Utiliser plusieurs threads pour exploration parallèle
-        solver.parameters.relative_gap_limit = 0.0  # Ne pas s'arrêter avant le temps max
+        solver.parameters.num_search_workers = nb_workers_cpsat(self.config)  # Un worker par cœur (ou cpsat_nb_workers)
+        # Gap relatif configurable (0 = ne pas s'arrêter avant le temps max ou l'optimum prouvé)
+        solver.parameters.relative_gap_limit = self.config.cpsat_arret_gap_relatif
         solver.parameters.absolute_gap_limit = 0.0  # Continuer jusqu'au temps max
         
         # Log pour débugger
@@ -843,28 +1171,100 @@ class CPSATSolver(BaseSolver):
             print(f"   Workers: {solver.parameters.num_search_workers}")
             print(f"   Relative gap limit: {solver.parameters.relative_gap_limit}")
             print(f"   Absolute gap limit: {solver.parameters.absolute_gap_limit}")
+            print(f"   Arrêt si stagnation: {self.config.cpsat_arret_stagnation_secondes or '-'}s, "
+                  f"objectif cible: {self.config.cpsat_arret_objectif_cible if self.config.cpsat_arret_objectif_cible is not None else '-'}")
         
-        # Callback pour capturer les solutions intermédiaires
+        # Callback pour capturer les solutions intermédiaires et appliquer les règles d'arrêt
         class SolutionPrinter(cp_model.CpSolverSolutionCallback):
-            def __init__(self, show_progress: bool):
+            def __init__(self, show_progress: bool, gap_relatif: float = 0.0,
+                         objectif_cible: Optional[float] = None, pool: Optional[PoolSolutions] = None,
+                         journal: Optional[JournalProgression] = None, store_snapshot=None,
+                         snapshot_secondes: float = 0.0):
                 cp_model.CpSolverSolutionCallback.__init__(self)
                 self._solution_count = 0
                 self._show_progress = show_progress
                 self._solutions = []  # Stocker (temps, score) pour chaque solution
                 self._start_time = None
+                self._gap_relatif = gap_relatif
+                self._objectif_cible = objectif_cible
+                self.debut = time.time()
+                self.derniere_amelioration = None  # Instant de la dernière solution (amélioration)
+                self.regle_arret = None  # Règle ayant interrompu la recherche
+                self._pool = pool  # Meilleures affectations distinctes (None = non conservées)
+                self._journal = journal  # Journal JSONL de progression (None = désactivé)
+                self._store_snapshot = store_snapshot  # SolutionStore des instantanés (None = désactivé)
+                self._snapshot_secondes = snapshot_secondes
+                self._prochain_snapshot = 0.0  # La première solution est toujours sauvegardée
+                self._variables_affectation = ([(i, j, var) for (i, j), var in assignment_vars.items()]
+                                               if pool or store_snapshot else [])
+                self._nb_matchs = len(matchs)
+            
+            def _affectation(self) -> List[Optional[int]]:
+                """Créneau de chaque match dans la solution courante (None si non planifié)."""
+                affectation = [None] * self._nb_matchs
+                for i, j, var in self._variables_affectation:
+                    if self.BooleanValue(var):
+                        affectation[i] = j
+                return affectation
+            
+            def _ecrire_snapshot(self, affectation, score: float, borne: float, temps: float):
+                """Sauvegarde la solution courante en instantané (erreurs d'écriture non bloquantes)."""
+                assignments = [
+                    {
+                        'equipe1_id': matchs[i].equipe1.id_unique,
+                        'equipe2_id': matchs[i].equipe2.id_unique,
+                        'semaine': creneaux_valides[j].semaine,
+                        'horaire': creneaux_valides[j].horaire,
+                        'gymnase': creneaux_valides[j].gymnase,
+                    }
+                    for i, j in enumerate(affectation) if j is not None
+                ]
+                try:
+                    self._store_snapshot.save_snapshot(assignments, {
+                        'solver': 'CP-SAT', 'status': 'SNAPSHOT', 'score': score,
+                        'borne': borne, 'temps_ecoule': round(temps, 3),
+                    })
+                except OSError as e:
+                    print(f"   ⚠️  Instantané non sauvegardé: {e}")
             
             def on_solution_callback(self):
-                import time
                 if self._start_time is None:
                     self._start_time = time.time()
                 
                 self._solution_count += 1
+                self.derniere_amelioration = time.time()
                 current_time = time.time() - self._start_time
                 score = self.ObjectiveValue()
                 self._solutions.append((current_time, score))
                 
                 if self._show_progress:
                     print(f"   Solution #{self._solution_count}: Score = {score:.0f} (à {current_time:.2f}s)")
+                
+                affectation = None
+                if self._pool is not None:
+                    affectation = self._affectation()
+                    self._pool.proposer(score, tuple(affectation))
+                
+                # Suivi de la résolution : journal de progression et instantané périodique
+                temps = time.time() - self.debut
+                if self._journal is not None:
+                    nb_planifies = (sum(1 for j in affectation if j is not None) if affectation is not None
+                                    else sum(self.BooleanValue(var) for var in match_assigned))
+                    self._journal.ecrire('solution', temps=round(temps, 3), score=score,
+                                         borne=self.BestObjectiveBound(), matchs_planifies=nb_planifies)
+                if self._store_snapshot is not None and temps >= self._prochain_snapshot:
+                    self._ecrire_snapshot(affectation or self._affectation(), score, self.BestObjectiveBound(), temps)
+                    self._prochain_snapshot = temps + self._snapshot_secondes
+                
+                # Règles d'arrêt évaluées à chaque nouvelle solution
+                if self._objectif_cible is not None and score >= self._objectif_cible:
+                    self.regle_arret = 'objectif_cible'
+                    self.StopSearch()
+                elif self._gap_relatif > 0:
+                    gap = abs(self.BestObjectiveBound() - score) / max(1.0, abs(score))
+                    if gap <= self._gap_relatif:
+                        self.regle_arret = 'gap_relatif'
+                        self.StopSearch()
             
             def solution_count(self):
                 return self._solution_count
@@ -872,20 +1272,106 @@ class CPSATSolver(BaseSolver):
             def get_solutions(self):
                 return self._solutions
         
-        solution_printer = SolutionPrinter(self.config.afficher_progression)
+        # Pool des K meilleures affectations distinctes (alimenté par le callback, hors portfolio)
+        pool = None
+        if self.config.cpsat_pool_taille > 1 and not self.config.cpsat_portfolio_actif:
+            pool = PoolSolutions(self.config.cpsat_pool_taille, self.config.cpsat_pool_distance_min)
+        
+        # Journal de progression et instantanés (hors portfolio : pas de callback dans les processus)
+        journal = None
+        if self.config.cpsat_journal_progression and not self.config.cpsat_portfolio_actif:
+            journal = JournalProgression(self.config.cpsat_journal_progression)
+            journal.ecrire('debut', nb_matchs=len(matchs), nb_creneaux=len(creneaux_valides),
+                           temps_max=self.config.temps_max_secondes)
+        store_snapshot = None
+        if self.config.cpsat_snapshot_secondes > 0 and not self.config.cpsat_portfolio_actif:
+            from pycalendar.core.solution_store import SolutionStore
+            store_snapshot = SolutionStore(solution_name=getattr(self.config, 'cpsat_warm_start_file', 'default'))
+        
+        solution_printer = SolutionPrinter(self.config.afficher_progression,
+                                           self.config.cpsat_arret_gap_relatif,
+                                           self.config.cpsat_arret_objectif_cible,
+                                           pool, journal, store_snapshot,
+                                           self.config.cpsat_snapshot_secondes)
+        
+        # Arrêt sur stagnation : aucune solution n'arrive pendant la stagnation, la durée
+        # sans amélioration est donc surveillée par un thread qui interrompt la recherche
+        import threading
+        fin_recherche = threading.Event()
+        stagnation = self.config.cpsat_arret_stagnation_secondes
+        
+        def surveiller_stagnation():
+            while not fin_recherche.wait(0.2):
+                derniere = solution_printer.derniere_amelioration
+                if derniere is not None and time.time() - derniere >= stagnation:
+                    solution_printer.regle_arret = 'stagnation'
+                    solver.StopSearch()
+                    return
+        
+        # Portfolio : processus indépendants, les règles d'arrêt par callback ne s'appliquent pas
+        portfolio = self.config.cpsat_portfolio_actif
+        surveillance = (threading.Thread(target=surveiller_stagnation, daemon=True)
+                        if stagnation > 0 and not portfolio else None)
         
         if self.config.afficher_progression:
             print("\nCP-SAT solver - Résolution...")
         
-        import time
         start_time = time.time()
-        status = solver.Solve(model, solution_printer)
+        if surveillance:
+            surveillance.start()
+        if portfolio:
+            solver = resoudre_portfolio(model, self.config)
+            status = solver.status
+        else:
+            status = solver.Solve(model, solution_printer)
+        fin_recherche.set()
+        if surveillance:
+            surveillance.join()
         elapsed_time = time.time() - start_time
+        temps_premiere_solution = (solution_printer._start_time - start_time
+                                   if solution_printer._start_time is not None else None)
+        
+        # Règle ayant mis fin à la recherche
+        regle_arret = solution_printer.regle_arret
+        if regle_arret is None:
+            if status == cp_model.OPTIMAL and self.config.cpsat_arret_gap_relatif > 0 \
+                    and solver.BestObjectiveBound() != solver.ObjectiveValue():
+                regle_arret = 'gap_relatif'  # Limite native de CP-SAT (optimum non prouvé)
+            elif status == cp_model.OPTIMAL:
+                regle_arret = 'optimal'
+            elif status == cp_model.INFEASIBLE:
+                regle_arret = 'infaisable'
+            else:
+                regle_arret = 'temps_max'
+        
+        if journal is not None:
+            trouve = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+            journal.ecrire('fin', temps=round(elapsed_time, 3), statut=solver.StatusName(status), arret=regle_arret,
+                           score=solver.ObjectiveValue() if trouve else None,
+                           borne=solver.BestObjectiveBound() if trouve else None)
+            journal.fermer()
         
         # Afficher les statistiques du solver
         print(f"\n⏱️  Statistiques de résolution:")
         print(f"   Temps écoulé: {elapsed_time:.2f}s / {self.config.temps_max_secondes}s")
         print(f"   Statut: {solver.StatusName(status)}")
+        print(f"   Arrêt: {regle_arret}")
+        
+        # Écart à l'optimum : borne de la relaxation d'affectation et borne prouvée par CP-SAT
+        borne = None
+        if self.config.cpsat_borne_relaxation and status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            borne = self._calculer_borne_relaxation(matchs, creneaux_valides, creneaux_par_match, gymnases,
+                                                    matchs_fixes, creneaux_precedents)
+            borne['cpsat'] = solver.BestObjectiveBound()
+            borne_min = min(borne['borne'], borne['cpsat'])
+            borne['gap_relatif'] = abs(borne_min - solver.ObjectiveValue()) / max(1.0, abs(solver.ObjectiveValue()))
+            print(f"   Score: {solver.ObjectiveValue():.0f} | borne relaxation ({borne['methode']}, "
+                  f"{borne['temps_secondes']:.2f}s): {borne['borne']:.0f} | borne CP-SAT: {borne['cpsat']:.0f} "
+                  f"→ gap {borne['gap_relatif']:.2%}")
+            if 'raison' in borne:
+                print(f"   ⚠️  Borne sans capacité des créneaux (plus faible): {borne['raison']}")
+        if temps_premiere_solution is not None:
+            print(f"   Première solution: {temps_premiere_solution:.2f}s")
         print(f"   Branches: {solver.NumBranches()}")
         print(f"   Conflits: {solver.NumConflicts()}")
         print(f"   Temps utilisé: {solver.WallTime():.2f}s")
@@ -929,32 +1415,153 @@ class CPSATSolver(BaseSolver):
         
         matchs_planifies = []
         matchs_non_planifies = []
+        affectation_finale = [None] * len(matchs)
         
         if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
             for i, match in enumerate(matchs):
                 assigned = False
-                for j, creneau in enumerate(creneaux_valides):
+                for j in creneaux_par_match[i]:
+                    creneau = creneaux_valides[j]
                     if solver.Value(assignment_vars[(i, j)]) == 1:
                         match.creneau = creneau
                         matchs_planifies.append(match)
+                        affectation_finale[i] = j
                         assigned = True
                         break
                 
                 if not assigned:
+                    # Pas de créneau hérité d'un autre solveur (amorce gloutonne, essai précédent)
+                    match.creneau = None
                     matchs_non_planifies.append(match)
         else:
+            for match in matchs:
+                match.creneau = None
             matchs_non_planifies = matchs
         
+        # Variantes : autres affectations du pool (la solution finale en est exclue)
+        variantes = []
+        if pool is not None and status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+            for score, affectation in pool.entrees:
+                distance = distance_hamming(affectation, tuple(affectation_finale))
+                if distance > 0:
+                    variantes.append(self._construire_variante(matchs, creneaux_valides, affectation, score, distance))
+            print(f"\n🎲 Pool de solutions: {len(variantes)} variante(s) à au moins "
+                  f"{pool.distance_min} match(s) d'écart"
+                  + "".join(f"\n   Variante {k}: score {v.score:.0f}, {v.metadata['variante']['distance']} match(s) "
+                            f"placé(s) différemment" for k, v in enumerate(variantes, 1)))
+        
         return Solution(
             matchs_planifies=matchs_planifies,
             matchs_non_planifies=matchs_non_planifies,
             score=solver.ObjectiveValue() if status in [cp_model.OPTIMAL, cp_model.FEASIBLE] else float('inf'),
-            metadata={'solver': 'cpsat', 'status': solver.StatusName(status)}
+            metadata={'solver': 'cpsat', 'status': solver.StatusName(status), 'arret': regle_arret,
+                      'statistiques_modele': statistiques.to_dict(),
+                      'temps_premiere_solution': temps_premiere_solution,
+                      'temps_premiere_solution_froid': temps_premiere_solution_froid,
+                      'borne': borne,
+                      'portfolio': solver.essais if portfolio else None,
+                      'pool': [v.metadata['variante'] for v in variantes],
+                      'variantes': variantes}
+        )
+    
+    def _construire_variante(self, matchs: List[Match], creneaux_valides: List[Creneau],
+                             affectation: Tuple[Optional[int], ...], score: float, distance: int) -> Solution:
+        """
+        Solution d'une affectation du pool, sur des copies des matchs (les matchs
+        d'origine portent la solution finale).
+        
+        Args:
+            matchs: Matchs à planifier
+            creneaux_valides: Créneaux à partir de semaine_min
+            affectation: Indice du créneau de chaque match (None si non planifié)
+            score: Objectif de l'affectation
+            distance: Nombre de matchs placés différemment de la solution finale
+            
+        Returns:
+            Solution (metadata['variante'] : score et distance)
+        """
+        matchs_planifies = []
+        matchs_non_planifies = []
+        for match, j in zip(matchs, affectation):
+            copie = copy.copy(match)
+            copie.metadata = dict(match.metadata)
+            copie.creneau = creneaux_valides[j] if j is not None else None
+            (matchs_planifies if j is not None else matchs_non_planifies).append(copie)
+        
+        return Solution(
+            matchs_planifies=matchs_planifies,
+            matchs_non_planifies=matchs_non_planifies,
+            score=score,
+            metadata={'solver': 'cpsat', 'status': 'FEASIBLE', 'variante': {'score': score, 'distance': distance}}
         )
     
+    def _calculer_borne_relaxation(self, matchs: List[Match], creneaux_valides: List[Creneau],
+                                   creneaux_par_match: List[List[int]], gymnases: Dict[str, Gymnase],
+                                   matchs_fixes: Optional[List[Match]],
+                                   creneaux_precedents: Optional[List[Optional[Creneau]]] = None) -> dict:
+        """
+        Majorant de l'objectif par la relaxation d'affectation (voir relaxation.borne_affectation).
+        
+        Valeur de chaque couple faisable : bonus de planification - coûts par couple
+        (- poids de déplacement hors du créneau précédent).
+        
+        Args:
+            matchs: Matchs à planifier
+            creneaux_valides: Créneaux à partir de semaine_min
+            creneaux_par_match: Masque de faisabilité (créneaux faisables par match)
+            gymnases: Dictionnaire des gymnases
+            matchs_fixes: Matchs déjà planifiés/fixés
+            creneaux_precedents: Créneau précédent de chaque match (replanification incrémentale)
+            
+        Returns:
+            Dict {'borne', 'methode', 'temps_secondes'} (+ 'raison' si repli sans capacité)
+        """
+        _, matchs_fixes_par_creneau = self._compter_matchs_fixes(matchs_fixes)
+        capacites_restantes = self._calculer_capacites_restantes(creneaux_valides, gymnases, matchs_fixes_par_creneau)
+        couples = [(i, j) for i, indices in enumerate(creneaux_par_match) for j in indices]
+        couts = self._calculer_couts_couples(matchs, creneaux_valides, couples,
+                                             self._detecter_retours_fixes(matchs, matchs_fixes))
+        
+        bonus = np.array([self._get_bonus_planification(match) for match in matchs], dtype=np.int64)
+        valeurs = bonus[[i for i, _ in couples]] - couts if couples else np.zeros(0, dtype=np.int64)
+        
+        poids_deplacement = int(self.config.incremental_poids_deplacement)
+        if creneaux_precedents is not None and poids_deplacement > 0:
+            pos_creneau = {(c.semaine, c.horaire, c.gymnase): j for j, c in enumerate(creneaux_valides)}
+            j_precedents = [
+                pos_creneau.get((c.semaine, c.horaire, c.gymnase)) if c is not None else None
+                for c in creneaux_precedents
+            ]
+            for k, (i, j) in enumerate(couples):
+                if creneaux_precedents[i] is not None and j != j_precedents[i]:
+                    valeurs[k] -= poids_deplacement
+        
+        return borne_affectation(len(matchs), couples, valeurs, capacites_restantes)
+    
+    def _mesurer_premiere_solution(self, model) -> Optional[float]:
+        """
+        Mesure le temps nécessaire à CP-SAT pour trouver une première solution, sans indication.
+        
+        Args:
+            model: Modèle CP-SAT (avant ajout des indications)
+            
+        Returns:
+            Temps en secondes, ou None si aucune solution dans temps_max_secondes
+        """
+        sonde = cp_model.CpSolver()
+        sonde.parameters.max_time_in_seconds = self.config.temps_max_secondes
+        sonde.parameters.num_search_workers = nb_workers_cpsat(self.config)
+        sonde.parameters.stop_after_first_solution = True
+        
+        debut = time.time()
+        status = sonde.Solve(model)
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return None
+        return time.time() - debut
+    
     def _apply_warm_start_basic(self, solution_data: dict, matchs: List[Match],
                                 creneaux: List[Creneau], assignment_vars: dict,
-                                model) -> tuple:
+                                model, groupes_interchangeables: Optional[List[List[int]]] = None) -> tuple:
         """
         Applique un warm start basique sans validation de signature.
         
@@ -962,12 +1569,17 @@ class CPSATSolver(BaseSolver):
         sans passer par l'orchestrateur. Pour une validation complète,
         utiliser SolutionStore.validate_and_adapt_solution().
         
+        Une rencontre jouée plusieurs fois (mêmes équipes) est attribuée à un match
+        différent à chaque affectation, puis les créneaux des matchs interchangeables
+        sont redistribués dans l'ordre imposé par la rupture de symétrie.
+        
         Args:
             solution_data: Données de la solution précédente
             matchs: Liste des matchs actuels
             creneaux: Liste des créneaux actuels
             assignment_vars: Variables d'assignment du modèle CP-SAT
             model: Modèle CP-SAT
+            groupes_interchangeables: Groupes de matchs ordonnés par le modèle (None = aucun)
             
         Returns:
             Tuple (hint, stats)
@@ -979,14 +1591,12 @@ class CPSATSolver(BaseSolver):
             'invalid_creneau': 0,
         }
         
-        # Créer des lookups rapides
+        # Créer des lookups rapides : matchs de chaque rencontre, même sens puis sens inverse
         matchs_lookup = {}
+        matchs_inverses = {}
         for idx, match in enumerate(matchs):
-            # Clé bidirectionnelle
-            key1 = (match.equipe1.id_unique, match.equipe2.id_unique)
-            key2 = (match.equipe2.id_unique, match.equipe1.id_unique)
-            matchs_lookup[key1] = idx
-            matchs_lookup[key2] = idx
+            matchs_lookup.setdefault((match.equipe1.id_unique, match.equipe2.id_unique), []).append(idx)
+            matchs_inverses.setdefault((match.equipe2.id_unique, match.equipe1.id_unique), []).append(idx)
         
         creneaux_lookup = {
             (c.semaine, c.horaire, c.gymnase): idx
@@ -994,6 +1604,7 @@ class CPSATSolver(BaseSolver):
         }
         
         hint = {}
+        j_initiaux = [None] * len(matchs)
         
         # Valider chaque assignment
         for assignment in solution_data.get("assignments", []):
@@ -1006,9 +1617,13 @@ class CPSATSolver(BaseSolver):
                 eq1_id = f"{assignment['equipe1_nom']}|{assignment['equipe1_genre']}"
                 eq2_id = f"{assignment['equipe2_nom']}|{assignment['equipe2_genre']}"
             
-            match_idx = matchs_lookup.get((eq1_id, eq2_id))
+            # Matchs de la rencontre pas encore indiqués
+            candidats = [
+                idx for idx in matchs_lookup.get((eq1_id, eq2_id), []) + matchs_inverses.get((eq1_id, eq2_id), [])
+                if j_initiaux[idx] is None
+            ]
             
-            if match_idx is None:
+            if not candidats:
                 stats['invalid_match'] += 1
                 continue
             
@@ -1024,6 +1639,13 @@ class CPSATSolver(BaseSolver):
                 stats['invalid_creneau'] += 1
                 continue
             
+            # De préférence un match pour lequel ce créneau est faisable
+            match_idx = next((idx for idx in candidats if (idx, creneau_idx) in assignment_vars), candidats[0])
+            j_initiaux[match_idx] = creneau_idx
+        
+        self._ordonner_indication_symetries(j_initiaux, groupes_interchangeables or [])
+        
+        for match_idx, creneau_idx in enumerate(j_initiaux):
             # Assignment valide : ajouter comme hint
             var = assignment_vars.get((match_idx, creneau_idx))
             if var is not None:  # Important: ne pas évaluer var comme booléen (erreur OR-Tools)
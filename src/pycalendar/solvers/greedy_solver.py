@@ -1,15 +1,16 @@
 """Greedy solver for sports scheduling."""
 
+import heapq
+import os
 import random
-from typing import List, Dict, Optional, Set
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Optional, Set, Tuple
 from pycalendar.core.models import Match, Creneau, Gymnase, Solution
 from pycalendar.core.config import Config
+from pycalendar.core.penalty_tables import PenaltyTables
 from pycalendar.constraints.base import ConstraintValidator
-from pycalendar.constraints.venue_constraints import VenueCapacityConstraint, VenueAvailabilityConstraint, VenuePresenceObligationConstraint
-from pycalendar.constraints.team_constraints import (TeamAvailabilityConstraint, MaxMatchesPerWeekConstraint, 
-                                          TeamNotPlayingSimultaneouslyConstraint)
-from pycalendar.constraints.schedule_constraints import (MinSpacingConstraint, LoadBalancingConstraint,
-                                              PreferredTimeConstraint)
+from pycalendar.constraints.team_constraints import MaxMatchesPerWeekConstraint, TeamNotPlayingSimultaneouslyConstraint
+from pycalendar.constraints.schedule_constraints import MinSpacingConstraint, LoadBalancingConstraint
 from .base_solver import BaseSolver
 
 
@@ -24,38 +25,9 @@ class GreedySolver(BaseSolver):
         self.ententes = ententes or {}  # Dict avec paires d'institutions et leurs pénalités
         self.contraintes_temporelles = contraintes_temporelles or {}  # Dict avec paires d'équipes et leurs contraintes temporelles
         self.niveaux_gymnases = niveaux_gymnases or {}  # Dict avec niveaux des gymnases
+        self.penalty_tables = PenaltyTables(config, self.niveaux_gymnases)
         self.validator = self._build_validator()
     
-    def _get_niveau_match(self, match: Match) -> Optional[int]:
-        """
-        Détermine le niveau d'un match basé sur sa poule.
-        
-        Args:
-            match: Le match dont on veut connaître le niveau
-            
-        Returns:
-            Le niveau (0=A1, 1=A2, 2=A3, 3=A4, etc.) ou None si indéterminé
-        """
-        poule = match.poule.upper()
-        
-        # Chercher un pattern comme A1, A2, A3, A4 ou similaire
-        import re
-        match_niveau = re.search(r'A(\d+)', poule)
-        if match_niveau:
-            return int(match_niveau.group(1)) - 1  # A1=0, A2=1, A3=2, A4=3
-        
-        # Autres patterns possibles
-        if 'A1' in poule or '1' in poule and 'A' in poule:
-            return 0
-        elif 'A2' in poule or '2' in poule and 'A' in poule:
-            return 1
-        elif 'A3' in poule or '3' in poule and 'A' in poule:
-            return 2
-        elif 'A4' in poule or '4' in poule and 'A' in poule:
-            return 3
-        
-        return None  # Niveau indéterminé
-    
     def _est_entente(self, match: Match) -> bool:
         """Vérifie si un match est une entente (paire d'institutions configurée)."""
         if not self.config.entente_actif or not self.ententes:
@@ -77,34 +49,30 @@ class GreedySolver(BaseSolver):
         Returns:
             True si la contrainte est respectée ou inexistante, False sinon
         """
+        # Aucune contrainte applicable ou toutes respectées
+        return all(contrainte.est_respectee(creneau.semaine)
+                   for contrainte in self._contraintes_temporelles_du_match(match))
+    
+    def _contraintes_temporelles_du_match(self, match: Match) -> List:
+        """Contraintes temporelles qui s'appliquent au match (vide si désactivées)."""
         from pycalendar.core.utils import matcher_contrainte_avec_genre
         
         if not self.config.contrainte_temporelle_actif or not self.contraintes_temporelles:
-            return True
-        
-        # Extraire les infos des équipes
-        eq1_nom = match.equipe1.nom
-        eq1_genre = match.equipe1.genre
-        eq2_nom = match.equipe2.nom
-        eq2_genre = match.equipe2.genre
+            return []
         
-        # Parcourir toutes les contraintes pour trouver celles qui matchent
-        for contrainte_key, contrainte in self.contraintes_temporelles.items():
-            if matcher_contrainte_avec_genre(eq1_nom, eq1_genre, eq2_nom, eq2_genre, contrainte_key):
-                # Une contrainte s'applique à ce match, vérifier si elle est respectée
-                if not contrainte.est_respectee(creneau.semaine):
-                    return False
-        
-        # Aucune contrainte applicable ou toutes respectées
-        return True
+        eq1, eq2 = match.equipe1, match.equipe2
+        return [contrainte for contrainte_key, contrainte in self.contraintes_temporelles.items()
+                if matcher_contrainte_avec_genre(eq1.nom, eq1.genre, eq2.nom, eq2.genre, contrainte_key)]
     
     def _build_validator(self) -> ConstraintValidator:
-        """Build constraint validator with all constraints."""
+        """Build the validator of the state-dependent constraints.
+        
+        Les contraintes qui ne dépendent que du couple (match, créneau) — disponibilité
+        des équipes, obligation de présence, contrainte temporelle, semaine_min — sont
+        appliquées une seule fois par _candidats_statiques.
+        """
         validator = ConstraintValidator()
         
-        validator.add_constraint(TeamAvailabilityConstraint(
-            weight=self.config.poids_indisponibilite
-        ))
         validator.add_constraint(MaxMatchesPerWeekConstraint(
             max_matches=self.config.max_matchs_par_equipe_par_semaine,
             weight=self.config.poids_capacite_gymnase
@@ -118,96 +86,19 @@ class GreedySolver(BaseSolver):
         validator.add_constraint(LoadBalancingConstraint(
             weight=self.config.poids_equilibrage_charge
         ))
-        validator.add_constraint(PreferredTimeConstraint(
-            weight=self.config.penalite_apres_horaire_min,
-            penalty_before_one=self.config.penalite_avant_horaire_min,
-            penalty_before_both=self.config.penalite_avant_horaire_min_deux,
-            divisor=self.config.penalite_horaire_diviseur,
-            tolerance=self.config.penalite_horaire_tolerance
-        ))
+        # Les préférences horaires sont lues dans les tables de pénalités partagées (PenaltyTables)
         
         return validator
     
-    def _calculer_penalite_gymnase(self, match: Match, creneau: Creneau) -> float:
-        """
-        Calcule la pénalité/bonus pour les préférences de gymnase.
-        
-        Logique:
-        - Pénalité de base = 2 × max(bonus_preferences_gymnases)
-        - Pour chaque équipe, si le gymnase du créneau est dans ses préférences:
-          soustraire le bonus correspondant au rang de préférence
-        
-        Args:
-            match: Le match à planifier
-            creneau: Le créneau candidat
-            
-        Returns:
-            Pénalité finale (plus petit = meilleur)
-        """
-        if not self.config.bonus_preferences_gymnases:
-            return 0.0
-        
-        # Pénalité de base
-        base_penalty = 2 * max(self.config.bonus_preferences_gymnases)
-        penalty = base_penalty
-        
-        # Vérifier équipe 1
-        if match.equipe1.lieux_preferes:
-            for rang, gymnase in enumerate(match.equipe1.lieux_preferes):
-                if gymnase == creneau.gymnase and rang < len(self.config.bonus_preferences_gymnases):
-                    penalty -= self.config.bonus_preferences_gymnases[rang]
-                    break
-        
-        # Vérifier équipe 2
-        if match.equipe2.lieux_preferes:
-            for rang, gymnase in enumerate(match.equipe2.lieux_preferes):
-                if gymnase == creneau.gymnase and rang < len(self.config.bonus_preferences_gymnases):
-                    penalty -= self.config.bonus_preferences_gymnases[rang]
-                    break
-        
-        return penalty
-    
-    def _calculer_penalite_niveau_gymnase(self, match: Match, creneau: Creneau) -> float:
-        """
-        Calcule la pénalité pour les niveaux de gymnase.
-        
-        Pénalise les assignations inappropriées de matchs selon le niveau du gymnase.
-        Valeurs positives = pénalité (augmente le coût, à éviter).
-        
-        Args:
-            match: Le match à planifier
-            creneau: Le créneau candidat
-            
-        Returns:
-            Pénalité finale (valeur positive = pénalité, 0 = neutre)
-        """
-        if not self.config.penalite_niveau_gymnases_haut or not self.config.penalite_niveau_gymnases_bas or not self.niveaux_gymnases:
-            return 0.0
-        
-        # Déterminer le niveau du match
-        niveau_match = self._get_niveau_match(match)
-        if niveau_match is None:
-            return 0.0
-        
-        # Récupérer le niveau du gymnase
-        niveau_gymnase = self.niveaux_gymnases.get(creneau.gymnase)
-        if not niveau_gymnase:
-            return 0.0
-        
-        # Calculer la pénalité selon le niveau du gymnase et du match
-        penalite = 0.0
-        if niveau_gymnase == 'Haut niveau' and niveau_match < len(self.config.penalite_niveau_gymnases_haut):
-            penalite = self.config.penalite_niveau_gymnases_haut[niveau_match]
-        elif niveau_gymnase == 'Bas niveau' and niveau_match < len(self.config.penalite_niveau_gymnases_bas):
-            penalite = self.config.penalite_niveau_gymnases_bas[niveau_match]
-        
-        return penalite  # Retourne directement la pénalité (positif = mauvais)
-    
     def solve(self, matchs: List[Match], creneaux: List[Creneau], 
              gymnases: Dict[str, Gymnase], obligations_presence: Dict[str, str] = {}, 
              matchs_fixes: Optional[List[Match]] = None) -> Solution:
         """Solve using greedy algorithm with multiple attempts.
         
+        Les essais s'arrêtent au premier calendrier complet. Avec greedy_graine, chaque
+        essai a sa propre graine tirée de la graine maîtresse : le résultat ne dépend
+        alors ni du nombre de processus (greedy_nb_processus) ni de leur ordonnancement.
+        
         Args:
             matchs: List of matches to schedule
             creneaux: List of available time slots
@@ -220,28 +111,47 @@ class GreedySolver(BaseSolver):
         """
         self.validator = self._build_validator()
         
-        if obligations_presence:
-            self.validator.add_constraint(VenuePresenceObligationConstraint(
-                obligations=obligations_presence,
-                weight=self.config.poids_indisponibilite
-            ))
+        # Créneaux candidats de chaque match (contraintes statiques), communs à tous les essais
+        candidats = self._candidats_statiques(matchs, creneaux, obligations_presence)
         
         # Les matchs fixés ne doivent pas être dans la liste matchs (ils sont déjà exclus par le pipeline)
         # Mais on les utilise pour initialiser le solution_state
         matchs_fixes_list = matchs_fixes or []
         
+        # Graine de chaque essai (None = générateur global, comportement historique)
+        graines = None
+        if self.config.greedy_graine is not None:
+            generateur = random.Random(self.config.greedy_graine)
+            graines = [generateur.getrandbits(32) for _ in range(self.config.nb_essais)]
+        
+        nb_processus = min(self.config.nb_essais, self.config.greedy_nb_processus or os.cpu_count() or 1)
+        if nb_processus > 1:
+            if graines is None:
+                graines = [random.getrandbits(32) for _ in range(self.config.nb_essais)]
+            return self._solve_parallele(matchs, creneaux, gymnases, obligations_presence,
+                                         matchs_fixes_list, graines, nb_processus)
+        
         best_solution = None
-        best_score = float('inf')
+        best_key = None
+        best_creneaux = []
         
         for essai in range(self.config.nb_essais):
             if self.config.afficher_progression and self.config.niveau_log >= 1:
                 print(f"  Essai {essai + 1}/{self.config.nb_essais}...", end=" ")
             
-            solution = self._solve_once(matchs.copy(), creneaux.copy(), gymnases, matchs_fixes_list)
+            # Les objets Match sont partagés entre essais : chaque essai repart sans créneau
+            for match in matchs:
+                match.creneau = None
+            
+            rng = random.Random(graines[essai]) if graines else None
+            solution = self._solve_once(matchs.copy(), creneaux.copy(), gymnases, candidats, matchs_fixes_list, rng)
             
-            if solution.est_complete() or solution.score < best_score:
+            # Meilleur essai : le plus de matchs planifiés, puis la plus faible pénalité
+            key = (len(solution.matchs_non_planifies), solution.score)
+            if best_key is None or key < best_key:
                 best_solution = solution
-                best_score = solution.score
+                best_key = key
+                best_creneaux = [(match, match.creneau) for match in solution.matchs_planifies]
             
             if self.config.afficher_progression and self.config.niveau_log >= 1:
                 print(f"{solution.taux_planification():.1f}% planifié")
@@ -249,30 +159,174 @@ class GreedySolver(BaseSolver):
             if solution.est_complete():
                 break
         
+        # Restaurer les créneaux du meilleur essai (écrasés par les essais suivants)
+        for match in matchs:
+            match.creneau = None
+        for match, creneau in best_creneaux:
+            match.creneau = creneau
+        
         return best_solution
     
+    def _solve_parallele(self, matchs: List[Match], creneaux: List[Creneau], gymnases: Dict[str, Gymnase],
+                         obligations_presence: Dict[str, str], matchs_fixes: List[Match],
+                         graines: List[int], nb_processus: int) -> Solution:
+        """Run the seeded tries over a process pool, stopping at the first complete calendar.
+        
+        Le résultat est celui de l'exécution séquentielle des mêmes graines : meilleur
+        essai parmi les essais jusqu'au premier complet (dans l'ordre des graines). Dès
+        qu'un essai est complet, les essais suivants non démarrés sont annulés.
+        
+        Args:
+            matchs: Matchs à planifier
+            creneaux: Créneaux disponibles
+            gymnases: Dictionnaire des gymnases
+            obligations_presence: Institution requise par gymnase
+            matchs_fixes: Matchs déjà planifiés/fixés
+            graines: Graine de chaque essai
+            nb_processus: Nombre de processus
+        
+        Returns:
+            Meilleure solution (créneaux restaurés sur les objets Match de l'appelant)
+        """
+        resultats = {}
+        premier_complet = None
+        with ProcessPoolExecutor(max_workers=nb_processus, initializer=_initialiser_processus,
+                                 initargs=(self, matchs, creneaux, gymnases, obligations_presence,
+                                           matchs_fixes)) as executor:
+            futures = {executor.submit(_essai_processus, graine): essai for essai, graine in enumerate(graines)}
+            for future in as_completed(futures):
+                essai = futures[future]
+                if future.cancelled():
+                    continue
+                resultats[essai] = future.result()
+                if resultats[essai][0][0] == 0 and (premier_complet is None or essai < premier_complet):
+                    premier_complet = essai
+                    for autre, numero in futures.items():
+                        if numero > essai:
+                            autre.cancel()
+                if premier_complet is not None and all(k in resultats for k in range(premier_complet + 1)):
+                    break
+        
+        # Meilleur essai : le plus de matchs planifiés, puis la plus faible pénalité (premier en cas d'égalité)
+        essais = sorted(k for k in resultats if premier_complet is None or k <= premier_complet)
+        meilleur = min(essais, key=lambda k: resultats[k][0])
+        (_, score), placements, non_planifies = resultats[meilleur]
+        
+        if self.config.afficher_progression and self.config.niveau_log >= 1:
+            print(f"  {len(essais)}/{len(graines)} essai(s) sur {nb_processus} processus, "
+                  f"meilleur: essai {meilleur + 1} ({len(placements)}/{len(matchs)} planifiés)")
+        
+        for match in matchs:
+            match.creneau = None
+        for i, j in placements:
+            matchs[i].creneau = creneaux[j]
+        
+        return Solution(
+            matchs_planifies=[matchs[i] for i, _ in placements],
+            matchs_non_planifies=[matchs[i] for i in non_planifies],
+            score=score,
+            metadata={'solver': 'greedy'}
+        )
+    
+    def _candidats_statiques(self, matchs: List[Match], creneaux: List[Creneau],
+                             obligations_presence: Dict[str, str]) -> Dict[int, List[Tuple[Creneau, float]]]:
+        """
+        Pré-filtre les créneaux de chaque match selon les contraintes qui ne changent pas
+        pendant la résolution.
+        
+        Contraintes dures : semaine_min, disponibilité des deux équipes, obligation de
+        présence, contrainte temporelle (mode dur). Pénalités statiques : contrainte
+        temporelle (mode souple), préférences horaires et de gymnase, niveau de gymnase.
+        
+        Args:
+            matchs: Matchs à planifier
+            creneaux: Créneaux disponibles
+            obligations_presence: Institution requise par gymnase
+        
+        Returns:
+            Dict {id(match): [(créneau, pénalité statique)]} dans l'ordre de creneaux
+        """
+        creneaux_ouverts = [c for c in creneaux if c.semaine >= self.config.semaine_min]
+        
+        # Disponibilités calculées une seule fois par équipe
+        disponibilites = {}
+        for match in matchs:
+            for equipe in (match.equipe1, match.equipe2):
+                if equipe.id_unique not in disponibilites:
+                    disponibilites[equipe.id_unique] = [
+                        equipe.est_disponible(c.semaine, c.horaire, c.gymnase) for c in creneaux_ouverts
+                    ]
+        
+        candidats = {}
+        for match in matchs:
+            dispo1 = disponibilites[match.equipe1.id_unique]
+            dispo2 = disponibilites[match.equipe2.id_unique]
+            institutions = (match.equipe1.institution, match.equipe2.institution)
+            contraintes = self._contraintes_temporelles_du_match(match)
+            semaines_respectees = {}
+            
+            liste = []
+            for k, creneau in enumerate(creneaux_ouverts):
+                if not (dispo1[k] and dispo2[k]):
+                    continue
+                institution_requise = obligations_presence.get(creneau.gymnase)
+                if institution_requise and institution_requise not in institutions:
+                    continue
+                
+                penalty = 0.0
+                if contraintes:
+                    respectee = semaines_respectees.get(creneau.semaine)
+                    if respectee is None:
+                        respectee = all(c.est_respectee(creneau.semaine) for c in contraintes)
+                        semaines_respectees[creneau.semaine] = respectee
+                    if not respectee:
+                        if self.config.contrainte_temporelle_dure:
+                            continue
+                        penalty += self.config.contrainte_temporelle_penalite
+                
+                # Pénalités factorisées par attribut du créneau (tables partagées) :
+                # préférences horaires, préférences de gymnase, niveaux de gymnase
+                penalty += self.penalty_tables.penalite_horaire(match, creneau.horaire)
+                penalty += self.penalty_tables.penalite_gymnase(match, creneau.gymnase)
+                penalty += self.penalty_tables.penalite_niveau_gymnase(match, creneau.gymnase)
+                liste.append((creneau, penalty))
+            candidats[id(match)] = liste
+        
+        return candidats
+    
     def _solve_once(self, matchs: List[Match], creneaux: List[Creneau], 
-                   gymnases: Dict[str, Gymnase], matchs_fixes: Optional[List[Match]] = None) -> Solution:
+                   gymnases: Dict[str, Gymnase], candidats: Dict[int, List[Tuple[Creneau, float]]],
+                   matchs_fixes: Optional[List[Match]] = None,
+                   rng: Optional[random.Random] = None) -> Solution:
         """Single greedy solve attempt.
         
         Args:
             matchs: Matches to schedule
             creneaux: Available time slots
             gymnases: Dict of venues
+            candidats: Créneaux candidats de chaque match, obligations de présence
+                comprises (voir _candidats_statiques)
             matchs_fixes: Fixed matches (already scheduled) to consider for penalties
+            rng: Générateur de l'essai (None = module random)
         """
+        alea = rng or random
         
         # Trier les matchs pour placer les ententes en dernier (priorité plus faible)
         if self.config.entente_actif:
             matchs_normaux = [m for m in matchs if not self._est_entente(m)]
             matchs_ententes = [m for m in matchs if self._est_entente(m)]
-            random.shuffle(matchs_normaux)
-            random.shuffle(matchs_ententes)
+            alea.shuffle(matchs_normaux)
+            alea.shuffle(matchs_ententes)
             matchs = matchs_normaux + matchs_ententes
         else:
-            random.shuffle(matchs)
+            alea.shuffle(matchs)
+        
+        # Matchs les plus contraints d'abord (le mélange départage les égalités)
+        if self.config.greedy_ordre == 'contraint':
+            matchs.sort(key=lambda m: (self._est_entente(m), len(candidats[id(m)])))
         
-        random.shuffle(creneaux)
+        alea.shuffle(creneaux)
+        rangs = {id(creneau): rang for rang, creneau in enumerate(creneaux)}
         
         # Créer l'état initial en incluant les matchs fixés
         solution_state = self._create_solution_state(matchs_fixes or [])
@@ -280,40 +334,22 @@ class GreedySolver(BaseSolver):
         matchs_non_planifies = []
         total_penalty = 0.0
         
+        # Index incrémentaux des matchs placés (pénalités d'overlap et d'aller-retour en O(1))
+        matchs_par_creneau: Dict[Tuple, List[Match]] = {}  # (semaine, horaire, gymnase) → matchs
+        matchs_par_paire: Dict[Tuple, List[Match]] = {}  # (poule, équipe recevante, équipe visiteuse) → matchs
+        
+        if self.config.greedy_ordre == 'dynamique':
+            matchs = self._ordre_dynamique(matchs, candidats, solution_state)
+        
         for match in matchs:
             best_creneau = None
             best_penalty = float('inf')
             
-            for creneau in creneaux:
-                if match.creneau:
-                    break
-                
-                # Vérifier la contrainte semaine_min (ne pas planifier avant cette semaine)
-                if creneau.semaine < self.config.semaine_min:
-                    continue
-                
-                # Vérifier la contrainte temporelle
-                if not self._respecte_contrainte_temporelle(match, creneau):
-                    if self.config.contrainte_temporelle_dure:
-                        # Mode dur: bloquer ce placement
-                        continue
-                    else:
-                        # Mode souple: on peut placer mais avec pénalité
-                        pass  # La pénalité sera ajoutée après
-                
+            # Candidats pré-filtrés, parcourus dans l'ordre (mélangé) des créneaux de l'essai :
+            # seules les contraintes dépendant de l'état sont évaluées ici
+            for creneau, penalite_statique in sorted(candidats[id(match)], key=lambda c: rangs[id(c[0])]):
                 is_valid, penalty = self.validator.validate_assignment(match, creneau, solution_state)
-                
-                # Ajouter la pénalité pour contrainte temporelle violée (mode souple)
-                if self.config.contrainte_temporelle_actif and not self._respecte_contrainte_temporelle(match, creneau):
-                    penalty += self.config.contrainte_temporelle_penalite
-                
-                # Ajouter la pénalité pour les préférences de gymnase
-                penalty_gymnase = self._calculer_penalite_gymnase(match, creneau)
-                penalty += penalty_gymnase
-                
-                # Ajouter la pénalité/bonus pour les niveaux de gymnase
-                penalty_niveau = self._calculer_penalite_niveau_gymnase(match, creneau)
-                penalty += penalty_niveau
+                penalty += penalite_statique
                 
                 if is_valid and penalty < best_penalty:
                     best_creneau = creneau
@@ -326,42 +362,33 @@ class GreedySolver(BaseSolver):
                 total_penalty += best_penalty
                 
                 # Pénalité pour compaction temporelle (prioriser début de calendrier)
-                if self.config.compaction_temporelle_actif:
-                    semaine = best_creneau.semaine
-                    # Récupérer la pénalité pour cette semaine (indice 0 = semaine 1)
-                    if semaine <= len(self.config.compaction_penalites_par_semaine):
-                        penalty_compaction = self.config.compaction_penalites_par_semaine[semaine - 1]
-                    else:
-                        # Si on dépasse le nb de semaines définies, utiliser la dernière pénalité
-                        penalty_compaction = self.config.compaction_penalites_par_semaine[-1]
-                    total_penalty += penalty_compaction
+                total_penalty += self.penalty_tables.penalite_compaction(best_creneau.semaine)
                 
                 # Pénalité pour overlaps d'institution/équipe (matchs simultanés dans un groupe de non-simultanéité)
+                key_creneau = (best_creneau.semaine, best_creneau.horaire, best_creneau.gymnase)
                 if self.config.overlap_institution_actif:
                     # Vérifier si d'autres matchs partageant un groupe sont déjà planifiés au même moment
-                    key_creneau = (best_creneau.semaine, best_creneau.horaire, best_creneau.gymnase)
-                    
-                    for autre_match in matchs_planifies[:-1]:  # Tous sauf le dernier (celui qu'on vient d'ajouter)
-                        if autre_match.creneau:
-                            key_autre = (autre_match.creneau.semaine, autre_match.creneau.horaire, 
-                                       autre_match.creneau.gymnase)
-                            if key_creneau == key_autre:
-                                # Vérifier si les matchs partagent un groupe de non-simultanéité
-                                if self._matchs_partagent_groupe_non_simultaneite(match, autre_match):
-                                    total_penalty += self.config.overlap_institution_poids
+                    for autre_match in matchs_par_creneau.get(key_creneau, []):
+                        # Vérifier si les matchs partagent un groupe de non-simultanéité
+                        if self._matchs_partagent_groupe_non_simultaneite(match, autre_match):
+                            total_penalty += self.config.overlap_institution_poids
+                matchs_par_creneau.setdefault(key_creneau, []).append(match)
                 
                 # Pénalité pour espacement aller-retour (si poules de type Aller-Retour)
+                equipe1 = (match.equipe1.nom, match.equipe1.genre)
+                equipe2 = (match.equipe2.nom, match.equipe2.genre)
                 if self.config.aller_retour_espacement_actif:
-                    for autre_match in matchs_planifies[:-1]:  # Tous sauf le dernier (celui qu'on vient d'ajouter)
-                        if autre_match.creneau and self._sont_matchs_aller_retour(match, autre_match):
-                            semaine_diff = abs(best_creneau.semaine - autre_match.creneau.semaine)
-                            
-                            if semaine_diff == 0:
-                                # Même semaine: pénalité très élevée
-                                total_penalty += self.config.aller_retour_penalite_meme_semaine
-                            elif semaine_diff == 1:
-                                # Semaines consécutives: pénalité modérée
-                                total_penalty += self.config.aller_retour_penalite_consecutives
+                    # Match retour déjà placé : mêmes équipes en ordre inverse, même poule
+                    for autre_match in matchs_par_paire.get((match.poule, equipe2, equipe1), []):
+                        semaine_diff = abs(best_creneau.semaine - autre_match.creneau.semaine)
+                        
+                        if semaine_diff == 0:
+                            # Même semaine: pénalité très élevée
+                            total_penalty += self.config.aller_retour_penalite_meme_semaine
+                        elif semaine_diff == 1:
+                            # Semaines consécutives: pénalité modérée
+                            total_penalty += self.config.aller_retour_penalite_consecutives
+                matchs_par_paire.setdefault((match.poule, equipe1, equipe2), []).append(match)
                 
                 # NE PLUS SUPPRIMER LE CRÉNEAU: la contrainte VenueCapacityConstraint
                 # s'occupe de bloquer les créneaux qui ont atteint leur capacité maximale
@@ -376,6 +403,60 @@ class GreedySolver(BaseSolver):
             metadata={'solver': 'greedy'}
         )
     
+    def _ordre_dynamique(self, matchs: List[Match], candidats: Dict[int, List[Tuple[Creneau, float]]],
+                         solution_state: Dict):
+        """
+        Ordre « le plus contraint d'abord » recalculé au fil des placements (style DSATUR).
+        
+        Le prochain match est celui qui a le moins de créneaux candidats encore libres
+        au regard des contraintes dures dépendant de l'état (max par semaine,
+        simultanéité). Générateur : à chaque reprise, le match précédent a été placé
+        (ou non) par l'appelant, seuls les matchs de ses équipes sont recomptés.
+        Les ententes restent en dernier, l'ordre mélangé départage les égalités.
+        
+        Args:
+            matchs: Matchs à planifier (ordre mélangé de l'essai)
+            candidats: Créneaux candidats de chaque match (voir _candidats_statiques)
+            solution_state: État de la solution, mis à jour par l'appelant
+        
+        Yields:
+            Prochain match à placer
+        """
+        contraintes_dures = [c for c in self.validator.constraints if c.hard]
+        
+        def nb_libres(match: Match) -> int:
+            return sum(1 for creneau, _ in candidats[id(match)]
+                       if all(c.validate(match, creneau, solution_state)[0] for c in contraintes_dures))
+        
+        matchs_par_equipe: Dict[str, List[int]] = {}
+        for k, match in enumerate(matchs):
+            for equipe in (match.equipe1.id_unique, match.equipe2.id_unique):
+                matchs_par_equipe.setdefault(equipe, []).append(k)
+        
+        ententes = [self._est_entente(match) for match in matchs]
+        comptes = [nb_libres(match) for match in matchs]
+        restants = set(range(len(matchs)))
+        tas = [(ententes[k], comptes[k], k) for k in restants]
+        heapq.heapify(tas)
+        
+        while tas:
+            _, nb, k = heapq.heappop(tas)
+            if k not in restants or nb != comptes[k]:
+                continue  # Entrée périmée (match déjà traité ou recompté depuis)
+            restants.discard(k)
+            match = matchs[k]
+            yield match
+            
+            if match.creneau is None:
+                continue  # Non planifié : l'état n'a pas changé
+            for equipe in (match.equipe1.id_unique, match.equipe2.id_unique):
+                for autre in matchs_par_equipe[equipe]:
+                    if autre in restants:
+                        nb_autre = nb_libres(matchs[autre])
+                        if nb_autre != comptes[autre]:
+                            comptes[autre] = nb_autre
+                            heapq.heappush(tas, (ententes[autre], nb_autre, autre))
+    
     def _sont_matchs_aller_retour(self, match1: Match, match2: Match) -> bool:
         """
         Vérifie si deux matchs sont une paire aller-retour.
@@ -446,3 +527,41 @@ class GreedySolver(BaseSolver):
     
     def get_name(self) -> str:
         return "Greedy"
+
+
+# Données des essais d'un processus du pool (transmises une seule fois par processus)
+_ETAT_PROCESSUS = {}
+
+
+def _initialiser_processus(solver: GreedySolver, matchs: List[Match], creneaux: List[Creneau],
+                           gymnases: Dict[str, Gymnase], obligations_presence: Dict[str, str],
+                           matchs_fixes: List[Match]):
+    """Store the try inputs and static candidates in a pool worker process."""
+    _ETAT_PROCESSUS.update(
+        solver=solver, matchs=matchs, creneaux=creneaux, gymnases=gymnases, matchs_fixes=matchs_fixes,
+        candidats=solver._candidats_statiques(matchs, creneaux, obligations_presence),
+        index_matchs={id(match): i for i, match in enumerate(matchs)},
+        index_creneaux={id(creneau): j for j, creneau in enumerate(creneaux)},
+    )
+
+
+def _essai_processus(graine: int) -> Tuple[Tuple[int, float], List[Tuple[int, int]], List[int]]:
+    """
+    Run one seeded greedy try in a pool worker process.
+    
+    Args:
+        graine: Graine de l'essai
+    
+    Returns:
+        Tuple ((nb non planifiés, pénalité), (match, créneau) dans l'ordre de placement,
+        matchs non planifiés), en indices des listes transmises au processus
+    """
+    etat = _ETAT_PROCESSUS
+    for match in etat['matchs']:
+        match.creneau = None
+    solution = etat['solver']._solve_once(etat['matchs'].copy(), etat['creneaux'].copy(), etat['gymnases'],
+                                          etat['candidats'], etat['matchs_fixes'], random.Random(graine))
+    placements = [(etat['index_matchs'][id(match)], etat['index_creneaux'][id(match.creneau)])
+                  for match in solution.matchs_planifies]
+    non_planifies = [etat['index_matchs'][id(match)] for match in solution.matchs_non_planifies]
+    return (len(non_planifies), solution.score), placements, non_planifies
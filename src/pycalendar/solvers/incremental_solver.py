@@ -0,0 +1,266 @@
+"""Incremental solver: minimal-perturbation re-solve of a previous solution."""
+
+import copy
+import json
+import time
+from pathlib import Path
+from typing import List, Dict, Optional, Set, Tuple
+from pycalendar.core.models import Match, Creneau, Gymnase, Solution
+from pycalendar.core.config import Config
+from .base_solver import BaseSolver
+from .cpsat_solver import CPSATSolver
+
+
+def charger_modifications(chemin: Path) -> List[dict]:
+    """
+    Charge les modifications exportées par l'interface (modification-manager.js).
+    
+    Args:
+        chemin: Fichier JSON ({"export_version", "modifications": [{"match_id", "new": {...}}]})
+    
+    Returns:
+        Liste des modifications
+    """
+    with open(chemin, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    if 'modifications' not in data:
+        raise ValueError(f"Champ requis manquant dans {chemin}: modifications")
+    
+    return data['modifications']
+
+
+class IncrementalSolver(BaseSolver):
+    """
+    Replanification incrémentale à perturbation minimale.
+    
+    Repart d'une solution sauvegardée (SolutionStore.load_latest) : les placements
+    modifiés dans l'interface sont imposés, ceux devenus invalides avec les données
+    actuelles (nouvelles indisponibilités, gymnases fermés, capacité) sont en conflit.
+    Seuls les matchs en conflit, les matchs non planifiés et les matchs des mêmes
+    équipes à ± incremental_semaines_voisinage semaines sont replanifiés par CP-SAT ;
+    tous les autres sont figés. Un match libéré qui quitte son créneau précédent coûte
+    incremental_poids_deplacement.
+    """
+    
+    def __init__(self, config: Config, solution_precedente: dict,
+                 modifications: Optional[List[dict]] = None,
+                 groupes_non_simultaneite: Optional[Dict[str, Set[str]]] = None,
+                 ententes: Optional[Dict] = None, contraintes_temporelles: Optional[Dict] = None,
+                 niveaux_gymnases: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            config: Configuration
+            solution_precedente: Solution sauvegardée (format JSON du SolutionStore)
+            modifications: Modifications de l'interface (voir charger_modifications)
+            groupes_non_simultaneite: Groupes d'institutions à ne pas faire jouer simultanément
+            ententes: Paires d'institutions en entente
+            contraintes_temporelles: Contraintes temporelles par paire d'équipes
+            niveaux_gymnases: Niveau de chaque gymnase
+        """
+        super().__init__(config)
+        self.solution_precedente = solution_precedente
+        self.modifications = modifications or []
+        self.groupes_non_simultaneite = groupes_non_simultaneite
+        self.ententes = ententes
+        self.contraintes_temporelles = contraintes_temporelles
+        self.niveaux_gymnases = niveaux_gymnases
+    
+    def get_name(self) -> str:
+        return "Incrémental"
+    
+    def _placements_precedents(self, matchs: List[Match], creneaux: List[Creneau]) -> Tuple[List[Optional[Creneau]], Set[int]]:
+        """
+        Retrouve le créneau précédent de chaque match et applique les modifications.
+        
+        Les matchs sont associés par (equipe1_id, equipe2_id) dans l'ordre (aller et
+        retour sont des matchs distincts), les créneaux par (semaine, horaire, gymnase).
+        
+        Args:
+            matchs: Matchs à planifier
+            creneaux: Créneaux disponibles
+        
+        Returns:
+            Tuple (créneau précédent de chaque match ou None, indices des matchs modifiés)
+        """
+        entrees = self.solution_precedente.get('matches', {}).get('scheduled')
+        if entrees is None:
+            entrees = self.solution_precedente.get('assignments', [])
+        
+        creneaux_par_cle = {(c.semaine, c.horaire, c.gymnase): c for c in creneaux}
+        indices_par_equipes = {}
+        for i, match in enumerate(matchs):
+            indices_par_equipes.setdefault((match.equipe1.id_unique, match.equipe2.id_unique), []).append(i)
+        
+        placements = [None] * len(matchs)
+        indice_par_match_id = {}
+        for entree in entrees:
+            candidats = indices_par_equipes.get((entree.get('equipe1_id'), entree.get('equipe2_id')), [])
+            if not candidats:
+                continue  # Match fixé (exclu de matchs) ou disparu des données
+            i = candidats.pop(0)
+            indice_par_match_id[entree.get('match_id')] = i
+            # Créneau disparu (gymnase fermé, semaine retirée) : conservé tel quel, il est
+            # rejeté par reparer_affectation et le match est en conflit
+            cle = (entree['semaine'], entree['horaire'], entree['gymnase'])
+            placements[i] = creneaux_par_cle.get(cle) or Creneau(*cle)
+        
+        modifies = set()
+        for modification in self.modifications:
+            i = indice_par_match_id.get(modification.get('match_id'))
+            nouveau = modification.get('new') or {}
+            if i is None:
+                print(f"   ⚠️  Modification ignorée: match {modification.get('match_id')} introuvable")
+                continue
+            
+            precedent = placements[i]
+            cle = (
+                nouveau.get('semaine') if nouveau.get('semaine') is not None else getattr(precedent, 'semaine', None),
+                nouveau.get('horaire') if nouveau.get('horaire') is not None else getattr(precedent, 'horaire', None),
+                nouveau.get('gymnase') if nouveau.get('gymnase') is not None else getattr(precedent, 'gymnase', None),
+            )
+            if cle not in creneaux_par_cle:
+                print(f"   ⚠️  Modification ignorée: créneau S{cle[0]} {cle[1]} @ {cle[2]} inexistant "
+                      f"({modification.get('match_id')})")
+                continue
+            placements[i] = creneaux_par_cle[cle]
+            modifies.add(i)
+        
+        return placements, modifies
+    
+    def _matchs_liberes(self, matchs: List[Match], precedents: List[Optional[Creneau]],
+                        placements: List[Optional[Creneau]], conflits: Set[int]) -> Set[int]:
+        """
+        Matchs en conflit et leur voisinage : matchs des mêmes équipes placés à
+        ± incremental_semaines_voisinage semaines du créneau précédent d'un conflit.
+        
+        Args:
+            matchs: Matchs à planifier
+            precedents: Créneau précédent de chaque match (None si non planifié)
+            placements: Placement conservé de chaque match (None si en conflit ou non planifié)
+            conflits: Indices des matchs à replanifier
+        
+        Returns:
+            Indices des matchs libérés
+        """
+        rayon = max(0, self.config.incremental_semaines_voisinage)
+        semaines_par_equipe = {}  # équipe → semaines autour desquelles libérer ses autres matchs
+        for i in conflits:
+            semaine = precedents[i].semaine if precedents[i] is not None else None
+            for equipe in (matchs[i].equipe1, matchs[i].equipe2):
+                semaines = semaines_par_equipe.setdefault(equipe.id_unique, set())
+                if semaine is not None:
+                    semaines.add(semaine)
+        
+        liberes = set(conflits)
+        for i, creneau in enumerate(placements):
+            if creneau is None or i in liberes:
+                continue
+            for equipe in (matchs[i].equipe1, matchs[i].equipe2):
+                semaines = semaines_par_equipe.get(equipe.id_unique)
+                if semaines and any(abs(creneau.semaine - semaine) <= rayon for semaine in semaines):
+                    liberes.add(i)
+                    break
+        
+        return liberes
+    
+    def solve(self, matchs: List[Match], creneaux: List[Creneau],
+             gymnases: Dict[str, Gymnase], obligations_presence: Optional[Dict[str, str]] = None,
+             matchs_fixes: Optional[List[Match]] = None) -> Solution:
+        """
+        Replanifie les seuls matchs en conflit (et leur voisinage).
+        
+        Args:
+            matchs: Liste des matchs à planifier
+            creneaux: Liste des créneaux disponibles
+            gymnases: Dictionnaire des gymnases
+            obligations_presence: Contraintes de présence par gymnase
+            matchs_fixes: Matchs déjà planifiés/fixés
+        
+        Returns:
+            Solution (metadata['incremental'] détaille conflits, matchs libérés et déplacés)
+        """
+        obligations_presence = obligations_presence or {}
+        matchs_fixes = list(matchs_fixes or [])
+        start_time = time.time()
+        
+        config_resolution = copy.copy(self.config)
+        config_resolution.temps_max_secondes = self.config.incremental_temps_max_secondes
+        config_resolution.cpsat_warm_start = False
+        cpsat = CPSATSolver(config_resolution, self.groupes_non_simultaneite, self.ententes,
+                            self.contraintes_temporelles, self.niveaux_gymnases)
+        
+        precedents, modifies = self._placements_precedents(matchs, creneaux)
+        
+        # Validité avec les données actuelles : les matchs modifiés passent en premier
+        # (placements imposés), les autres gardent leur créneau s'il reste réalisable
+        ordre = sorted(range(len(matchs)), key=lambda i: i not in modifies)
+        repares = cpsat.reparer_affectation([matchs[i] for i in ordre], [precedents[i] for i in ordre],
+                                            creneaux, gymnases, obligations_presence, matchs_fixes)
+        placements = [None] * len(matchs)
+        for i, creneau in zip(ordre, repares):
+            placements[i] = creneau
+        
+        modifies_invalides = {i for i in modifies if placements[i] is None}
+        for i in sorted(modifies_invalides):
+            print(f"   ⚠️  Modification irréalisable ({matchs[i].equipe1.nom} vs {matchs[i].equipe2.nom}), match replanifié")
+        imposes = modifies - modifies_invalides
+        
+        conflits = {i for i, creneau in enumerate(placements) if creneau is None}
+        nb_conflits = sum(1 for i in conflits if precedents[i] is not None)
+        liberes = self._matchs_liberes(matchs, precedents, placements, conflits) - imposes
+        libres = sorted(liberes)
+        
+        print(f"\n🩹 Replanification incrémentale: {len(imposes)} modification(s) imposée(s), "
+              f"{nb_conflits} conflit(s), {len(conflits) - nb_conflits} match(s) sans créneau précédent, "
+              f"{len(libres)}/{len(matchs)} match(s) libéré(s)")
+        
+        affectation = list(placements)
+        statut = 'OPTIMAL'
+        if libres:
+            ensemble_libres = set(libres)
+            figes = [self._figer_match(matchs[i], creneau) for i, creneau in enumerate(placements)
+                     if creneau is not None and i not in ensemble_libres]
+            sous_solution = cpsat.solve([matchs[i] for i in libres], creneaux, gymnases, obligations_presence,
+                                        use_warm_start=False, matchs_fixes=matchs_fixes + figes,
+                                        creneaux_initiaux=[placements[i] for i in libres],
+                                        creneaux_precedents=[precedents[i] for i in libres])
+            statut = sous_solution.metadata.get('status')
+            sous_planifies = {id(match) for match in sous_solution.matchs_planifies}
+            for i in libres:
+                affectation[i] = matchs[i].creneau if id(matchs[i]) in sous_planifies else None
+        
+        matchs_planifies = []
+        matchs_non_planifies = []
+        nb_deplaces = 0
+        for i, (match, creneau) in enumerate(zip(matchs, affectation)):
+            match.creneau = creneau
+            if creneau is None:
+                matchs_non_planifies.append(match)
+                continue
+            matchs_planifies.append(match)
+            if precedents[i] is not None and i not in imposes and creneau != precedents[i]:
+                nb_deplaces += 1
+        
+        score = cpsat.evaluer_affectation(matchs, affectation, matchs_fixes)
+        duree = time.time() - start_time
+        print(f"   Incrémental: {nb_deplaces} match(s) déplacé(s), {len(matchs_planifies)}/{len(matchs)} matchs, "
+              f"score {score:.0f} en {duree:.2f}s")
+        
+        return Solution(
+            matchs_planifies=matchs_planifies,
+            matchs_non_planifies=matchs_non_planifies,
+            score=score,
+            metadata={
+                'solver': 'incremental',
+                'status': statut,
+                'incremental': {
+                    'nb_modifications': len(imposes),
+                    'nb_modifications_irrealisables': len(modifies_invalides),
+                    'nb_conflits': nb_conflits,
+                    'nb_liberes': len(libres),
+                    'nb_deplaces': nb_deplaces,
+                    'temps_secondes': duree,
+                },
+            }
+        )
@@ -0,0 +1,206 @@
+"""Large Neighbourhood Search: greedy start improved by CP-SAT sub-models."""
+
+import contextlib
+import copy
+import io
+import random
+import time
+from typing import List, Dict, Optional, Set
+from pycalendar.core.models import Match, Creneau, Gymnase, Solution
+from pycalendar.core.config import Config
+from .base_solver import BaseSolver
+from .greedy_solver import GreedySolver
+from .cpsat_solver import CPSATSolver
+
+
+class LNSSolver(BaseSolver):
+    """
+    Large Neighbourhood Search : part d'une solution gloutonne puis libère un voisinage
+    (une semaine, un gymnase, une poule ou une institution) et le réoptimise avec un
+    petit modèle CP-SAT, tous les autres matchs restant figés comme matchs fixés.
+    
+    Le type de voisinage est tiré selon des poids adaptatifs : un voisinage qui vient
+    d'améliorer la solution est tiré plus souvent.
+    """
+    
+    VOISINAGES = ('semaine', 'gymnase', 'poule', 'institution')
+    
+    def __init__(self, config: Config, groupes_non_simultaneite: Optional[Dict[str, Set[str]]] = None,
+                 ententes: Optional[Dict] = None, contraintes_temporelles: Optional[Dict] = None,
+                 niveaux_gymnases: Optional[Dict[str, str]] = None):
+        super().__init__(config)
+        self.groupes_non_simultaneite = groupes_non_simultaneite
+        self.ententes = ententes
+        self.contraintes_temporelles = contraintes_temporelles
+        self.niveaux_gymnases = niveaux_gymnases
+    
+    def get_name(self) -> str:
+        return "LNS"
+    
+    def _choisir_voisinage(self, poids: Dict[str, float]) -> str:
+        """Tire un type de voisinage proportionnellement à son poids."""
+        return random.choices(list(poids), weights=list(poids.values()))[0]
+    
+    def _matchs_voisinage(self, type_voisinage: str, matchs: List[Match],
+                          affectation: List[Optional[Creneau]]) -> List[int]:
+        """
+        Sélectionne les matchs libérés par un voisinage tiré au hasard.
+        
+        Semaine et gymnase : matchs placés dans la semaine / le gymnase, plus les matchs
+        non planifiés de leurs équipes. Poule et institution : tous leurs matchs.
+        
+        Args:
+            type_voisinage: 'semaine', 'gymnase', 'poule' ou 'institution'
+            matchs: Matchs à planifier
+            affectation: Créneau courant de chaque match (None si non planifié)
+        
+        Returns:
+            Indices des matchs libérés (au plus lns_taille_voisinage_max)
+        """
+        if type_voisinage in ('semaine', 'gymnase'):
+            attribut = lambda creneau: creneau.semaine if type_voisinage == 'semaine' else creneau.gymnase
+            valeurs = sorted({attribut(creneau) for creneau in affectation if creneau is not None})
+            if not valeurs:
+                return []
+            valeur = random.choice(valeurs)
+            libres = [i for i, creneau in enumerate(affectation) if creneau is not None and attribut(creneau) == valeur]
+            equipes = {equipe.id_unique for i in libres for equipe in (matchs[i].equipe1, matchs[i].equipe2)}
+            libres += [i for i, creneau in enumerate(affectation)
+                       if creneau is None and (matchs[i].equipe1.id_unique in equipes
+                                               or matchs[i].equipe2.id_unique in equipes)]
+        elif type_voisinage == 'poule':
+            poule = random.choice(sorted({match.poule for match in matchs}))
+            libres = [i for i, match in enumerate(matchs) if match.poule == poule]
+        else:
+            institution = random.choice(sorted({equipe.institution for match in matchs
+                                                for equipe in (match.equipe1, match.equipe2)}))
+            libres = [i for i, match in enumerate(matchs)
+                      if institution in (match.equipe1.institution, match.equipe2.institution)]
+        
+        if len(libres) > self.config.lns_taille_voisinage_max:
+            libres = random.sample(libres, self.config.lns_taille_voisinage_max)
+        
+        return sorted(libres)
+    
+    def solve(self, matchs: List[Match], creneaux: List[Creneau],
+             gymnases: Dict[str, Gymnase], obligations_presence: Optional[Dict[str, str]] = None,
+             matchs_fixes: Optional[List[Match]] = None) -> Solution:
+        """
+        Solution gloutonne puis réoptimisation de voisinages jusqu'à temps_max_secondes.
+        
+        Args:
+            matchs: Liste des matchs à planifier
+            creneaux: Liste des créneaux disponibles
+            gymnases: Dictionnaire des gymnases
+            obligations_presence: Contraintes de présence par gymnase
+            matchs_fixes: Matchs déjà planifiés/fixés
+        
+        Returns:
+            Solution (metadata['lns'] détaille les itérations par type de voisinage)
+        """
+        obligations_presence = obligations_presence or {}
+        matchs_fixes = list(matchs_fixes or [])
+        start_time = time.time()
+        
+        # Solution de départ : glouton
+        greedy = GreedySolver(self.config, self.groupes_non_simultaneite, self.ententes,
+                              self.contraintes_temporelles, self.niveaux_gymnases)
+        solution_initiale = greedy.solve(matchs, creneaux, gymnases, obligations_presence, matchs_fixes)
+        planifies = {id(match) for match in solution_initiale.matchs_planifies}
+        affectation = [match.creneau if id(match) in planifies else None for match in matchs]
+        
+        # Sous-modèles CP-SAT : budget court par voisinage, objectif évalué sur l'affectation complète
+        config_voisinage = copy.copy(self.config)
+        config_voisinage.cpsat_warm_start = False
+        cpsat = CPSATSolver(config_voisinage, self.groupes_non_simultaneite, self.ententes,
+                            self.contraintes_temporelles, self.niveaux_gymnases)
+        
+        # Le glouton ne vérifie pas toutes les contraintes dures du modèle (capacité) :
+        # les placements invalides sont retirés pour que les matchs figés restent réalisables
+        affectation = cpsat.reparer_affectation(matchs, affectation, creneaux, gymnases,
+                                                obligations_presence, matchs_fixes)
+        nb_retires = len(planifies) - sum(1 for creneau in affectation if creneau is not None)
+        score = score_initial = cpsat.evaluer_affectation(matchs, affectation, matchs_fixes)
+        
+        print(f"\n🔁 LNS: départ glouton {len(planifies) - nb_retires}/{len(matchs)} matchs "
+              f"({nb_retires} placement(s) invalide(s) retiré(s)), score {score:.0f}")
+        
+        poids = {type_voisinage: 1.0 for type_voisinage in self.VOISINAGES}
+        stats = {type_voisinage: {'essais': 0, 'ameliorations': 0} for type_voisinage in self.VOISINAGES}
+        iterations = 0
+        
+        while True:
+            temps_restant = self.config.temps_max_secondes - (time.time() - start_time)
+            if temps_restant < 1:
+                break
+            
+            type_voisinage = self._choisir_voisinage(poids)
+            libres = self._matchs_voisinage(type_voisinage, matchs, affectation)
+            iterations += 1
+            stats[type_voisinage]['essais'] += 1
+            
+            ameliore = False
+            if libres:
+                ensemble_libres = set(libres)
+                figes = [self._figer_match(matchs[i], creneau) for i, creneau in enumerate(affectation)
+                         if creneau is not None and i not in ensemble_libres]
+                config_voisinage.temps_max_secondes = max(1, int(min(self.config.lns_temps_voisinage, temps_restant)))
+                
+                # Sorties des sous-modèles masquées, sauf en mode progression
+                silence = contextlib.nullcontext() if self.config.afficher_progression else contextlib.redirect_stdout(io.StringIO())
+                with silence:
+                    sous_solution = cpsat.solve([matchs[i] for i in libres], creneaux, gymnases,
+                                                obligations_presence, use_warm_start=False,
+                                                matchs_fixes=matchs_fixes + figes,
+                                                creneaux_initiaux=[affectation[i] for i in libres])
+                
+                if sous_solution.metadata.get('status') in ('OPTIMAL', 'FEASIBLE'):
+                    sous_planifies = {id(match) for match in sous_solution.matchs_planifies}
+                    candidate = list(affectation)
+                    for i in libres:
+                        candidate[i] = matchs[i].creneau if id(matchs[i]) in sous_planifies else None
+                    score_candidat = cpsat.evaluer_affectation(matchs, candidate, matchs_fixes)
+                    
+                    # Mouvements neutres acceptés (diversification), seules les hausses récompensent
+                    if score_candidat >= score:
+                        ameliore = score_candidat > score
+                        affectation, score = candidate, score_candidat
+            
+            if ameliore:
+                stats[type_voisinage]['ameliorations'] += 1
+                if self.config.afficher_progression:
+                    print(f"   Itération {iterations} ({type_voisinage}, {len(libres)} matchs): score {score:.0f}")
+            
+            # Poids adaptatif : moyenne glissante des récompenses (2 si amélioration, 0 sinon), plancher 0.1
+            reaction = self.config.lns_reaction
+            poids[type_voisinage] = max(0.1, (1 - reaction) * poids[type_voisinage] + reaction * (2.0 if ameliore else 0.0))
+        
+        matchs_planifies = []
+        matchs_non_planifies = []
+        for match, creneau in zip(matchs, affectation):
+            match.creneau = creneau
+            if creneau is None:
+                matchs_non_planifies.append(match)
+            else:
+                matchs_planifies.append(match)
+        
+        print(f"   LNS: {iterations} itération(s) en {time.time() - start_time:.1f}s, "
+              f"{len(matchs_planifies)}/{len(matchs)} matchs, score {score_initial:.0f} → {score:.0f}")
+        
+        for type_voisinage in self.VOISINAGES:
+            stats[type_voisinage]['poids'] = round(poids[type_voisinage], 3)
+        
+        return Solution(
+            matchs_planifies=matchs_planifies,
+            matchs_non_planifies=matchs_non_planifies,
+            score=score,
+            metadata={
+                'solver': 'lns',
+                'status': 'FEASIBLE',
+                'lns': {
+                    'iterations': iterations,
+                    'score_initial': score_initial,
+                    'voisinages': stats,
+                },
+            }
+        )
@@ -0,0 +1,270 @@
+"""Cache disque des modèles CP-SAT construits (proto + index des variables), éviction LRU."""
+
+try:
+    from ortools.sat.python import cp_model
+    ORTOOLS_AVAILABLE = True
+except ImportError:
+    ORTOOLS_AVAILABLE = False
+
+import dataclasses
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+from pycalendar.core.models import Match, Creneau
+from pycalendar.core.config import Config
+from .model_stats import StatistiquesModele
+
+
+# Paramètres de résolution sans effet sur le modèle construit (exclus de l'empreinte des poids)
+CHAMPS_HORS_MODELE = {
+    'fichier_sortie', 'strategie', 'temps_max_secondes', 'nb_essais', 'fallback_greedy',
+    'afficher_progression', 'niveau_log', 'solution_format',
+    'incremental_fichier_modifications', 'incremental_semaines_voisinage', 'incremental_temps_max_secondes',
+    'analyse_faisabilite_actif', 'analyse_faisabilite_bloquante',
+}
+PREFIXES_HORS_MODELE = ('cpsat_', 'decomposition_', 'greedy_', 'horizon_', 'lns_')
+
+# Code qui construit le modèle : une modification invalide les modèles en cache
+FICHIERS_MODELE = ('solvers/cpsat_solver.py', 'solvers/model_index.py', 'solvers/model_stats.py',
+                   'core/penalty_tables.py')
+
+
+def modele_vers_texte(model) -> str:
+    """
+    Sérialise un modèle CP-SAT au format texte protobuf (indications comprises).
+    
+    Args:
+        model: Modèle CP-SAT
+    
+    Returns:
+        Proto du modèle au format texte
+    """
+    return str(model.Proto())
+
+
+def modele_depuis_texte(texte: str):
+    """
+    Reconstruit un modèle CP-SAT depuis son proto au format texte (modele_vers_texte).
+    
+    OR-Tools >= 9.12 expose parse_text_format sur le proto du modèle ; les versions
+    antérieures renvoient un message protobuf, lu avec google.protobuf.text_format.
+    
+    Args:
+        texte: Proto du modèle au format texte
+    
+    Returns:
+        Modèle CP-SAT
+    """
+    model = cp_model.CpModel()
+    proto = model.Proto()
+    if hasattr(proto, 'parse_text_format'):
+        proto.parse_text_format(texte)
+    else:
+        from google.protobuf import text_format
+        text_format.Parse(texte, proto)
+    return model
+
+
+class ModelCache:
+    """
+    Cache des modèles CP-SAT, indexé par l'empreinte des entrées.
+    
+    Chaque entrée contient le proto du modèle (format texte compressé) et la
+    correspondance entre variables d'assignation et indices du proto. La clé combine
+    le hash du fichier de données (SolutionStore.compute_file_hash), les poids de la
+    configuration, le code du modèle et la structure du problème (matchs, créneaux,
+    matchs fixés, obligations). Au-delà de taille_max_mo, les entrées les moins
+    récemment utilisées sont supprimées.
+    """
+    
+    def __init__(self, empreinte_entrees: str, cache_dir: Path, taille_max_mo: float = 200.0):
+        """
+        Args:
+            empreinte_entrees: Empreinte des fichiers d'entrée et des poids
+            cache_dir: Répertoire du cache
+            taille_max_mo: Taille maximale du cache en Mo
+        """
+        self.empreinte_entrees = empreinte_entrees
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.taille_max_octets = taille_max_mo * 1024 * 1024
+    
+    @classmethod
+    def pour_config(cls, config: Config, cache_dir: Path = None) -> 'ModelCache':
+        """
+        Crée le cache pour une configuration : fichier de données, poids et code du modèle.
+        
+        Args:
+            config: Configuration (fichier_donnees, poids, cpsat_cache_dossier, cpsat_cache_taille_max_mo)
+            cache_dir: Répertoire du cache (défaut: cpsat_cache_dossier)
+        
+        Returns:
+            Cache prêt à l'emploi
+        """
+        from pycalendar.core.solution_store import SolutionStore
+        
+        racine = Path(__file__).parent.parent
+        empreintes = [SolutionStore.compute_file_hash(Path(config.fichier_donnees)), cls.empreinte_config(config)]
+        empreintes += [SolutionStore.compute_file_hash(racine / fichier) for fichier in FICHIERS_MODELE]
+        empreinte = hashlib.md5("|".join(empreintes).encode('utf-8')).hexdigest()
+        
+        return cls(empreinte, cache_dir or Path(config.cpsat_cache_dossier), config.cpsat_cache_taille_max_mo)
+    
+    @staticmethod
+    def empreinte_config(config: Config) -> str:
+        """
+        Calcule le hash MD5 des champs de la configuration qui influencent le modèle.
+        
+        Args:
+            config: Configuration
+        
+        Returns:
+            Hash MD5 en hexadécimal
+        """
+        champs = {
+            nom: valeur for nom, valeur in dataclasses.asdict(config).items()
+            if nom not in CHAMPS_HORS_MODELE and not nom.startswith(PREFIXES_HORS_MODELE)
+        }
+        return hashlib.md5(json.dumps(champs, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    
+    def calculer_cle(self, matchs: List[Match], creneaux: List[Creneau],
+                     matchs_fixes: Optional[List[Match]], obligations_presence: Dict[str, str],
+                     creneaux_precedents: Optional[List[Optional[Creneau]]] = None) -> str:
+        """
+        Calcule la clé du modèle : empreinte des entrées + structure du problème.
+        
+        L'ordre des matchs et des créneaux fait partie de la clé (les variables
+        sont indexées par position).
+        
+        Args:
+            matchs: Matchs à planifier
+            creneaux: Créneaux valides
+            matchs_fixes: Matchs déjà planifiés/fixés
+            obligations_presence: Contraintes de présence par gymnase
+            creneaux_precedents: Créneau précédent de chaque match (pénalité de déplacement)
+        
+        Returns:
+            Clé hexadécimale
+        """
+        structure = {
+            'matchs': [(m.poule, m.equipe1.id_unique, m.equipe2.id_unique) for m in matchs],
+            'creneaux': [(c.semaine, c.horaire, c.gymnase) for c in creneaux],
+            'fixes': sorted(
+                (m.equipe1.id_unique, m.equipe2.id_unique,
+                 str(m.metadata.get('semaine')), str(m.metadata.get('horaire')), str(m.metadata.get('gymnase')))
+                for m in matchs_fixes or []
+            ),
+            'obligations': sorted(obligations_presence.items()),
+        }
+        if creneaux_precedents is not None:
+            structure['precedents'] = [(c.semaine, c.horaire, c.gymnase) if c else None for c in creneaux_precedents]
+        
+        hasher = hashlib.md5(self.empreinte_entrees.encode('utf-8'))
+        hasher.update(json.dumps(structure, default=str).encode('utf-8'))
+        return hasher.hexdigest()
+    
+    def _chemins(self, cle: str) -> Tuple[Path, Path]:
+        """Chemins du proto et de l'index d'une entrée."""
+        return self.cache_dir / f"{cle}.pbtxt.gz", self.cache_dir / f"{cle}.json"
+    
+    def charger(self, cle: str) -> Optional[tuple]:
+        """
+        Charge un modèle en cache.
+        
+        Args:
+            cle: Clé du modèle (calculer_cle)
+        
+        Returns:
+            Tuple (model, assignment_vars, match_assigned, creneaux_par_match, statistiques), ou None si absent
+        """
+        chemin_modele, chemin_index = self._chemins(cle)
+        if not chemin_modele.exists() or not chemin_index.exists():
+            return None
+        
+        try:
+            with open(chemin_index, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            
+            with gzip.open(chemin_modele, 'rt', encoding='utf-8') as f:
+                model = modele_depuis_texte(f.read())
+        except Exception as e:
+            print(f"  ⚠️  Modèle en cache illisible ({e}), reconstruction")
+            return None
+        
+        # LRU : la date de modification sert de date de dernier accès
+        os.utime(chemin_modele)
+        os.utime(chemin_index)
+        
+        match_assigned = [model.GetBoolVarFromProtoIndex(k) for k in index['assigned']]
+        assignment_vars = {}
+        creneaux_par_match = [[] for _ in match_assigned]
+        for i, j, k in index['couples']:
+            assignment_vars[(i, j)] = model.GetBoolVarFromProtoIndex(k)
+            creneaux_par_match[i].append(j)
+        
+        # Statistiques de la construction d'origine
+        statistiques = StatistiquesModele.from_dict(index.get('statistiques', {}))
+        
+        return model, assignment_vars, match_assigned, creneaux_par_match, statistiques
+    
+    def sauvegarder(self, cle: str, model, assignment_vars: Dict[Tuple[int, int], object],
+                    match_assigned: List, creneaux_par_match: List[List[int]],
+                    statistiques: Optional[StatistiquesModele] = None):
+        """
+        Enregistre un modèle construit puis applique l'éviction LRU.
+        
+        Args:
+            cle: Clé du modèle (calculer_cle)
+            model: Modèle CP-SAT (avant ajout d'indications)
+            assignment_vars: Variables d'assignation par couple (match, créneau)
+            match_assigned: Variable "match planifié" de chaque match
+            creneaux_par_match: Créneaux faisables de chaque match
+            statistiques: Statistiques de construction par famille
+        """
+        chemin_modele, chemin_index = self._chemins(cle)
+        index = {
+            'assigned': [var.Index() for var in match_assigned],
+            'couples': [[i, j, assignment_vars[(i, j)].Index()]
+                        for i, indices in enumerate(creneaux_par_match) for j in indices],
+            'statistiques': statistiques.to_dict() if statistiques is not None else {},
+        }
+        
+        # Écriture atomique (plusieurs processus peuvent partager le cache) ; l'index est
+        # écrit en dernier : une entrée n'est visible qu'une fois complète
+        try:
+            temporaire = chemin_modele.with_name(f"{chemin_modele.name}.{os.getpid()}.tmp")
+            with gzip.open(temporaire, 'wt', encoding='utf-8', compresslevel=1) as f:
+                f.write(modele_vers_texte(model))
+            os.replace(temporaire, chemin_modele)
+            
+            temporaire = chemin_index.with_name(f"{chemin_index.name}.{os.getpid()}.tmp")
+            with open(temporaire, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+            os.replace(temporaire, chemin_index)
+        except OSError as e:
+            print(f"  ⚠️  Impossible d'enregistrer le modèle en cache: {e}")
+            return
+        
+        self._evincer()
+    
+    def _evincer(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de la taille maximale."""
+        entrees = []
+        for chemin_index in self.cache_dir.glob("*.json"):
+            chemin_modele = self.cache_dir / f"{chemin_index.stem}.pbtxt.gz"
+            try:
+                taille = chemin_index.stat().st_size + (chemin_modele.stat().st_size if chemin_modele.exists() else 0)
+                entrees.append((chemin_index.stat().st_mtime, taille, chemin_index, chemin_modele))
+            except OSError:
+                continue
+        
+        total = sum(taille for _, taille, _, _ in entrees)
+        for _, taille, chemin_index, chemin_modele in sorted(entrees, key=lambda entree: entree[0]):
+            if total <= self.taille_max_octets:
+                break
+            chemin_index.unlink(missing_ok=True)
+            chemin_modele.unlink(missing_ok=True)
+            total -= taille
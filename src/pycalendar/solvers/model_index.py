@@ -0,0 +1,64 @@
+"""Index maps shared by the CP-SAT model constraint families."""
+
+from dataclasses import dataclass, field
+from typing import List, Dict, Tuple
+from pycalendar.core.models import Match, Creneau
+
+
+@dataclass
+class ModelIndex:
+    """
+    Index du modèle CP-SAT calculés une seule fois à partir du masque de faisabilité.
+
+    Chaque famille de contraintes parcourt ces index au lieu de balayer tous les
+    matchs pour chaque créneau, chaque équipe ou chaque (semaine, horaire) : le coût
+    de construction du modèle reste proportionnel au nombre de variables d'assignation.
+
+    Les équipes sont identifiées par leur id_unique (nom + genre) et les créneaux
+    par leur position dans la liste des créneaux valides.
+    """
+    creneaux_par_match: List[List[int]]
+    matchs_par_creneau: Dict[int, List[int]] = field(default_factory=dict)
+    # Couples (match, créneau) faisables par équipe et semaine / par équipe et (semaine, horaire)
+    couples_par_equipe_semaine: Dict[Tuple[str, int], List[Tuple[int, int]]] = field(default_factory=dict)
+    couples_par_equipe_horaire: Dict[Tuple[str, int, str], List[Tuple[int, int]]] = field(default_factory=dict)
+    # Semaines (triées) où chaque équipe a au moins un couple faisable
+    semaines_par_equipe: Dict[str, List[int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, matchs: List[Match], creneaux: List[Creneau],
+              creneaux_par_match: List[List[int]]) -> "ModelIndex":
+        """
+        Construit tous les index en un seul passage sur les matchs, les créneaux
+        et les couples faisables.
+
+        Args:
+            matchs: Matchs à planifier
+            creneaux: Créneaux valides
+            creneaux_par_match: Masque de faisabilité (créneaux faisables par match)
+
+        Returns:
+            ModelIndex prêt à l'emploi
+        """
+        index = cls(creneaux_par_match=creneaux_par_match)
+
+        for j in range(len(creneaux)):
+            index.matchs_par_creneau[j] = []
+
+        for i, match in enumerate(matchs):
+            equipes = (match.equipe1.id_unique, match.equipe2.id_unique)
+            for j in creneaux_par_match[i]:
+                creneau = creneaux[j]
+                index.matchs_par_creneau[j].append(i)
+                for equipe_id in equipes:
+                    index.couples_par_equipe_semaine.setdefault(
+                        (equipe_id, creneau.semaine), []).append((i, j))
+                    index.couples_par_equipe_horaire.setdefault(
+                        (equipe_id, creneau.semaine, creneau.horaire), []).append((i, j))
+
+        for equipe_id, semaine in index.couples_par_equipe_semaine:
+            index.semaines_par_equipe.setdefault(equipe_id, []).append(semaine)
+        for semaines in index.semaines_par_equipe.values():
+            semaines.sort()
+
+        return index
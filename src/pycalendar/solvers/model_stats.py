@@ -0,0 +1,113 @@
+"""Model-size and build-time statistics per constraint family (CP-SAT)."""
+
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+
+@dataclass
+class StatistiquesFamille:
+    """Taille et temps de construction d'une famille de contraintes du modèle."""
+    nom: str
+    nb_variables: int = 0
+    nb_contraintes: int = 0
+    nb_termes: int = 0  # Termes ajoutés à l'objectif
+    temps_secondes: float = 0.0
+
+
+class StatistiquesModele:
+    """
+    Statistiques de construction du modèle CP-SAT, par famille de contraintes.
+    
+    Les variables et contraintes sont comptées dans le proto du modèle entre debut()
+    et fin() ; les termes de l'objectif sont comptés sur la liste des termes, ou
+    donnés explicitement pour les sommes pondérées (un terme par couple).
+    """
+    
+    def __init__(self):
+        self.familles: Dict[str, StatistiquesFamille] = {}
+        self.temps_construction = 0.0
+    
+    def debut(self, model, objective_terms: Optional[List] = None) -> tuple:
+        """
+        Point de départ de la mesure d'une famille (voir fin).
+        
+        Args:
+            model: Modèle CP-SAT en construction
+            objective_terms: Liste des termes de l'objectif
+        
+        Returns:
+            Mesure opaque (tailles courantes et instant)
+        """
+        proto = model.Proto()
+        nb_termes = len(objective_terms) if objective_terms is not None else 0
+        return len(proto.variables), len(proto.constraints), nb_termes, time.perf_counter()
+    
+    def fin(self, nom: str, model, mesure: tuple, objective_terms: Optional[List] = None,
+            nb_termes: Optional[int] = None) -> StatistiquesFamille:
+        """
+        Enregistre ce qu'une famille a ajouté depuis debut() (cumulé si la famille est mesurée plusieurs fois).
+        
+        Args:
+            nom: Nom de la famille
+            model: Modèle CP-SAT en construction
+            mesure: Valeur retournée par debut()
+            objective_terms: Liste des termes de l'objectif (termes comptés par différence)
+            nb_termes: Nombre de termes explicite (sommes pondérées : un terme par couple)
+        
+        Returns:
+            Statistiques cumulées de la famille
+        """
+        nb_variables, nb_contraintes, nb_termes_avant, instant = mesure
+        proto = model.Proto()
+        stats = self.familles.setdefault(nom, StatistiquesFamille(nom))
+        stats.temps_secondes += time.perf_counter() - instant
+        stats.nb_variables += len(proto.variables) - nb_variables
+        stats.nb_contraintes += len(proto.constraints) - nb_contraintes
+        if nb_termes is not None:
+            stats.nb_termes += nb_termes
+        elif objective_terms is not None:
+            stats.nb_termes += len(objective_terms) - nb_termes_avant
+        return stats
+    
+    def ajouter(self, nom: str, nb_termes: int = 0, temps_secondes: float = 0.0):
+        """Enregistre une famille sans variable ni contrainte (termes de l'objectif précalculés)."""
+        stats = self.familles.setdefault(nom, StatistiquesFamille(nom))
+        stats.nb_termes += nb_termes
+        stats.temps_secondes += temps_secondes
+    
+    def total(self) -> StatistiquesFamille:
+        """Somme de toutes les familles."""
+        return StatistiquesFamille(
+            nom='total',
+            nb_variables=sum(f.nb_variables for f in self.familles.values()),
+            nb_contraintes=sum(f.nb_contraintes for f in self.familles.values()),
+            nb_termes=sum(f.nb_termes for f in self.familles.values()),
+            temps_secondes=sum(f.temps_secondes for f in self.familles.values()),
+        )
+    
+    def to_dict(self) -> dict:
+        """Format JSON (metadata de la solution, index du cache de modèles)."""
+        return {
+            'familles': [asdict(f) for f in self.familles.values()],
+            'total': asdict(self.total()),
+            'temps_construction': self.temps_construction,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'StatistiquesModele':
+        """Recrée les statistiques depuis to_dict()."""
+        statistiques = cls()
+        for famille in data.get('familles', []):
+            statistiques.familles[famille['nom']] = StatistiquesFamille(**famille)
+        statistiques.temps_construction = data.get('temps_construction', 0.0)
+        return statistiques
+    
+    def afficher(self):
+        """Affiche le tableau par famille, de la plus coûteuse (variables + contraintes) à la moins coûteuse."""
+        print(f"\n📐 Taille du modèle par famille de contraintes "
+              f"(construction {self.temps_construction:.2f}s):")
+        print(f"   {'Famille':<22} {'Variables':>10} {'Contraintes':>12} {'Termes obj.':>12} {'Temps (s)':>10}")
+        familles = sorted(self.familles.values(), key=lambda f: f.nb_variables + f.nb_contraintes, reverse=True)
+        for f in familles + [self.total()]:
+            print(f"   {f.nom:<22} {f.nb_variables:>10} {f.nb_contraintes:>12} {f.nb_termes:>12} {f.temps_secondes:>10.3f}")
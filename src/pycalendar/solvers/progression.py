@@ -0,0 +1,42 @@
+"""JSONL progress log of a CP-SAT search, readable while the search runs."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+
+class JournalProgression:
+    """
+    Journal de progression d'une résolution : une ligne JSON par événement.
+    
+    Chaque ligne est vidée sur disque dès son écriture : le journal peut être suivi
+    pendant la résolution (tail -f) et reste exploitable si le processus est interrompu.
+    Les résolutions successives sont ajoutées au même fichier, chacune ouverte par
+    un événement 'debut'.
+    """
+    
+    def __init__(self, chemin: str):
+        """
+        Args:
+            chemin: Fichier JSONL (créé avec ses dossiers si besoin)
+        """
+        self.chemin = Path(chemin)
+        self.chemin.parent.mkdir(parents=True, exist_ok=True)
+        self._fichier = open(self.chemin, 'a', encoding='utf-8')
+    
+    def ecrire(self, evenement: str, **valeurs):
+        """
+        Ajoute un enregistrement au journal.
+        
+        Args:
+            evenement: Type d'enregistrement ('debut', 'solution', 'fin')
+            **valeurs: Champs de l'enregistrement (sérialisables en JSON)
+        """
+        if evenement == 'debut':
+            valeurs = {'date': datetime.now().isoformat(), **valeurs}
+        self._fichier.write(json.dumps({'evenement': evenement, **valeurs}, ensure_ascii=False) + '\n')
+        self._fichier.flush()
+    
+    def fermer(self):
+        """Ferme le fichier du journal."""
+        self._fichier.close()
@@ -0,0 +1,75 @@
+"""Upper bound on the CP-SAT objective via the assignment (transportation) relaxation."""
+
+try:
+    from scipy.optimize import linprog
+    from scipy.sparse import coo_matrix
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+import time
+import numpy as np
+from typing import Dict, List, Tuple
+
+
+def borne_affectation(nb_matchs: int, couples: List[Tuple[int, int]], valeurs: np.ndarray,
+                      capacites: Dict[int, int]) -> dict:
+    """
+    Majorant de l'objectif : affectation des matchs aux créneaux sans conflits d'équipes.
+    
+    Relaxation du modèle CP-SAT : chaque match sur au plus un créneau, chaque créneau
+    dans la limite de sa capacité, valeur de chaque couple = bonus de planification -
+    coûts par couple. Les contraintes d'équipes (simultanéité, max par semaine) sont
+    ignorées et les autres termes de l'objectif (espacement, overlaps, aller-retour,
+    déplacements) sont des pénalités : l'optimum relâché majore donc celui du modèle.
+    Le problème de transport est totalement unimodulaire, son optimum linéaire est entier.
+    
+    Sans SciPy (extra « relaxation »), la capacité des créneaux est aussi ignorée
+    (meilleur couple de chaque match) : la borne est plus faible, 'raison' l'indique.
+    
+    Args:
+        nb_matchs: Nombre de matchs
+        couples: Couples (match, créneau) faisables
+        valeurs: Valeur de chaque couple dans l'objectif, alignée sur couples
+        capacites: Capacité restante par créneau (créneau absent = non contraint)
+    
+    Returns:
+        Dict {'borne', 'methode' ('linprog' ou 'sans_capacite'), 'temps_secondes'} ;
+        avec 'sans_capacite' hors cas trivial, 'raison' donne la cause du repli
+    """
+    debut = time.perf_counter()
+    positifs = np.flatnonzero(valeurs > 0)  # Un couple de valeur négative n'est jamais choisi
+    idx_matchs = np.array([couples[k][0] for k in positifs], dtype=np.int64)
+    idx_creneaux = np.array([couples[k][1] for k in positifs], dtype=np.int64)
+    valeurs = valeurs[positifs].astype(float)
+    
+    # Borne sans capacité : meilleur couple de chaque match
+    meilleurs = np.zeros(nb_matchs)
+    np.maximum.at(meilleurs, idx_matchs, valeurs)
+    resultat = {'borne': float(meilleurs.sum()), 'methode': 'sans_capacite'}
+    
+    if not SCIPY_AVAILABLE and len(positifs):
+        resultat['raison'] = "SciPy non installé (pip install pycalendar[relaxation])"
+    
+    if SCIPY_AVAILABLE and len(positifs):
+        creneaux_contraints = sorted({int(j) for j in idx_creneaux if j in capacites})
+        ligne_creneau = {j: nb_matchs + r for r, j in enumerate(creneaux_contraints)}
+        contraint = np.array([j in ligne_creneau for j in idx_creneaux.tolist()], dtype=bool)
+        colonnes = np.arange(len(positifs))
+        
+        # Lignes : une par match (<= 1), une par créneau contraint (<= capacité)
+        lignes = np.concatenate([idx_matchs, [ligne_creneau[j] for j in idx_creneaux[contraint].tolist()]])
+        matrice = coo_matrix(
+            (np.ones(len(lignes)), (lignes.astype(np.int64), np.concatenate([colonnes, colonnes[contraint]]))),
+            shape=(nb_matchs + len(creneaux_contraints), len(positifs))
+        ).tocsr()
+        seconds_membres = np.concatenate([np.ones(nb_matchs), [capacites[j] for j in creneaux_contraints]])
+        
+        solution = linprog(-valeurs, A_ub=matrice, b_ub=seconds_membres, bounds=(0, 1), method='highs')
+        if solution.status == 0:
+            resultat = {'borne': float(-solution.fun), 'methode': 'linprog'}
+        else:
+            resultat['raison'] = f"linprog en échec ({solution.message})"
+    
+    resultat['temps_secondes'] = time.perf_counter() - debut
+    return resultat
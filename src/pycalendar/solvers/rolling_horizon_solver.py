@@ -0,0 +1,161 @@
+"""Rolling-horizon solver: CP-SAT on successive windows of weeks."""
+
+import copy
+import time
+from typing import List, Dict, Optional, Set
+from pycalendar.core.models import Match, Creneau, Gymnase, Solution
+from pycalendar.core.config import Config
+from .base_solver import BaseSolver
+from .cpsat_solver import CPSATSolver
+
+
+class RollingHorizonSolver(BaseSolver):
+    """
+    Horizon glissant : planifie les semaines par fenêtres successives avec CP-SAT.
+    
+    Chaque fenêtre couvre horizon_semaines_fenetre semaines et chevauche la suivante
+    de horizon_semaines_chevauchement semaines. Les matchs placés avant le début d'une
+    fenêtre sont figés et transmis au modèle comme matchs fixés (capacité des gymnases,
+    max par semaine, espacement, aller-retour) ; ceux placés dans le chevauchement
+    restent libres et peuvent être déplacés par la fenêtre suivante.
+    """
+    
+    def __init__(self, config: Config, groupes_non_simultaneite: Optional[Dict[str, Set[str]]] = None,
+                 ententes: Optional[Dict] = None, contraintes_temporelles: Optional[Dict] = None,
+                 niveaux_gymnases: Optional[Dict[str, str]] = None):
+        super().__init__(config)
+        self.groupes_non_simultaneite = groupes_non_simultaneite
+        self.ententes = ententes
+        self.contraintes_temporelles = contraintes_temporelles
+        self.niveaux_gymnases = niveaux_gymnases
+    
+    def get_name(self) -> str:
+        return "Horizon"
+    
+    def _construire_fenetres(self, semaines: List[int]) -> List[List[int]]:
+        """
+        Découpe les semaines en fenêtres chevauchantes.
+        
+        Args:
+            semaines: Semaines planifiables, triées
+        
+        Returns:
+            Fenêtres (listes de semaines) ; la dernière se termine à la dernière semaine
+        """
+        if not semaines:
+            return []
+        
+        taille = max(1, self.config.horizon_semaines_fenetre)
+        chevauchement = min(max(0, self.config.horizon_semaines_chevauchement), taille - 1)
+        pas = taille - chevauchement
+        
+        fenetres = []
+        debut = 0
+        while True:
+            fenetres.append(semaines[debut:debut + taille])
+            if debut + taille >= len(semaines):
+                break
+            debut += pas
+        
+        return fenetres
+    
+    def solve(self, matchs: List[Match], creneaux: List[Creneau],
+             gymnases: Dict[str, Gymnase], obligations_presence: Optional[Dict[str, str]] = None,
+             matchs_fixes: Optional[List[Match]] = None) -> Solution:
+        """
+        Résout le problème fenêtre par fenêtre.
+        
+        Args:
+            matchs: Liste des matchs à planifier
+            creneaux: Liste des créneaux disponibles
+            gymnases: Dictionnaire des gymnases
+            obligations_presence: Contraintes de présence par gymnase
+            matchs_fixes: Matchs déjà planifiés/fixés
+        
+        Returns:
+            Solution (metadata['horizon'] détaille chaque fenêtre)
+        """
+        semaines = sorted({c.semaine for c in creneaux if c.semaine >= self.config.semaine_min})
+        fenetres = self._construire_fenetres(semaines)
+        
+        # Chaque fenêtre reçoit le temps restant divisé par le nombre de fenêtres restantes :
+        # le temps non utilisé par une fenêtre résolue rapidement profite aux suivantes
+        config_fenetre = copy.copy(self.config)
+        solver = CPSATSolver(config_fenetre, self.groupes_non_simultaneite, self.ententes,
+                             self.contraintes_temporelles, self.niveaux_gymnases)
+        
+        print(f"\n🪟 Horizon glissant: {len(fenetres)} fenêtre(s) de {self.config.horizon_semaines_fenetre} semaine(s), "
+              f"chevauchement {self.config.horizon_semaines_chevauchement}, {self.config.temps_max_secondes}s au total")
+        
+        placements = {}  # indice match -> créneau (fenêtres précédentes)
+        score = 0.0
+        details = []
+        start_time = time.time()
+        
+        for k, fenetre in enumerate(fenetres, start=1):
+            debut = fenetre[0]
+            
+            # Matchs placés avant la fenêtre : figés. Ceux du chevauchement sont replanifiés,
+            # leur bonus de planification (déjà compté par la fenêtre précédente) est retiré du score.
+            figes = sorted(i for i, creneau in placements.items() if creneau.semaine < debut)
+            for i in placements:
+                if placements[i].semaine >= debut:
+                    score -= solver._get_bonus_planification(matchs[i])
+            placements = {i: placements[i] for i in figes}
+            libres = [i for i in range(len(matchs)) if i not in placements]
+            
+            semaines_fenetre = set(fenetre)
+            creneaux_fenetre = [c for c in creneaux if c.semaine in semaines_fenetre]
+            fixes_fenetre = list(matchs_fixes or []) + [self._figer_match(matchs[i], placements[i]) for i in figes]
+            
+            print(f"\n   Fenêtre {k}/{len(fenetres)} (S{debut}-S{fenetre[-1]}): "
+                  f"{len(libres)} match(s) libre(s), {len(figes)} figé(s)")
+            
+            temps_restant = self.config.temps_max_secondes - (time.time() - start_time)
+            config_fenetre.temps_max_secondes = max(1, int(temps_restant / (len(fenetres) - k + 1)))
+            
+            solution = solver.solve([matchs[i] for i in libres], creneaux_fenetre, gymnases,
+                                    obligations_presence, use_warm_start=False,
+                                    matchs_fixes=fixes_fenetre)
+            
+            planifies = {id(match) for match in solution.matchs_planifies}
+            for i in libres:
+                if id(matchs[i]) in planifies:
+                    placements[i] = matchs[i].creneau
+            
+            if solution.score != float('inf'):
+                score += solution.score
+            details.append({
+                'semaines': [debut, fenetre[-1]],
+                'nb_libres': len(libres),
+                'nb_figes': len(figes),
+                'nb_planifies': len(planifies),
+                'temps_max_secondes': config_fenetre.temps_max_secondes,
+                'status': solution.metadata.get('status'),
+                'score': solution.score,
+            })
+        
+        matchs_planifies = []
+        matchs_non_planifies = []
+        for i, match in enumerate(matchs):
+            match.creneau = placements.get(i)
+            if match.creneau is None:
+                matchs_non_planifies.append(match)
+            else:
+                matchs_planifies.append(match)
+        
+        statuts = {detail['status'] for detail in details}
+        return Solution(
+            matchs_planifies=matchs_planifies,
+            matchs_non_planifies=matchs_non_planifies,
+            score=score,
+            metadata={
+                'solver': 'horizon',
+                'status': 'MIXTE' if len(statuts) > 1 else next(iter(statuts), 'UNKNOWN'),
+                'horizon': {
+                    'semaines_fenetre': self.config.horizon_semaines_fenetre,
+                    'semaines_chevauchement': self.config.horizon_semaines_chevauchement,
+                    'fenetres': details,
+                },
+            }
+        )
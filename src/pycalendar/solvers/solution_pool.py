@@ -0,0 +1,54 @@
+"""Pool of the K best distinct assignments seen during a CP-SAT search."""
+
+from typing import List, Optional, Tuple
+
+
+Affectation = Tuple[Optional[int], ...]  # Indice du créneau de chaque match (None si non planifié)
+
+
+def distance_hamming(a: Affectation, b: Affectation) -> int:
+    """Nombre de matchs placés différemment (créneau différent ou planifié d'un seul côté)."""
+    return sum(1 for x, y in zip(a, b) if x != y)
+
+
+class PoolSolutions:
+    """
+    Les K meilleures affectations distinctes rencontrées pendant la recherche.
+    
+    Deux affectations du pool diffèrent toujours d'au moins distance_min matchs.
+    Une nouvelle affectation trop proche d'affectations du pool ne les remplace que si
+    elle est meilleure que chacune d'elles ; sinon elle est ignorée.
+    """
+    
+    def __init__(self, taille: int, distance_min: int = 1):
+        """
+        Args:
+            taille: Nombre maximum d'affectations conservées (K)
+            distance_min: Distance de Hamming minimale entre deux affectations du pool
+        """
+        self.taille = taille
+        self.distance_min = max(1, distance_min)
+        self.entrees: List[Tuple[float, Affectation]] = []  # (score, affectation), meilleur d'abord
+    
+    def proposer(self, score: float, affectation: Affectation) -> bool:
+        """
+        Propose une affectation au pool.
+        
+        Args:
+            score: Objectif de l'affectation (maximisé)
+            affectation: Créneau de chaque match
+        
+        Returns:
+            True si l'affectation est entrée dans le pool
+        """
+        proches = [k for k, (_, autre) in enumerate(self.entrees)
+                   if distance_hamming(affectation, autre) < self.distance_min]
+        if any(self.entrees[k][0] >= score for k in proches):
+            return False
+        
+        for k in reversed(proches):
+            del self.entrees[k]
+        self.entrees.append((score, affectation))
+        self.entrees.sort(key=lambda entree: entree[0], reverse=True)
+        del self.entrees[self.taille:]
+        return any(entree is affectation for _, entree in self.entrees)
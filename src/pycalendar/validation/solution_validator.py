@@ -21,6 +21,7 @@ from collections import defaultdict
 
 from pycalendar.core.models import Match, Creneau, Gymnase, Solution
 from pycalendar.core.config import Config
+from pycalendar.core.penalty_tables import PenaltyTables
 
 
 @dataclass
@@ -44,6 +45,7 @@ class SolutionValidator:
         self.gymnases = gymnases
         self.obligations_presence = obligations_presence if obligations_presence else {}
         self.groupes_non_simultaneite = groupes_non_simultaneite if groupes_non_simultaneite else {}
+        self.penalty_tables = PenaltyTables(config)
         self.violations: List[ViolationDetail] = []
     
     def valider_solution(self, solution: Solution) -> Tuple[bool, Dict]:
@@ -293,21 +295,6 @@ class SolutionValidator:
                     penalite=1000.0
                 ))
     
-    def _parse_horaire(self, horaire_str: str) -> int:
-        """
-        Convertit une chaîne d'horaire en minutes depuis minuit.
-        Supporte: "14:00", "14H00", "14H", "14h00", "14h"
-        """
-        horaire_str = horaire_str.upper().replace('H', ':')
-        if ':' in horaire_str:
-            parts = horaire_str.split(':')
-            heures = int(parts[0])
-            minutes = int(parts[1]) if len(parts) > 1 and parts[1] else 0
-        else:
-            heures = int(horaire_str)
-            minutes = 0
-        return heures * 60 + minutes
-    
     def _verifier_preferences_horaires(self, matchs: List[Match]):
         """
         Vérifie le respect des préférences d'horaires (contrainte souple).
@@ -341,11 +328,8 @@ class SolutionValidator:
             
             stats['nb_matchs_avec_preferences'] += 1
             
-            # Parser l'horaire du match
-            try:
-                horaire_match_minutes = self._parse_horaire(horaire)
-            except:
-                continue
+            # Horaire du match en minutes (tables de pénalités partagées)
+            horaire_match_minutes = self.penalty_tables.parse_horaire(horaire)
             
             # Analyser chaque équipe
             violations_equipe = []
@@ -355,11 +339,8 @@ class SolutionValidator:
                 if not equipe.horaires_preferes or len(equipe.horaires_preferes) == 0:
                     continue
                 
-                # Parser l'horaire préféré (on prend le premier si plusieurs)
-                try:
-                    horaire_pref_minutes = self._parse_horaire(equipe.horaires_preferes[0])
-                except:
-                    continue
+                # Horaire préféré en minutes (on prend le premier si plusieurs)
+                horaire_pref_minutes = self.penalty_tables.parse_horaire(equipe.horaires_preferes[0])
                 
                 # Calculer la distance en minutes
                 distance_minutes = abs(horaire_match_minutes - horaire_pref_minutes)
@@ -486,11 +467,7 @@ class SolutionValidator:
             
             # Vérifier équipe 1
             if match.equipe1.lieux_preferes:
-                rang_trouve = None
-                for rang, gymnase_pref in enumerate(match.equipe1.lieux_preferes):
-                    if gymnase_pref == gymnase:
-                        rang_trouve = rang
-                        break
+                rang_trouve = self.penalty_tables.rang_prefere(match.equipe1, gymnase)
                 
                 if rang_trouve is not None:
                     bonus = self.config.bonus_preferences_gymnases[rang_trouve] if rang_trouve < len(self.config.bonus_preferences_gymnases) else 0
@@ -510,11 +487,7 @@ class SolutionValidator:
             
             # Vérifier équipe 2
             if match.equipe2.lieux_preferes:
-                rang_trouve = None
-                for rang, gymnase_pref in enumerate(match.equipe2.lieux_preferes):
-                    if gymnase_pref == gymnase:
-                        rang_trouve = rang
-                        break
+                rang_trouve = self.penalty_tables.rang_prefere(match.equipe2, gymnase)
                 
                 if rang_trouve is not None:
                     bonus = self.config.bonus_preferences_gymnases[rang_trouve] if rang_trouve < len(self.config.bonus_preferences_gymnases) else 0
@@ -557,12 +530,8 @@ class SolutionValidator:
             semaine = match.creneau.semaine
             stats['matchs_par_semaine'][semaine] += 1
             
-            # Récupérer la pénalité pour cette semaine (indice 0 = semaine 1)
-            if semaine <= len(self.config.compaction_penalites_par_semaine):
-                penalty = self.config.compaction_penalites_par_semaine[semaine - 1]
-            else:
-                # Si on dépasse le nb de semaines définies, utiliser la dernière pénalité
-                penalty = self.config.compaction_penalites_par_semaine[-1]
+            # Pénalité de la semaine (indice 0 = semaine 1, tables de pénalités partagées)
+            penalty = self.penalty_tables.penalite_compaction(semaine)
             
             # Statistiques par catégorie (pour compatibilité avec l'ancienne version)
             if penalty == 0:
@@ -0,0 +1,52 @@
+"""Fixtures partagées : données de l'exemple volley (examples/volleyball) et petite instance synthétique."""
+
+import dataclasses
+from itertools import combinations
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from pycalendar.core.config import Config
+from pycalendar.core.models import Equipe, Match, Creneau, Gymnase
+from pycalendar.data.data_source import DataSource
+from pycalendar.data.transformers import DataTransformer
+from pycalendar.generators.multi_pool_generator import MultiPoolGenerator
+
+
+RACINE = Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="session")
+def config_volley() -> Config:
+    """Configuration de l'exemple volley (configs/config_volley.yaml)."""
+    config = Config.from_yaml(str(RACINE / "configs" / "config_volley.yaml"))
+    return dataclasses.replace(config, fichier_donnees=str(RACINE / config.fichier_donnees))
+
+
+@pytest.fixture(scope="session")
+def donnees_volley(config_volley):
+    """Matchs, créneaux, gymnases et niveaux de gymnases de l'exemple volley."""
+    source = DataSource(config_volley.fichier_donnees)
+    equipes = source.charger_equipes()
+    gymnases = source.charger_gymnases()
+    generator = MultiPoolGenerator(source.charger_types_poules() or False)
+    matchs = generator.generer_tous_matchs(source.get_poules_dict(equipes))
+    creneaux = DataTransformer.generer_creneaux(gymnases, config_volley.nb_semaines,
+                                                config_volley.calendar_manager)
+    return SimpleNamespace(
+        matchs=matchs,
+        creneaux=creneaux,
+        gymnases={g.nom: g for g in gymnases},
+        niveaux_gymnases=source.charger_niveaux_gymnases(),
+    )
+
+
+@pytest.fixture
+def petite_poule():
+    """Une poule de 4 équipes (6 matchs), un gymnase, 4 semaines de deux horaires."""
+    equipes = [Equipe(f"LYON 1 ({k})", "PA", institution="LYON 1") for k in range(1, 5)]
+    matchs = [Match(e1, e2, "PA") for e1, e2 in combinations(equipes, 2)]
+    gymnases = {'G1': Gymnase('G1', capacite=1, horaires_disponibles=['18:00', '20:00'])}
+    creneaux = [Creneau(semaine, horaire, 'G1') for semaine in range(1, 5) for horaire in ('18:00', '20:00')]
+    return matchs, creneaux, gymnases
@@ -0,0 +1,40 @@
+"""Amorce gloutonne de CP-SAT : aucun effet de bord sur les matchs ni sur le générateur global."""
+
+import dataclasses
+import random
+
+from pycalendar.orchestrator.pipeline import SchedulingPipeline
+from pycalendar.solvers.cpsat_solver import CPSATSolver
+
+
+def _pipeline(config_volley, **champs):
+    config = dataclasses.replace(config_volley, strategie="cpsat", semaine_min=3, entente_actif=False,
+                                 cpsat_amorce_glouton=True, cpsat_amorce_glouton_essais=1,
+                                 cpsat_amorce_glouton_mesure=False, cpsat_warm_start=False,
+                                 cpsat_nb_workers=1, temps_max_secondes=10, **champs)
+    return SchedulingPipeline(config)
+
+
+def test_amorce_ne_modifie_ni_les_matchs_ni_le_generateur_global(config_volley, petite_poule):
+    matchs, creneaux, gymnases = petite_poule
+    pipeline = _pipeline(config_volley)
+    solver = CPSATSolver(pipeline.config)
+    etat = random.getstate()
+
+    affectation, amorce = pipeline._amorce_gloutonne(solver, matchs, creneaux, gymnases)
+
+    assert amorce['nb_planifies'] == sum(1 for creneau in affectation if creneau is not None) > 0
+    assert all(match.creneau is None for match in matchs)
+    assert random.getstate() == etat
+
+
+def test_matchs_non_planifies_par_cp_sat_sans_creneau(config_volley, petite_poule, tmp_path, monkeypatch):
+    matchs, creneaux, gymnases = petite_poule
+    monkeypatch.chdir(tmp_path)
+
+    # 4 créneaux pour 6 matchs : CP-SAT laisse des matchs non planifiés
+    solution = _pipeline(config_volley)._resoudre_strategie(matchs, creneaux, gymnases)
+
+    assert solution.matchs_non_planifies
+    assert all(match.creneau is None for match in solution.matchs_non_planifies)
+    assert all(match.creneau is not None for match in solution.matchs_planifies)
@@ -0,0 +1,40 @@
+"""Portfolio CP-SAT et nombre de workers par résolution."""
+
+import dataclasses
+
+import pytest
+from ortools.sat.python import cp_model
+
+from pycalendar.solvers import cpsat_portfolio
+from pycalendar.solvers.cpsat_portfolio import NB_WORKERS_DEFAUT, nb_workers_cpsat, resoudre_portfolio
+from pycalendar.solvers.cpsat_solver import CPSATSolver
+
+
+def test_portfolio_trouve_l_optimum(config_volley, petite_poule):
+    matchs, creneaux, gymnases = petite_poule
+    config = dataclasses.replace(config_volley, semaine_min=1, temps_max_secondes=10, cpsat_nb_workers=2,
+                                 cpsat_portfolio_processus=2, cpsat_portfolio_manches=1,
+                                 cpsat_portfolio_profils=['defaut', 'sans_lp'])
+    model, assignment_vars, _, _, _ = CPSATSolver(config)._construire_modele(matchs, creneaux, gymnases, {}, None)
+
+    resultat = resoudre_portfolio(model, config)
+
+    reference = cp_model.CpSolver()
+    reference.parameters.num_workers = 1
+    assert reference.Solve(model) == cp_model.OPTIMAL
+    assert resultat.status == cp_model.OPTIMAL
+    assert resultat.ObjectiveValue() == reference.ObjectiveValue()
+    assert len(resultat.essais) == 2
+    assert all(resultat.Value(var) in (0, 1) for var in assignment_vars.values())
+
+
+@pytest.mark.parametrize("coeurs, nb_workers, attendu", [
+    (64, 0, NB_WORKERS_DEFAUT),
+    (4, 0, 4),
+    (64, 24, 24),
+])
+def test_nb_workers_borne_par_defaut(config_volley, monkeypatch, coeurs, nb_workers, attendu):
+    monkeypatch.setattr(cpsat_portfolio, 'nb_coeurs', lambda: coeurs)
+    config = dataclasses.replace(config_volley, cpsat_nb_workers=nb_workers)
+
+    assert nb_workers_cpsat(config) == attendu
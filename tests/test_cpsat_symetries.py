@@ -0,0 +1,90 @@
+"""Rupture de symétrie CP-SAT : même optimum avec et sans ordre imposé aux matchs interchangeables."""
+
+import dataclasses
+
+import pytest
+from ortools.sat.python import cp_model
+
+from pycalendar.core.models import Equipe, Match, Creneau, Gymnase
+from pycalendar.solvers.cpsat_solver import CPSATSolver
+
+
+def _instance(nb_semaines):
+    """Poule où A et B se rencontrent trois fois (matchs interchangeables), plus B-A et A-C."""
+    a = Equipe("LYON 1 (1)", "PA", institution="LYON 1", horaires_preferes=['20:00'])
+    b = Equipe("INSA (1)", "PA", institution="INSA", horaires_preferes=['18:00'])
+    c = Equipe("LYON 2 (1)", "PA", institution="LYON 2", semaines_indisponibles={2: {'18:00', '20:00'}})
+    matchs = [Match(a, b, "PA"), Match(a, c, "PA"), Match(a, b, "PA"), Match(b, a, "PA"), Match(a, b, "PA")]
+    gymnases = {'G1': Gymnase('G1', capacite=1, horaires_disponibles=['18:00', '20:00'])}
+    creneaux = [Creneau(semaine, horaire, 'G1')
+                for semaine in range(1, nb_semaines + 1) for horaire in ('18:00', '20:00')]
+    return matchs, creneaux, gymnases
+
+
+def _optimum(config, matchs, creneaux, gymnases, symetries: bool, monkeypatch):
+    """Optimum du modèle complet ; renvoie aussi les groupes de matchs ordonnés par le modèle."""
+    solver = CPSATSolver(config)
+    detecter = solver._detecter_matchs_interchangeables
+    groupes = []
+
+    def espion(*args, **kwargs):
+        groupes.extend(detecter(*args, **kwargs) if symetries else [])
+        return list(groupes)
+
+    monkeypatch.setattr(solver, '_detecter_matchs_interchangeables', espion)
+    model = solver._construire_modele(matchs, creneaux, gymnases, {}, None)[0]
+
+    resolution = cp_model.CpSolver()
+    resolution.parameters.num_workers = 1
+    resolution.parameters.max_time_in_seconds = 30
+    assert resolution.Solve(model) == cp_model.OPTIMAL
+    return resolution.ObjectiveValue(), groupes
+
+
+@pytest.mark.parametrize("nb_semaines", [2, 4], ids=["creneaux_rares", "creneaux_suffisants"])
+def test_meme_optimum_avec_et_sans_rupture_de_symetrie(config_volley, monkeypatch, nb_semaines):
+    config = dataclasses.replace(config_volley, semaine_min=1, max_matchs_par_equipe_par_semaine=1,
+                                 entente_actif=False, cpsat_nb_workers=1)
+    matchs, creneaux, gymnases = _instance(nb_semaines)
+
+    avec, groupes = _optimum(config, matchs, creneaux, gymnases, True, monkeypatch)
+    sans, aucun = _optimum(config, matchs, creneaux, gymnases, False, monkeypatch)
+
+    assert groupes == [[0, 2, 4]]
+    assert aucun == []
+    assert avec == sans
+
+
+def _solution_precedente(matchs, creneaux):
+    """Solution enregistrée où les rencontres A-B sont placées dans l'ordre inverse de leurs indices."""
+    affectations = [(matchs[0], creneaux[4]), (matchs[2], creneaux[2]), (matchs[4], creneaux[0])]
+    return {'assignments': [
+        {'equipe1_id': match.equipe1.id_unique, 'equipe2_id': match.equipe2.id_unique,
+         'semaine': creneau.semaine, 'horaire': creneau.horaire, 'gymnase': creneau.gymnase}
+        for match, creneau in affectations
+    ]}
+
+
+@pytest.mark.parametrize("symetries", [True, False], ids=["redistribuee", "non_redistribuee"])
+def test_warm_start_accepte_avec_rupture_de_symetrie(config_volley, symetries):
+    config = dataclasses.replace(config_volley, semaine_min=1, max_matchs_par_equipe_par_semaine=1,
+                                 entente_actif=False, cpsat_nb_workers=1)
+    matchs, creneaux, gymnases = _instance(4)
+    solver = CPSATSolver(config)
+    model, assignment_vars, _, creneaux_par_match, _ = solver._construire_modele(
+        matchs, creneaux, gymnases, {}, None
+    )
+    groupes = solver._detecter_matchs_interchangeables(matchs, creneaux_par_match) if symetries else None
+
+    hint, stats = solver._apply_warm_start_basic(_solution_precedente(matchs, creneaux), matchs, creneaux,
+                                                 assignment_vars, model, groupes)
+
+    assert stats['valid_assignments'] == 3
+    assert {i for i, _ in hint} == {0, 2, 4}
+    # Les variables indiquées sont figées : le modèle reste faisable seulement si l'indication
+    # respecte l'ordre imposé aux matchs interchangeables
+    resolution = cp_model.CpSolver()
+    resolution.parameters.num_workers = 1
+    resolution.parameters.fix_variables_to_their_hinted_value = True
+    faisable = resolution.Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+    assert faisable == symetries
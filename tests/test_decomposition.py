@@ -0,0 +1,94 @@
+"""Découpage en sous-problèmes indépendants et fusion de leurs solutions."""
+
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from pycalendar.core.models import Equipe, Match, Creneau, Gymnase, Solution
+from pycalendar.orchestrator.decomposition import (
+    calculer_creneaux_possibles, construire_sous_problemes, fusionner_solutions
+)
+
+
+def _poule(nom, institution, nb_equipes=4):
+    """Matchs (tous contre tous) d'une poule dont les équipes appartiennent à une institution."""
+    equipes = [Equipe(f"{institution} ({k})", nom, institution=institution) for k in range(1, nb_equipes + 1)]
+    return [Match(e1, e2, nom) for e1, e2 in combinations(equipes, 2)]
+
+
+@pytest.fixture
+def deux_poules_independantes():
+    """Deux poules, chacune réservée à son gymnase par une obligation de présence."""
+    matchs = _poule("PA", "LYON 1") + _poule("PB", "INSA")
+    gymnases = {nom: Gymnase(nom, capacite=1, horaires_disponibles=['18:00', '20:00'])
+                for nom in ('G1', 'G2')}
+    creneaux = [Creneau(semaine, horaire, gymnase)
+                for semaine in range(1, 5) for horaire in ('18:00', '20:00') for gymnase in gymnases]
+    obligations = {'G1': 'LYON 1', 'G2': 'INSA'}
+    return matchs, creneaux, gymnases, obligations
+
+
+def _sous_problemes(instance, nb_max=4):
+    matchs, creneaux, gymnases, obligations = instance
+    creneaux_par_match = calculer_creneaux_possibles(matchs, creneaux, gymnases, obligations)
+    return construire_sous_problemes(matchs, creneaux, creneaux_par_match, nb_max, 60)
+
+
+def test_sous_problemes_disjoints_en_equipes_et_creneaux(deux_poules_independantes):
+    matchs = deux_poules_independantes[0]
+
+    sous_problemes = _sous_problemes(deux_poules_independantes)
+
+    assert len(sous_problemes) == 2
+    assert Counter(id(m) for sp in sous_problemes for m in sp.matchs) == Counter(id(m) for m in matchs)
+
+    equipes = [{e.id_unique for m in sp.matchs for e in (m.equipe1, m.equipe2)} for sp in sous_problemes]
+    creneaux = [{(c.semaine, c.horaire, c.gymnase) for c in sp.creneaux} for sp in sous_problemes]
+    assert not equipes[0] & equipes[1]
+    assert not creneaux[0] & creneaux[1]
+    assert {sp.matchs[0].poule for sp in sous_problemes} == {'PA', 'PB'}
+
+
+def test_budget_de_temps_proportionnel(deux_poules_independantes):
+    sous_problemes = _sous_problemes(deux_poules_independantes)
+
+    assert max(sp.temps_max_secondes for sp in sous_problemes) == 60
+    assert all(sp.temps_max_secondes >= 1 for sp in sous_problemes)
+
+
+def test_composantes_regroupees_selon_nb_max(deux_poules_independantes):
+    sous_problemes = _sous_problemes(deux_poules_independantes, nb_max=1)
+
+    assert len(sous_problemes) == 1
+    assert sous_problemes[0].nb_composantes == 2
+    assert len(sous_problemes[0].matchs) == len(deux_poules_independantes[0])
+
+
+def test_probleme_connexe_non_decoupe(deux_poules_independantes):
+    matchs, creneaux, gymnases, _ = deux_poules_independantes
+
+    # Sans obligation de présence, les deux poules se disputent les mêmes créneaux
+    assert _sous_problemes((matchs, creneaux, gymnases, {})) == []
+
+
+def test_fusion_couvre_chaque_match_une_fois(deux_poules_independantes):
+    sous_problemes = _sous_problemes(deux_poules_independantes)
+    premier, second = sous_problemes
+    solution = Solution(
+        matchs_planifies=premier.matchs[:4],
+        matchs_non_planifies=premier.matchs[4:],
+        score=12.0,
+        metadata={'status': 'OPTIMAL'},
+    )
+
+    # Le second sous-problème échoue : ses matchs restent non planifiés
+    fusion = fusionner_solutions([solution, None], sous_problemes, 'cpsat')
+
+    tous = fusion.matchs_planifies + fusion.matchs_non_planifies
+    assert Counter(id(m) for m in tous) == Counter(id(m) for m in deux_poules_independantes[0])
+    assert [id(m) for m in fusion.matchs_planifies] == [id(m) for m in premier.matchs[:4]]
+    assert fusion.score == 12.0
+    assert fusion.metadata['status'] == 'MIXTE'
+    assert [d['status'] for d in fusion.metadata['decomposition']['sous_problemes']] == ['OPTIMAL', 'ECHEC']
+    assert fusion.metadata['decomposition']['nb_composantes'] == 2
@@ -0,0 +1,17 @@
+"""Analyse de faisabilité : borne de matchs planifiables cohérente avec le modèle CP-SAT."""
+
+from pycalendar.analysis.feasibility import analyser_faisabilite
+from pycalendar.core.models import Equipe, Match, Creneau
+
+
+def test_gymnase_inconnu_sans_limite_de_capacite():
+    equipes = [Equipe(f"LYON 1 ({k})", "PA", institution="LYON 1") for k in range(1, 7)]
+    matchs = [Match(equipes[k], equipes[k + 1], "PA") for k in range(0, 6, 2)]
+    # Un seul créneau, dans un gymnase absent du dictionnaire : CP-SAT n'en limite pas la capacité
+    creneaux = [Creneau(1, '18:00', 'Inconnu')]
+
+    rapport = analyser_faisabilite(matchs, creneaux, {})
+
+    assert rapport.borne_flot == 3
+    assert rapport.borne_superieure == 3
+    assert rapport.est_complet
@@ -0,0 +1,49 @@
+"""GreedySolver : essais multiples sur une petite instance synthétique."""
+
+import dataclasses
+
+import pytest
+
+from pycalendar.core.models import Creneau, Gymnase
+from pycalendar.solvers.greedy_solver import GreedySolver
+
+
+@pytest.mark.parametrize("nb_processus", [1, 2])
+def test_chaque_essai_repart_sans_creneau(config_volley, petite_poule, nb_processus):
+    matchs, creneaux, gymnases = petite_poule
+    config = dataclasses.replace(config_volley, semaine_min=1, nb_essais=4, greedy_graine=7,
+                                 greedy_nb_processus=nb_processus, entente_actif=False)
+
+    solution = GreedySolver(config).solve(matchs, creneaux, gymnases)
+
+    assert solution.est_complete()
+    assert len(solution.matchs_planifies) == len(matchs)
+    assert all(match.creneau is not None for match in matchs)
+
+
+def test_creneaux_du_meilleur_essai_restaures(config_volley, petite_poule):
+    matchs, creneaux, gymnases = petite_poule
+    # 4 créneaux pour 6 matchs : aucun essai n'est complet, tous les essais sont joués
+    config = dataclasses.replace(config_volley, semaine_min=3, nb_essais=5, greedy_graine=3,
+                                 greedy_nb_processus=1, entente_actif=False)
+
+    solution = GreedySolver(config).solve(matchs, creneaux, gymnases)
+
+    planifies = {id(match) for match in solution.matchs_planifies}
+    assert planifies.isdisjoint(id(match) for match in solution.matchs_non_planifies)
+    assert len(solution.matchs_planifies) + len(solution.matchs_non_planifies) == len(matchs)
+    assert all((match.creneau is not None) == (id(match) in planifies) for match in matchs)
+
+
+def test_obligations_de_presence_respectees(config_volley, petite_poule):
+    matchs, creneaux, gymnases = petite_poule
+    gymnases = dict(gymnases, G2=Gymnase('G2', capacite=1, horaires_disponibles=['18:00', '20:00']))
+    creneaux = creneaux + [Creneau(c.semaine, c.horaire, 'G2') for c in creneaux]
+    config = dataclasses.replace(config_volley, semaine_min=1, nb_essais=2, greedy_graine=5,
+                                 greedy_nb_processus=1, entente_actif=False)
+
+    # G1 est réservé à une autre institution : seuls les créneaux de G2 sont utilisables
+    solution = GreedySolver(config).solve(matchs, creneaux, gymnases, {'G1': 'INSA'})
+
+    assert solution.matchs_planifies
+    assert {match.creneau.gymnase for match in solution.matchs_planifies} == {'G2'}
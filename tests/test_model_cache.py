@@ -0,0 +1,105 @@
+"""ModelCache : invalidation de la clé et aller-retour disque du modèle."""
+
+import dataclasses
+
+import pytest
+from ortools.sat.python import cp_model
+
+from pycalendar.solvers.cpsat_solver import CPSATSolver
+from pycalendar.solvers.model_cache import ModelCache, modele_depuis_texte, modele_vers_texte
+
+
+@pytest.fixture
+def config(config_volley):
+    return dataclasses.replace(config_volley, semaine_min=1, temps_max_secondes=5, cpsat_nb_workers=1)
+
+
+def _cle(config, petite_poule, tmp_path):
+    matchs, creneaux, _ = petite_poule
+    cache = ModelCache.pour_config(config, tmp_path)
+    return cache.calculer_cle(matchs, creneaux, None, {})
+
+
+@pytest.mark.parametrize("champ, valeur", [
+    ('penalite_match_non_planif', 12345.0),
+    ('max_matchs_par_equipe_par_semaine', 3),
+    ('compaction_penalites_par_semaine', [1, 2, 3]),
+])
+def test_poids_du_modele_change_la_cle(config, petite_poule, tmp_path, champ, valeur):
+    modifiee = dataclasses.replace(config, **{champ: valeur})
+
+    assert ModelCache.empreinte_config(modifiee) != ModelCache.empreinte_config(config)
+    assert _cle(modifiee, petite_poule, tmp_path) != _cle(config, petite_poule, tmp_path)
+
+
+@pytest.mark.parametrize("champ, valeur", [
+    ('temps_max_secondes', 999),
+    ('nb_essais', 42),
+    ('cpsat_nb_workers', 16),
+    ('cpsat_arret_gap_relatif', 0.05),
+    ('cpsat_cache_taille_max_mo', 1.0),
+    ('lns_temps_voisinage', 9.0),
+    ('greedy_nb_processus', 3),
+    ('greedy_graine', 11),
+    ('greedy_ordre', 'contraint'),
+])
+def test_parametre_de_resolution_ne_change_pas_la_cle(config, petite_poule, tmp_path, champ, valeur):
+    modifiee = dataclasses.replace(config, **{champ: valeur})
+
+    assert ModelCache.empreinte_config(modifiee) == ModelCache.empreinte_config(config)
+    assert _cle(modifiee, petite_poule, tmp_path) == _cle(config, petite_poule, tmp_path)
+
+
+def test_structure_du_probleme_change_la_cle(config, petite_poule, tmp_path):
+    matchs, creneaux, _ = petite_poule
+    cache = ModelCache.pour_config(config, tmp_path)
+    cle = cache.calculer_cle(matchs, creneaux, None, {})
+
+    assert cache.calculer_cle(matchs[:-1], creneaux, None, {}) != cle
+    assert cache.calculer_cle(matchs, creneaux[:-1], None, {}) != cle
+    assert cache.calculer_cle(matchs, creneaux, None, {'G1': 'LYON 1'}) != cle
+
+
+def test_aller_retour_disque_conserve_les_variables(config, petite_poule, tmp_path):
+    matchs, creneaux, gymnases = petite_poule
+    solver = CPSATSolver(config)
+    model, assignment_vars, match_assigned, creneaux_par_match, statistiques = solver._construire_modele(
+        matchs, creneaux, gymnases, {}, None
+    )
+    cache = ModelCache.pour_config(config, tmp_path)
+    cle = cache.calculer_cle(matchs, creneaux, None, {})
+
+    cache.sauvegarder(cle, model, assignment_vars, match_assigned, creneaux_par_match, statistiques)
+    charge, vars_chargees, assigned_charges, creneaux_charges, _ = cache.charger(cle)
+
+    assert creneaux_charges == creneaux_par_match
+    assert vars_chargees.keys() == assignment_vars.keys()
+    for couple, var in assignment_vars.items():
+        assert vars_chargees[couple].Index() == var.Index()
+        assert vars_chargees[couple].Name() == var.Name()
+    assert [var.Index() for var in assigned_charges] == [var.Index() for var in match_assigned]
+
+    objectifs = []
+    for modele in (model, charge):
+        resolution = cp_model.CpSolver()
+        resolution.parameters.num_workers = 1
+        assert resolution.Solve(modele) == cp_model.OPTIMAL
+        objectifs.append(resolution.ObjectiveValue())
+    assert objectifs[0] == objectifs[1]
+
+
+def test_cle_absente(config, tmp_path):
+    assert ModelCache.pour_config(config, tmp_path).charger("inconnue") is None
+
+
+def test_serialisation_texte():
+    model = cp_model.CpModel()
+    x = model.NewBoolVar('x')
+    y = model.NewIntVar(0, 5, 'y')
+    model.Add(x + y <= 3)
+    model.Maximize(y)
+    model.AddHint(x, 1)
+
+    copie = modele_depuis_texte(modele_vers_texte(model))
+
+    assert modele_vers_texte(copie) == modele_vers_texte(model)
@@ -0,0 +1,138 @@
+"""PenaltyTables : mêmes pénalités que les calculs par match d'origine des solveurs."""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from pycalendar.constraints.schedule_constraints import PreferredTimeConstraint
+from pycalendar.core.models import Creneau, Equipe, Match
+from pycalendar.core.penalty_tables import PenaltyTables
+
+
+# Horaires des créneaux de l'exemple et horaires hors grille (tolérance, format "14H30")
+HORAIRES = ['14:00', '16:00', '18:00', '20:00', '15:30', '16:45', '19:10', '14H30']
+
+
+def penalite_gymnase_reference(config, match, gymnase):
+    """Préférences de gymnase, calcul du glouton d'origine (_calculer_penalite_gymnase)."""
+    bonus = config.bonus_preferences_gymnases
+    if not bonus:
+        return 0.0
+    penalite = 2 * max(bonus)
+    for equipe in (match.equipe1, match.equipe2):
+        for rang, lieu in enumerate(equipe.lieux_preferes or []):
+            if lieu == gymnase and rang < len(bonus):
+                penalite -= bonus[rang]
+                break
+    return penalite
+
+
+def penalite_niveau_reference(config, niveaux_gymnases, niveau_match, gymnase):
+    """Niveau de gymnase, calcul du glouton d'origine (_calculer_penalite_niveau_gymnase)."""
+    haut = config.penalite_niveau_gymnases_haut
+    bas = config.penalite_niveau_gymnases_bas
+    if not haut or not bas or not niveaux_gymnases or niveau_match is None:
+        return 0.0
+    niveau_gymnase = niveaux_gymnases.get(gymnase)
+    if niveau_gymnase == 'Haut niveau' and niveau_match < len(haut):
+        return haut[niveau_match]
+    if niveau_gymnase == 'Bas niveau' and niveau_match < len(bas):
+        return bas[niveau_match]
+    return 0.0
+
+
+def penalite_compaction_reference(config, semaine):
+    """Compaction temporelle, calcul du glouton d'origine."""
+    penalites = config.compaction_penalites_par_semaine
+    return penalites[semaine - 1] if semaine <= len(penalites) else penalites[-1]
+
+
+@pytest.fixture(params=[0.0, 30.0, 90.0], ids=lambda t: f"tolerance{t:g}")
+def config_tolerance(request, config_volley):
+    """Configuration volley avec plusieurs tolérances horaires."""
+    return dataclasses.replace(config_volley, penalite_horaire_tolerance=request.param)
+
+
+def test_penalite_horaire_identique_a_preferred_time(config_tolerance, donnees_volley):
+    config = config_tolerance
+    tables = PenaltyTables(config, donnees_volley.niveaux_gymnases)
+    contrainte = PreferredTimeConstraint(
+        weight=config.penalite_apres_horaire_min,
+        penalty_before_one=config.penalite_avant_horaire_min,
+        penalty_before_both=config.penalite_avant_horaire_min_deux,
+        divisor=config.penalite_horaire_diviseur,
+        tolerance=config.penalite_horaire_tolerance,
+    )
+
+    for match in donnees_volley.matchs:
+        for horaire in HORAIRES:
+            _, attendu = contrainte.validate(match, Creneau(1, horaire, 'G'), {})
+            assert tables.penalite_horaire(match, horaire) == pytest.approx(attendu), (match, horaire)
+
+
+def test_table_horaires_identique_aux_valeurs_scalaires(config_tolerance, donnees_volley):
+    tables = PenaltyTables(config_tolerance, donnees_volley.niveaux_gymnases)
+    matchs = donnees_volley.matchs
+
+    table = tables.table_horaires(matchs, HORAIRES)
+
+    attendu = np.array([[tables.penalite_horaire(m, h) for h in HORAIRES] for m in matchs])
+    np.testing.assert_allclose(table, attendu)
+
+
+def test_parse_horaire_formats(config_volley):
+    tables = PenaltyTables(config_volley)
+
+    assert tables.parse_horaire("14:00") == 14 * 60
+    assert tables.parse_horaire("14H30") == 14 * 60 + 30
+    assert tables.parse_horaire("19H") == 19 * 60
+    assert tables.parse_horaire("midi") == 14 * 60
+
+
+def test_penalites_gymnases_identiques_au_glouton_d_origine(config_volley, donnees_volley):
+    niveaux = donnees_volley.niveaux_gymnases
+    tables = PenaltyTables(config_volley, niveaux)
+    matchs = donnees_volley.matchs
+    gymnases = sorted(donnees_volley.gymnases)
+
+    preferences = tables.table_preferences_gymnases(matchs, gymnases)
+    niveaux_table = tables.table_niveaux_gymnases(matchs, gymnases)
+
+    for i, match in enumerate(matchs):
+        niveau_match = tables.niveau_match(match)
+        for k, gymnase in enumerate(gymnases):
+            attendu = penalite_gymnase_reference(config_volley, match, gymnase)
+            assert tables.penalite_gymnase(match, gymnase) == pytest.approx(attendu)
+            assert preferences[i, k] == pytest.approx(attendu)
+
+            attendu = penalite_niveau_reference(config_volley, niveaux, niveau_match, gymnase)
+            assert tables.penalite_niveau_gymnase(match, gymnase) == pytest.approx(attendu)
+            assert niveaux_table[i, k] == pytest.approx(attendu)
+
+
+def test_niveau_match_selon_la_poule(config_volley):
+    tables = PenaltyTables(config_volley)
+
+    def niveau(poule):
+        return tables.niveau_match(Match(Equipe("A (1)", poule), Equipe("B (1)", poule), poule))
+
+    assert niveau("VBFA1PA") == 0
+    assert niveau("VBMA3") == 2
+    assert niveau("HBF") is None
+
+
+def test_compaction_identique_au_glouton_d_origine(config_volley):
+    tables = PenaltyTables(config_volley)
+    semaines = list(range(1, len(config_volley.compaction_penalites_par_semaine) + 4))
+
+    attendu = [penalite_compaction_reference(config_volley, s) for s in semaines]
+
+    assert [tables.penalite_compaction(s) for s in semaines] == attendu
+    np.testing.assert_allclose(tables.table_compaction(semaines), attendu)
+
+
+def test_compaction_desactivee(config_volley):
+    tables = PenaltyTables(dataclasses.replace(config_volley, compaction_temporelle_actif=False))
+
+    assert tables.penalite_compaction(3) == 0.0
@@ -0,0 +1,32 @@
+"""Borne de relaxation d'affectation : capacité des créneaux et repli sans SciPy."""
+
+import numpy as np
+import pytest
+
+from pycalendar.solvers import relaxation
+from pycalendar.solvers.relaxation import borne_affectation
+
+
+# Deux matchs qui préfèrent le créneau 0 (capacité 1), le créneau 1 vaut moins
+COUPLES = [(0, 0), (0, 1), (1, 0), (1, 1)]
+VALEURS = np.array([10, 4, 8, 5])
+
+
+def test_borne_avec_capacite():
+    pytest.importorskip("scipy")
+
+    resultat = borne_affectation(2, COUPLES, VALEURS, {0: 1, 1: 1})
+
+    assert resultat['methode'] == 'linprog'
+    assert resultat['borne'] == pytest.approx(15.0)
+    assert 'raison' not in resultat
+
+
+def test_repli_sans_scipy_signale(monkeypatch):
+    monkeypatch.setattr(relaxation, 'SCIPY_AVAILABLE', False)
+
+    resultat = borne_affectation(2, COUPLES, VALEURS, {0: 1, 1: 1})
+
+    assert resultat['methode'] == 'sans_capacite'
+    assert resultat['borne'] == pytest.approx(18.0)
+    assert 'SciPy' in resultat['raison']